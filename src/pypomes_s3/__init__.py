@@ -1,14 +1,64 @@
+from .s3_common import (
+    S3_NOT_MODIFIED,
+)
+from .s3_codecs import (
+    s3_codec_register,
+)
+from .s3_cache import (
+    s3_stat_cache_setup, s3_stat_cache_stats, s3_stat_cache_clear,
+    s3_object_cache_setup, s3_object_cache_stats, s3_object_cache_clear,
+)
+from .s3_records import (
+    S3ObjectInfo, S3ObjectStat, s3_objects_columns,
+)
+from .s3_disk_cache import (
+    s3_disk_cache_setup, s3_disk_cache_stats, s3_disk_cache_clear,
+)
 from .s3_pomes import (
+    s3_setup, s3_get_engines, s3_get_params, s3_assert_access,
     s3_access, s3_startup, s3_file_store, s3_object_store, s3_object_stat,
     s3_object_delete, s3_objects_list, s3_object_retrieve, s3_object_exists,
-    s3_object_tags_retrieve, s3_file_retrieve,
+    s3_object_tags_retrieve, s3_file_retrieve, s3_object_store_many, s3_object_retrieve_many,
+    s3_bloom_build, s3_bloom_drop, s3_objects_page, s3_objects_list_parallel,
+    s3_prefix_exists, s3_prefix_count, s3_prefix_size, s3_objects_exist, s3_objects_stat,
+)
+from .s3_pomes_async import (
+    s3_assert_access_async, s3_access_async, s3_startup_async,
+    s3_file_store_async, s3_object_store_async, s3_object_stat_async,
+    s3_object_delete_async, s3_objects_list_async, s3_object_retrieve_async,
+    s3_object_exists_async, s3_object_tags_retrieve_async, s3_file_retrieve_async,
+    s3_bloom_build_async, s3_objects_page_async, s3_objects_list_parallel_async,
+    s3_prefix_exists_async, s3_prefix_count_async, s3_prefix_size_async, s3_objects_exist_async,
+    s3_objects_stat_async, s3_object_store_many_async, s3_object_retrieve_many_async
 )
 
 __all__ = [
+    # s3_common
+    "S3_NOT_MODIFIED",
+    # s3_codecs
+    "s3_codec_register",
+    # s3_cache
+    "s3_stat_cache_setup", "s3_stat_cache_stats", "s3_stat_cache_clear",
+    "s3_object_cache_setup", "s3_object_cache_stats", "s3_object_cache_clear",
+    # s3_records
+    "S3ObjectInfo", "S3ObjectStat", "s3_objects_columns",
+    # s3_disk_cache
+    "s3_disk_cache_setup", "s3_disk_cache_stats", "s3_disk_cache_clear",
     # s3_pomes
+    "s3_setup", "s3_get_engines", "s3_get_params", "s3_assert_access",
     "s3_access", "s3_startup", "s3_file_store", "s3_object_store", "s3_object_stat",
     "s3_object_delete", "s3_objects_list", "s3_object_retrieve", "s3_object_exists",
-    "s3_object_tags_retrieve", "s3_file_retrieve",
+    "s3_object_tags_retrieve", "s3_file_retrieve", "s3_object_store_many", "s3_object_retrieve_many",
+    "s3_bloom_build", "s3_bloom_drop", "s3_objects_page", "s3_objects_list_parallel",
+    "s3_prefix_exists", "s3_prefix_count", "s3_prefix_size", "s3_objects_exist", "s3_objects_stat",
+    # s3_pomes_async
+    "s3_assert_access_async", "s3_access_async", "s3_startup_async",
+    "s3_file_store_async", "s3_object_store_async", "s3_object_stat_async",
+    "s3_object_delete_async", "s3_objects_list_async", "s3_object_retrieve_async",
+    "s3_object_exists_async", "s3_object_tags_retrieve_async", "s3_file_retrieve_async",
+    "s3_bloom_build_async", "s3_objects_page_async", "s3_objects_list_parallel_async",
+    "s3_prefix_exists_async", "s3_prefix_count_async", "s3_prefix_size_async", "s3_objects_exist_async",
+    "s3_objects_stat_async", "s3_object_store_many_async", "s3_object_retrieve_many_async",
 ]
 
 from importlib.metadata import version
@@ -1,16 +1,26 @@
-import pickle
-import uuid
+import os
+from boto3.s3.transfer import TransferConfig
 from boto3.session import Session
 from botocore.client import BaseClient
-from collections.abc import Iterator
-from logging import Logger
+from botocore.config import Config
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from functools import partial
+from itertools import chain
+from logging import ERROR, Logger
 from pathlib import Path
 from typing import Any
 from unidecode import unidecode
+from urllib.parse import urlencode
 
 from .s3_common import (
-    _s3_get_param, _s3_get_params, _s3_except_msg, _s3_log
+    _S3_DELETE_BATCH, _S3_MAX_CONCURRENCY, _S3_PART_SIZE,
+    _s3_get_param, _s3_get_params, _s3_get_client, _s3_register_client, _s3_upload_policy, _s3_spool,
+    S3_NOT_MODIFIED, _s3_read_body, _s3_batches, _s3_pipeline, _s3_ranged_download, _s3_stream_download,
+    _s3_not_modified, _s3_utc, _s3_except_msg, _s3_log
 )
+from .s3_codecs import _S3_CODEC_META, _s3_codec, _s3_encode, _s3_decode
+from .s3_compression import _S3_COMPRESSION_META, _S3_COMPRESSION_CHUNK, _s3_compressed, _s3_decompress
 
 
 def access(errors: list[str],
@@ -18,26 +28,36 @@ def access(errors: list[str],
     """
     Obtain and return a *AWS* client object.
 
+    The client is created once for the current access parameters, and is shared thereafter.
+
     :param errors: incidental error messages
     :param logger: optional logger
     :return: the S3 client object
     """
-    # initialize the return variable
-    result: BaseClient | None = None
+    # obtain the registered AWS client
+    result: BaseClient | None = _s3_get_client(engine="aws")
 
-    # retrieve the access parameters
-    access_key, secret_key, region_name = _s3_get_params("aws")
+    # was it obtained ?
+    if not result:
+        # no, retrieve the access parameters
+        access_key, secret_key, region_name = _s3_get_params("aws")
 
-    try:
-        result = Session().client(service_name="s3",
-                                  region_name=region_name,
-                                  aws_access_key_id=access_key,
-                                  aws_secret_access_key=secret_key)
-    except Exception as e:
-        _s3_except_msg(errors=errors,
-                       exception=e,
-                       engine="aws",
-                       logger=logger)
+        # create and register the AWS client
+        try:
+            client: BaseClient = Session().client(service_name="s3",
+                                                  region_name=region_name,
+                                                  aws_access_key_id=access_key,
+                                                  aws_secret_access_key=secret_key,
+                                                  config=_client_config())
+            result = _s3_register_client(engine="aws",
+                                         client=client)
+            _s3_log(logger=logger,
+                    stmt="AWS client created")
+        except Exception as e:
+            _s3_except_msg(errors=errors,
+                           exception=e,
+                           engine="aws",
+                           logger=logger)
 
     return result
 
@@ -67,8 +87,19 @@ def startup(errors: list[str],
     if client:
         # yes, proceed
         try:
-            if not client.bucket_exists(bucket_name=bucket):
-                client.make_bucket(bucket_name=bucket)
+            try:
+                client.head_bucket(Bucket=bucket)
+            except Exception as e:
+                if not _is_missing(exception=e):
+                    raise
+                # the bucket does not exist, create it
+                region_name: str = _s3_get_param("aws", "region-name")
+                if region_name == "us-east-1":
+                    # AWS rejects the location constraint for its default region
+                    client.create_bucket(Bucket=bucket)
+                else:
+                    client.create_bucket(Bucket=bucket,
+                                         CreateBucketConfiguration={"LocationConstraint": region_name})
             result = True
             _s3_log(logger=logger,
                     stmt=f"Started AWS, bucket={bucket}")
@@ -87,11 +118,19 @@ def file_store(errors: list[str],
                filepath: Path | str,
                mimetype: str,
                tags: dict = None,
+               part_size: int = None,
+               parallel_parts: int = None,
                client: BaseClient = None,
                logger: Logger = None) -> bool:
     """
     Store a file at the *AWS* store.
 
+    The file is uploaded by *boto3*'s managed transfer layer. Unless *part_size* and *parallel_parts*
+    are provided, they are determined from the size of the file: small files are uploaded in a single part,
+    and large files in multiple parts, transferred concurrently. If compression is configured,
+    and the file is not smaller than the compression cutoff, the file is compressed into a temporary spool,
+    and uploaded from there.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to store the file at
@@ -99,7 +138,9 @@ def file_store(errors: list[str],
     :param filepath: the path specifying where the file is
     :param mimetype: the file mimetype
     :param tags: optional metadata describing the file
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param part_size: optional size in bytes of each part (determined from the file size, if omitted)
+    :param parallel_parts: optional number of parts uploaded concurrently (determined from the file size, if omitted)
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: True if the file was successfully stored, False otherwise
     """
@@ -113,23 +154,36 @@ def file_store(errors: list[str],
     if curr_client:
         # yes, proceed
         remotepath: Path = Path(basepath) / identifier
-        # have tags been defined ?
-        if tags is None or len(tags) == 0:
-            # no
-            doc_tags = None
-        else:
-            # sim, store them
-            doc_tags = {}
-            for key, value in tags.items():
-                # normalize text, by removing all diacritics
-                doc_tags[key] = unidecode(value)
-        # store the file
+        # store the file, compressing it if so configured
         try:
-            curr_client.fput_object(bucket_name=bucket,
-                                    object_name=f"{remotepath}",
-                                    file_path=filepath,
-                                    content_type=mimetype,
-                                    tags=doc_tags)
+            with Path(filepath).open(mode="rb") as f, \
+                 _s3_compressed(engine="aws",
+                                source=f,
+                                size=os.fstat(f.fileno()).st_size) as (data, length, compression):
+                part_size, parallel_parts = _s3_upload_policy(engine="aws",
+                                                              size=length,
+                                                              part_size=part_size,
+                                                              parallel_parts=parallel_parts)
+                metadata: dict[str, str] | None = {_S3_COMPRESSION_META: compression} if compression else None
+                extra_args: dict = _extra_args_build(mimetype=mimetype,
+                                                     tags=tags,
+                                                     metadata=metadata)
+                if compression:
+                    # upload the compressed file from its spool
+                    curr_client.upload_fileobj(Fileobj=data,
+                                               Bucket=bucket,
+                                               Key=f"{remotepath}",
+                                               ExtraArgs=extra_args,
+                                               Config=_transfer_config(part_size=part_size,
+                                                                       parallel_parts=parallel_parts))
+                else:
+                    # upload the file by name, so that its parts are read concurrently
+                    curr_client.upload_file(Filename=f"{filepath}",
+                                            Bucket=bucket,
+                                            Key=f"{remotepath}",
+                                            ExtraArgs=extra_args,
+                                            Config=_transfer_config(part_size=part_size,
+                                                                    parallel_parts=parallel_parts))
             result = True
             _s3_log(logger=logger,
                     stmt=(f"Stored {remotepath}, bucket {bucket}, "
@@ -147,19 +201,31 @@ def file_retrieve(errors: list[str],
                   basepath: str,
                   identifier: str,
                   filepath: Path | str,
+                  parallel: bool = False,
+                  etag: str = None,
+                  modified_since: datetime = None,
                   client: BaseClient = None,
                   logger: Logger = None) -> Any:
     """
     Retrieve a file from the *AWS* store.
 
+    The file is downloaded by *boto3*'s managed transfer layer, which fetches byte ranges
+    concurrently for files larger than the configured multipart threshold. If *parallel* is set,
+    and the file is larger than the configured part size, its byte ranges are instead fetched
+    concurrently by this module, and written directly at their offsets in *filepath*.
+    If the file was stored compressed, it is instead fetched in a single stream, and decompressed as it arrives.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to retrieve the file from
     :param identifier: the file identifier, tipically a file name
     :param filepath: the path to save the retrieved file at
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param parallel: whether to fetch byte ranges of the file concurrently (defaults to False)
+    :param etag: optional ETag of the copy at hand of the file, dispensing with its retrieval if still current
+    :param modified_since: optional moment the copy at hand of the file was obtained (if *etag* is not provided)
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
-    :return: information about the file retrieved
+    :return: information about the file retrieved, or 'S3_NOT_MODIFIED' if the copy at hand is still current
     """
     # initialize the return variable
     result: Any = None
@@ -172,13 +238,51 @@ def file_retrieve(errors: list[str],
         # yes, proceed
         remotepath: Path = Path(basepath) / identifier
         try:
-            result = curr_client.fget_object(bucket_name=bucket,
-                                             object_name=f"{remotepath}",
-                                             file_path=filepath)
+            stat: dict = curr_client.head_object(Bucket=bucket,
+                                                 Key=f"{remotepath}")
+            part_size: int = _s3_get_param("aws", "part-size") or _S3_PART_SIZE
+            compression: str | None = stat.get("Metadata", {}).get(_S3_COMPRESSION_META)
+            # is the copy at hand of the file still current ?
+            if _s3_not_modified(stat=stat,
+                                etag=etag,
+                                modified_since=modified_since):
+                # yes, dispense with its retrieval
+                result = S3_NOT_MODIFIED
+            # was the file stored compressed ?
+            elif compression:
+                # yes, fetch it in a single stream, decompressing it as it arrives
+                _s3_stream_download(filepath=filepath,
+                                    chunks=_s3_decompress(compression=compression,
+                                                          chunks=_range_fetch(start=0,
+                                                                              end=stat["ContentLength"] - 1,
+                                                                              client=curr_client,
+                                                                              bucket=bucket,
+                                                                              key=f"{remotepath}",
+                                                                              etag=stat["ETag"])))
+            # is the file to be fetched in ranges ?
+            elif parallel and stat["ContentLength"] > part_size:
+                # yes, fetch its ranges concurrently
+                _s3_ranged_download(filepath=filepath,
+                                    size=stat["ContentLength"],
+                                    fetch=partial(_range_fetch,
+                                                  client=curr_client,
+                                                  bucket=bucket,
+                                                  key=f"{remotepath}",
+                                                  etag=stat["ETag"]),
+                                    part_size=part_size,
+                                    max_workers=_s3_get_param("aws", "max-concurrency") or _S3_MAX_CONCURRENCY)
+            else:
+                # no, use the managed transfer
+                curr_client.download_file(Bucket=bucket,
+                                          Key=f"{remotepath}",
+                                          Filename=f"{filepath}",
+                                          Config=_transfer_config())
+            if result is None:
+                result = stat
             _s3_log(logger=logger,
                     stmt=f"Retrieved {remotepath}, bucket {bucket}")
         except Exception as e:
-            if not hasattr(e, "code") or e.code != "NoSuchKey":
+            if not _is_missing(exception=e):
                 _s3_except_msg(errors=errors,
                                exception=e,
                                engine="aws",
@@ -199,7 +303,7 @@ def object_exists(errors: list[str],
     :param bucket: the bucket to use
     :param basepath: the path specifying where to locate the object
     :param identifier: optional object identifier
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: True if the object was found, false otherwise
     """
@@ -218,9 +322,18 @@ def object_exists(errors: list[str],
                                           bucket=bucket,
                                           basepath=basepath,
                                           recursive=False,
+                                          page_size=1,
                                           client=curr_client,
                                           logger=logger)
-            result = next(objs, None) is None
+            # the folder exists if anything at all is listed in it
+            if objs is not None:
+                try:
+                    result = next(objs, None) is not None
+                except Exception as e:
+                    _s3_except_msg(errors=errors,
+                                   exception=e,
+                                   engine="aws",
+                                   logger=logger)
         # verify the status of the object
         elif object_stat(errors=errors,
                          bucket=bucket,
@@ -230,7 +343,7 @@ def object_exists(errors: list[str],
                          logger=logger):
             result = True
 
-        remotepath: Path = Path(basepath) / identifier
+        remotepath: Path = Path(basepath) / (identifier or "")
         existence: str = "exists" if result else "do not exist"
         _s3_log(logger=logger,
                 stmt=f"Object {remotepath}, bucket {bucket}, {existence}")
@@ -241,17 +354,19 @@ def object_exists(errors: list[str],
 def object_stat(errors: list[str],
                 bucket: str,
                 basepath: str,
-                identifier: str,
+                identifier: str = None,
                 client: BaseClient = None,
                 logger: Logger = None) -> dict:
     """
     Retrieve and return the information about an object in the *AWS* store.
 
+    If *identifier* is not provided, *basepath* is taken verbatim as the object's full name.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying where to locate the object
-    :param identifier: the object identifier
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param identifier: optional object identifier
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: metadata and information about the object
     """
@@ -264,14 +379,14 @@ def object_stat(errors: list[str],
     # was the AWS client obtained ?
     if curr_client:
         # yes, proceed
-        remotepath: Path = Path(basepath) / identifier
+        remotepath: Path | str = Path(basepath) / identifier if identifier else basepath
         try:
-            result = curr_client.stat_object(bucket_name=bucket,
-                                             object_name=f"{remotepath}")
+            result = curr_client.head_object(Bucket=bucket,
+                                             Key=f"{remotepath}")
             _s3_log(logger=logger,
                     stmt=f"Stat'ed {remotepath}, bucket {bucket}")
         except Exception as e:
-            if not hasattr(e, "code") or e.code != "NoSuchKey":
+            if not _is_missing(exception=e):
                 _s3_except_msg(errors=errors,
                                exception=e,
                                engine="aws",
@@ -285,18 +400,24 @@ def object_store(errors: list[str],
                  identifier: str,
                  obj: Any,
                  tags: dict = None,
+                 codec: str = None,
                  client: BaseClient = None,
                  logger: Logger = None) -> bool:
     """
     Store an object at the *AWS* store.
 
+    The object is serialized into an in-memory buffer, which is spooled to a temporary file
+    only if its size exceeds the configured spool threshold. If compression is configured,
+    and the serialized object is not smaller than the compression cutoff, it is compressed before upload.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to store the object at
     :param identifier: the object identifier
     :param obj: object to be stored
     :param tags: optional metadata describing the object
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param codec: the codec to serialize the object with (defaults to the one configured, or to 'pickle')
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: True if the object was successfully stored, False otherwise
     """
@@ -308,38 +429,39 @@ def object_store(errors: list[str],
                                                logger=logger)
     # proceed, if the AWS client was obtained
     if curr_client:
-        # serialize the object into a file
-        temp_folder: Path = _s3_get_param("minio", "temp-folder")
-        filepath: Path = temp_folder / f"{uuid.uuid4()}.pickle"
-        with filepath.open("wb") as f:
-            pickle.dump(obj, f)
-
-        # store the file
-        op_errors: list[str] = []
-        file_store(errors=op_errors,
-                   bucket=bucket,
-                   basepath=basepath,
-                   identifier=identifier,
-                   filepath=filepath,
-                   mimetype="application/octet-stream",
-                   tags=tags,
-                   client=curr_client,
-                   logger=logger)
-
-        # errors ?
-        if op_errors:
-            # yes, report them
-            errors.extend(op_errors)
-            storage: str = "Unable to store"
-        else:
-            # no, remove the file from the file system
-            result = True
-            filepath.unlink()
-            storage: str = "Stored "
-
         remotepath: Path = Path(basepath) / identifier
-        _s3_log(logger=logger,
-                stmt=f"{storage} {remotepath}, bucket {bucket}")
+        try:
+            with _s3_spool(engine="aws") as f:
+                # serialize the object
+                curr_codec: str = _s3_codec(engine="aws",
+                                            codec=codec)
+                _s3_encode(codec=curr_codec,
+                           obj=obj,
+                           stream=f)
+                length: int = f.tell()
+                f.seek(0)
+                # store the serialized object, compressing it if so configured
+                with _s3_compressed(engine="aws",
+                                    source=f,
+                                    size=length) as (data, length, compression):
+                    metadata: dict[str, str] = {_S3_CODEC_META: curr_codec}
+                    if compression:
+                        metadata[_S3_COMPRESSION_META] = compression
+                    curr_client.upload_fileobj(Fileobj=data,
+                                               Bucket=bucket,
+                                               Key=f"{remotepath}",
+                                               ExtraArgs=_extra_args_build(mimetype="application/octet-stream",
+                                                                           tags=tags,
+                                                                           metadata=metadata),
+                                               Config=_transfer_config())
+            result = True
+            _s3_log(logger=logger,
+                    stmt=f"Stored {remotepath}, bucket {bucket}, tags {tags}")
+        except Exception as e:
+            _s3_except_msg(errors=errors,
+                           exception=e,
+                           engine="aws",
+                           logger=logger)
 
     return result
 
@@ -348,18 +470,31 @@ def object_retrieve(errors: list[str],
                     bucket: str,
                     basepath: str,
                     identifier: str,
+                    buffer: bytearray = None,
+                    etag: str = None,
+                    modified_since: datetime = None,
+                    info: dict[str, Any] = None,
                     client: BaseClient = None,
                     logger: Logger = None) -> Any:
     """
     Retrieve an object from the *AWS* store.
 
+    The serialized object is read from the response stream into memory, and unmarshalled from there.
+    If *buffer* is provided and is large enough to hold the serialized object, it is used for reading,
+    thus avoiding the allocation of a new buffer. If the object was stored compressed, it is decompressed
+    as it is read from the response stream, and *buffer* is not used.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to retrieve the object from
     :param identifier: the object identifier
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param buffer: optional preallocated buffer to read the serialized object into
+    :param etag: optional ETag of the copy at hand of the object, dispensing with its retrieval if still current
+    :param modified_since: optional moment the copy at hand of the object was obtained
+    :param info: optional dictionary to receive the *etag* and the serialized *size* of the object retrieved
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
-    :return: the object retrieved
+    :return: the object retrieved, or 'S3_NOT_MODIFIED' if the copy at hand is still current
     """
     # initialize the return variable
     result: Any = None
@@ -369,28 +504,47 @@ def object_retrieve(errors: list[str],
                                                logger=logger)
     # proceed, if the AWS client was obtained
     if curr_client:
-        # retrieve the file containg the serialized object
-        temp_folder: Path = _s3_get_param("minio", "temp-folder")
-        filepath: Path = temp_folder / f"{uuid.uuid4()}.pickle"
-        stat: Any = file_retrieve(errors=errors,
-                                  bucket=bucket,
-                                  basepath=basepath,
-                                  identifier=identifier,
-                                  filepath=filepath,
-                                  client=curr_client,
-                                  logger=logger)
-
-        # was the file retrieved ?
-        if stat:
-            # yes, umarshall the corresponding object
-            with filepath.open("rb") as f:
-                result = pickle.load(f)
-            filepath.unlink()
-
-        retrieval: str = "Retrieved" if result else "Unable to retrieve"
         remotepath: Path = Path(basepath) / identifier
-        _s3_log(logger=logger,
-                stmt=f"{retrieval} {remotepath}, bucket {bucket}")
+        try:
+            # read the serialized object from the response stream
+            params: dict = {
+                "Bucket": bucket,
+                "Key": f"{remotepath}"
+            }
+            if etag:
+                params["IfNoneMatch"] = f'"{etag}"'
+            if modified_since:
+                params["IfModifiedSince"] = _s3_utc(moment=modified_since)
+            response: dict = curr_client.get_object(**params)
+            compression: str | None = response.get("Metadata", {}).get(_S3_COMPRESSION_META)
+            with response["Body"] as body:
+                if compression:
+                    chunks: Iterable[bytes] = _s3_decompress(compression=compression,
+                                                             chunks=body.iter_chunks(chunk_size=_S3_COMPRESSION_CHUNK))
+                    data: memoryview = memoryview(b"".join(chunks))
+                else:
+                    data: memoryview = _s3_read_body(stream=body,
+                                                     length=response["ContentLength"],
+                                                     buffer=buffer)
+            if isinstance(info, dict):
+                info["etag"] = response["ETag"].strip('"')
+                info["size"] = len(data)
+            # unmarshall the object, with the codec it was serialized with
+            result = _s3_decode(errors=errors,
+                                codec=response.get("Metadata", {}).get(_S3_CODEC_META),
+                                data=data)
+            _s3_log(logger=logger,
+                    stmt=f"Retrieved {remotepath}, bucket {bucket}")
+        except Exception as e:
+            # has the object not been modified ?
+            if _is_not_modified(exception=e):
+                # yes, the copy at hand is still current
+                result = S3_NOT_MODIFIED
+            elif not _is_missing(exception=e):
+                _s3_except_msg(errors=errors,
+                               exception=e,
+                               engine="aws",
+                               logger=logger)
 
     return result
 
@@ -399,18 +553,22 @@ def object_delete(errors: list[str],
                   bucket: str,
                   basepath: str,
                   identifier: str = None,
+                  failures: dict[str, str] = None,
                   client: BaseClient = None,
                   logger: Logger = None) -> bool:
     """
     Remove an object from the *AWS* store.
 
+    If *identifier* is not provided, then the folder *basepath* is deleted.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to retrieve the object from
     :param identifier: optional object identifier
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param failures: optional *dict* to receive the names of the objects not removed, and the reasons
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
-    :return: True if the object was successfully deleted, False otherwise
+    :return: True if the object or folder was deleted or did not exist, False if an error ocurred
     """
     # initialize the return variable
     result: bool = False
@@ -423,22 +581,23 @@ def object_delete(errors: list[str],
         # was the identifier provided ?
         if identifier is None:
             # no, remove the folder
-            _folder_delete(errors=errors,
-                           bucket=bucket,
-                           basepath=basepath,
-                           client=curr_client,
-                           logger=logger)
+            result = _folder_delete(errors=errors,
+                                    bucket=bucket,
+                                    basepath=basepath,
+                                    failures=failures,
+                                    client=curr_client,
+                                    logger=logger)
         else:
             # yes, remove the object
             remotepath: Path = Path(basepath) / identifier
             try:
-                curr_client.remove_object(bucket_name=bucket,
-                                          object_name=f"{remotepath}")
+                curr_client.delete_object(Bucket=bucket,
+                                          Key=f"{remotepath}")
                 result = True
                 _s3_log(logger=logger,
                         stmt=f"Deleted {remotepath}, bucket {bucket}")
             except Exception as e:
-                if not hasattr(e, "code") or e.code != "NoSuchKey":
+                if not _is_missing(exception=e):
                     _s3_except_msg(errors=errors,
                                    exception=e,
                                    engine="aws",
@@ -459,7 +618,7 @@ def object_tags_retrieve(errors: list[str],
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to retrieve the object from
     :param identifier: the object identifier
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: the metadata about the object
     """
@@ -474,16 +633,17 @@ def object_tags_retrieve(errors: list[str],
         # yes, proceed
         remotepath: Path = Path(basepath) / identifier
         try:
-            tags: dict = curr_client.get_object_tags(bucket_name=bucket,
-                                                     object_name=f"{remotepath}")
-            if tags and len(tags) > 0:
+            reply: dict = curr_client.get_object_tagging(Bucket=bucket,
+                                                         Key=f"{remotepath}")
+            tags: list[dict] = reply.get("TagSet")
+            if tags:
                 result = {}
-                for key, value in tags.items():
-                    result[key] = value
+                for tag in tags:
+                    result[tag["Key"]] = tag["Value"]
             _s3_log(logger=logger,
                     stmt=f"Retrieved {remotepath}, bucket {bucket}, tags {result}")
         except Exception as e:
-            if not hasattr(e, "code") or e.code != "NoSuchKey":
+            if not _is_missing(exception=e):
                 _s3_except_msg(errors=errors,
                                exception=e,
                                engine="aws",
@@ -496,16 +656,27 @@ def objects_list(errors: list[str],
                  bucket: str,
                  basepath: str,
                  recursive: bool = False,
+                 start_after: str = None,
+                 page_size: int = None,
                  client: BaseClient = None,
                  logger: Logger = None) -> Iterator:
     """
     Retrieve and return an iterator into the list of objects at *basepath*, in the *AWS* store.
 
+    The iterator yields the entries in *Contents* of the *list_objects_v2* replies, as well as
+    the entries in *CommonPrefixes*, if *recursive* is not set, in lexicographical order.
+
+    The first page of entries is requested at once, and failures in obtaining it are reported in *errors*.
+    The subsequent pages are requested as the iteration proceeds, and failures in obtaining them are raised
+    to the consumer of the iterator.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to iterate from
     :param recursive: whether the location is iterated recursively
-    :param client: optional AWS client (obtains a new one, if not provided)
+    :param start_after: optional name of the entry to start listing after
+    :param page_size: optional number of entries to request per page (up to 1000, the default)
+    :param client: optional AWS client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: the iterator into the list of objects, 'None' if the folder does not exist
     """
@@ -519,9 +690,12 @@ def objects_list(errors: list[str],
     if curr_client:
         # yes, proceed
         try:
-            result = curr_client.list_objects(bucket_name=bucket,
-                                              prefix=basepath,
-                                              recursive=recursive)
+            result = _objects_iterate(client=curr_client,
+                                      bucket=bucket,
+                                      basepath=basepath,
+                                      recursive=recursive,
+                                      start_after=start_after,
+                                      page_size=page_size)
             _s3_log(logger=logger,
                     stmt=f"Listed {basepath}, bucket {bucket}")
         except Exception as e:
@@ -533,40 +707,297 @@ def objects_list(errors: list[str],
     return result
 
 
+def _objects_iterate(client: BaseClient,
+                     bucket: str,
+                     basepath: str,
+                     recursive: bool,
+                     start_after: str = None,
+                     page_size: int = None) -> Iterator[dict]:
+    """
+    Iterate on the pages of the *list_objects_v2* operation, yielding their entries.
+
+    The first page is requested at once, so that failures in accessing the store are raised to the caller,
+    whereas the subsequent pages are requested as the iteration proceeds.
+
+    :param client: the AWS client object
+    :param bucket: the bucket to use
+    :param basepath: the path specifying the location to iterate from
+    :param recursive: whether the location is iterated recursively
+    :param start_after: optional name of the entry to start listing after
+    :param page_size: optional number of entries to request per page
+    :return: the iterator into the list of objects
+    """
+    params: dict = {
+        "Bucket": bucket,
+        "Prefix": basepath
+    }
+    if not recursive:
+        params["Delimiter"] = "/"
+    if start_after:
+        params["StartAfter"] = start_after
+    if page_size:
+        params["PaginationConfig"] = {"PageSize": min(page_size, 1000)}
+    pages: Iterator[dict] = iter(client.get_paginator("list_objects_v2").paginate(**params))
+    first: dict | None = next(pages, None)
+
+    return _pages_entries(pages=pages if first is None else chain([first], pages),
+                          recursive=recursive)
+
+
+def _pages_entries(pages: Iterable[dict],
+                   recursive: bool) -> Iterator[dict]:
+    """
+    Yield the entries in the pages of the *list_objects_v2* operation.
+
+    If *recursive* is not set, the objects and the folders in each page are yielded in lexicographical order.
+
+    :param pages: the pages of the operation
+    :param recursive: whether the location is iterated recursively
+    :return: the iterator into the entries
+    """
+    for page in pages:
+        entries: list[dict] = page.get("Contents", []) + page.get("CommonPrefixes", [])
+        if not recursive:
+            entries.sort(key=lambda entry: entry.get("Key") or entry.get("Prefix"))
+        yield from entries
+
+
+def _range_fetch(start: int,
+                 end: int,
+                 client: BaseClient,
+                 bucket: str,
+                 key: str,
+                 etag: str) -> Iterator[bytes]:
+    """
+    Fetch the byte range from *start* to *end* of an object in the *AWS* store, yielding its chunks.
+
+    The range is fetched only if the object still matches *etag*.
+
+    :param start: position of the first byte in the range
+    :param end: position of the last byte in the range
+    :param client: the AWS client object
+    :param bucket: the bucket to use
+    :param key: the key of the object
+    :param etag: the expected ETag of the object
+    :return: an iterator into the chunks in the range
+    """
+    response: dict = client.get_object(Bucket=bucket,
+                                       Key=key,
+                                       Range=f"bytes={start}-{end}",
+                                       IfMatch=etag)
+    with response["Body"] as body:
+        yield from body.iter_chunks(chunk_size=1024 * 1024)
+
+
 def _folder_delete(errors: list[str],
                    bucket: str,
                    basepath: str,
                    client: BaseClient,
-                   logger: Logger = None) -> None:
+                   failures: dict[str, str] = None,
+                   logger: Logger = None) -> bool:
     """
     Traverse the folders recursively, removing its objects.
 
+    The objects are removed in batches by multi-object delete requests, which are issued concurrently,
+    as the pages of the folder's listing are obtained. The objects which could not be removed
+    are reported in *failures*, if provided, instead of interrupting the operation.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to delete the objects at
-    :param client: the MinIO client object
+    :param client: the AWS client object
+    :param failures: optional *dict* to receive the names of the objects not removed, and the reasons
     :param logger: optional logger
+    :return: 'True' if all objects were removed, 'False' otherwise
     """
+    # initialize the return variable
+    result: bool = False
+
     # obtain the list of entries in the given folder
     objs: Iterator = objects_list(errors=errors,
                                   bucket=bucket,
                                   basepath=basepath,
                                   recursive=True,
+                                  client=client,
                                   logger=logger)
     # was the list obtained ?
-    if objs:
-        # yes, proceed
-        for obj in objs:
-            try:
-                client.remove_object(bucket_name=bucket,
-                                     object_name=obj.object_name)
-                _s3_log(logger=logger,
-                        stmt=f"Removed folder {basepath}, bucket {bucket}")
-            except Exception as e:
-                # SANITY CHECK: in case of concurrent exclusion
-                # ruff: noqa: PERF203
-                if not hasattr(e, "code") or e.code != "NoSuchKey":
-                    _s3_except_msg(errors=errors,
-                                   exception=e,
-                                   engine="aws",
-                                   logger=logger)
+    if objs is not None:
+        # yes, remove its objects in batches, as the listing progresses
+        op_failures: dict[str, str] = {}
+        try:
+            _s3_pipeline(batches=_s3_batches(items=(obj["Key"] for obj in objs),
+                                             size=_S3_DELETE_BATCH),
+                         func=lambda names: _objects_remove(bucket=bucket,
+                                                            basepath=basepath,
+                                                            names=names,
+                                                            client=client,
+                                                            logger=logger),
+                         max_workers=_s3_get_param("aws", "max-concurrency") or _S3_MAX_CONCURRENCY,
+                         results=op_failures)
+            result = not op_failures
+        except Exception as e:
+            _s3_except_msg(errors=errors,
+                           exception=e,
+                           engine="aws",
+                           logger=logger)
+        # were there failures ?
+        if op_failures:
+            # yes, report them
+            if isinstance(failures, dict):
+                failures.update(op_failures)
+            _s3_log(logger=logger,
+                    err_msg=f"Unable to remove {len(op_failures)} objects in folder {basepath}, bucket {bucket}",
+                    level=ERROR,
+                    errors=errors)
+
+    return result
+
+
+def _objects_remove(bucket: str,
+                    basepath: str,
+                    names: list[str],
+                    client: BaseClient,
+                    logger: Logger = None) -> dict[str, str]:
+    """
+    Remove the objects in *names* with a multi-object delete request.
+
+    :param bucket: the bucket to use
+    :param basepath: the folder containing the objects, for logging purposes
+    :param names: the names of the objects to remove
+    :param client: the AWS client object
+    :param logger: optional logger
+    :return: the names of the objects not removed, and the reasons
+    """
+    # initialize the return variable
+    result: dict[str, str] = {}
+
+    try:
+        reply: dict = client.delete_objects(Bucket=bucket,
+                                            Delete={
+                                                "Objects": [{"Key": name} for name in names],
+                                                "Quiet": True
+                                            })
+        for error in reply.get("Errors", []):
+            # SANITY CHECK: in case of concurrent exclusion
+            if error.get("Code") != "NoSuchKey":
+                result[error.get("Key")] = f"{error.get('Code')}: {error.get('Message')}"
+    except Exception as e:
+        for name in names:
+            result.setdefault(name, f"{e}")
+
+    _s3_log(logger=logger,
+            stmt=f"Removed {len(names) - len(result)} objects in folder {basepath}, bucket {bucket}")
+
+    return result
+
+
+def _extra_args_build(mimetype: str,
+                      tags: dict,
+                      metadata: dict = None) -> dict:
+    """
+    Build the extra arguments for uploading an object to the *AWS* store.
+
+    :param mimetype: the object's mimetype
+    :param tags: optional metadata describing the object
+    :param metadata: optional user-defined metadata to be stored with the object
+    :return: the extra arguments for the upload
+    """
+    result: dict = {"ContentType": mimetype}
+
+    # has user-defined metadata been specified ?
+    if metadata:
+        # yes, store it
+        result["Metadata"] = metadata
+
+    # have tags been defined ?
+    if tags:
+        # yes, store them
+        doc_tags: dict = {}
+        for key, value in tags.items():
+            # normalize text, by removing all diacritics
+            doc_tags[key] = unidecode(value)
+        result["Tagging"] = urlencode(doc_tags)
+
+    return result
+
+
+def _client_config() -> Config:
+    """
+    Build the *botocore* configuration for the *AWS* client, as per the current access parameters.
+
+    The connection pool is sized to accommodate at least the concurrent threads of a managed transfer.
+
+    :return: the client configuration
+    """
+    max_concurrency: int = _s3_get_param("aws", "max-concurrency") or 10
+    config: dict = {
+        "max_pool_connections": max(_s3_get_param("aws", "pool-size") or 10, max_concurrency),
+        "tcp_keepalive": bool(_s3_get_param("aws", "keep-alive"))
+    }
+    connect_timeout: float = _s3_get_param("aws", "connect-timeout")
+    if connect_timeout:
+        config["connect_timeout"] = connect_timeout
+    read_timeout: float = _s3_get_param("aws", "read-timeout")
+    if read_timeout:
+        config["read_timeout"] = read_timeout
+    max_retries: int = _s3_get_param("aws", "max-retries")
+    if max_retries is not None:
+        config["retries"] = {
+            "mode": "standard",
+            "total_max_attempts": max_retries + 1
+        }
+
+    return Config(**config)
+
+
+def _transfer_config(part_size: int = None,
+                     parallel_parts: int = None) -> TransferConfig:
+    """
+    Build the configuration for *boto3*'s managed transfers, as per the current access parameters.
+
+    Parameters not specified assume the values *boto3* uses for its own default configuration.
+    If *part_size* is provided, it prevails, and transfers up to that size are done in a single part.
+    If *parallel_parts* is provided, it prevails as the maximum number of parts transferred concurrently.
+
+    :param part_size: optional size in bytes of each part
+    :param parallel_parts: optional number of parts transferred concurrently
+    :return: the managed transfer configuration
+    """
+    config: dict = {}
+    if part_size:
+        config["multipart_threshold"] = part_size + 1
+        config["multipart_chunksize"] = part_size
+    else:
+        multipart_threshold: int = _s3_get_param("aws", "multipart-threshold")
+        if multipart_threshold:
+            config["multipart_threshold"] = multipart_threshold
+        part_size = _s3_get_param("aws", "part-size")
+        if part_size:
+            config["multipart_chunksize"] = part_size
+    max_concurrency: int = parallel_parts or _s3_get_param("aws", "max-concurrency")
+    if max_concurrency:
+        config["max_concurrency"] = max_concurrency
+
+    return TransferConfig(**config)
+
+
+def _is_missing(exception: Exception) -> bool:
+    """
+    Determine whether *exception* reports a missing bucket or object.
+
+    :param exception: the exception raised by the AWS client
+    :return: 'True' if the bucket or object does not exist, 'False' otherwise
+    """
+    response: dict = getattr(exception, "response", None) or {}
+    return response.get("Error", {}).get("Code") in ["404", "NoSuchBucket", "NoSuchKey"]
+
+
+def _is_not_modified(exception: Exception) -> bool:
+    """
+    Determine whether *exception* reports that an object has not been modified, on a conditional request.
+
+    :param exception: the exception raised by the AWS client
+    :return: 'True' if the object has not been modified, 'False' otherwise
+    """
+    response: dict = getattr(exception, "response", None) or {}
+    return response.get("Error", {}).get("Code") in ["304", "NotModified"]
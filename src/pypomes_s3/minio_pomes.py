@@ -1,17 +1,30 @@
-import pickle
-import uuid
-from collections.abc import Iterator
-from logging import Logger
+import certifi
+import os
+import socket
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from email.utils import format_datetime
+from functools import partial
+from itertools import chain
+from logging import ERROR, Logger
 from minio import Minio
 from minio.datatypes import Object as MinioObject
 from minio.commonconfig import Tags
+from minio.deleteobjects import DeleteObject
 from pathlib import Path
 from typing import Any
 from unidecode import unidecode
+from urllib3 import BaseHTTPResponse, PoolManager, Retry, Timeout
+from urllib3.connection import HTTPConnection
 
 from .s3_common import (
-    _s3_get_param, _s3_get_params, _s3_except_msg, _s3_log
+    _S3_DELETE_BATCH, _S3_LIST_PAGE_MAX, _S3_MAX_CONCURRENCY, _S3_PART_SIZE,
+    _s3_get_param, _s3_get_params, _s3_get_client, _s3_register_client, _s3_upload_policy, _s3_spool,
+    S3_NOT_MODIFIED, _s3_read_body, _s3_batches, _s3_pipeline, _s3_ranged_download, _s3_stream_download,
+    _s3_not_modified, _s3_utc, _s3_except_msg, _s3_log
 )
+from .s3_codecs import _S3_CODEC_META, _s3_codec, _s3_encode, _s3_decode
+from .s3_compression import _S3_COMPRESSION_META, _S3_COMPRESSION_CHUNK, _s3_compressed, _s3_decompress
 
 
 def access(errors: list[str],
@@ -19,30 +32,36 @@ def access(errors: list[str],
     """
     Obtain and return a *MinIO* client object.
 
+    The client is created once for the current access parameters, and is shared thereafter.
+
     :param errors: incidental error messages
     :param logger: optional logger
     :return: the MinIO client object
     """
-    # initialize the return variable
-    result: Minio | None = None
+    # obtain the registered MinIO client
+    result: Minio | None = _s3_get_client(engine="minio")
 
-    # retrieve the access parameters
-    access_key, secret_key, endpoint, secure = _s3_get_params("minio")
-
-    # obtain the MinIO client
-    try:
-        result = Minio(access_key=access_key,
-                       secret_key=secret_key,
-                       endpoint=endpoint,
-                       secure=secure)
-        _s3_log(logger=logger,
-                stmt="Minio client created")
+    # was it obtained ?
+    if not result:
+        # no, retrieve the access parameters
+        access_key, secret_key, endpoint, secure = _s3_get_params("minio")
 
-    except Exception as e:
-        _s3_except_msg(errors=errors,
-                       exception=e,
-                       engine="minio",
-                       logger=logger)
+        # create and register the MinIO client
+        try:
+            client: Minio = Minio(access_key=access_key,
+                                  secret_key=secret_key,
+                                  endpoint=endpoint,
+                                  secure=secure,
+                                  http_client=_http_client())
+            result = _s3_register_client(engine="minio",
+                                         client=client)
+            _s3_log(logger=logger,
+                    stmt="Minio client created")
+        except Exception as e:
+            _s3_except_msg(errors=errors,
+                           exception=e,
+                           engine="minio",
+                           logger=logger)
     return result
 
 
@@ -91,11 +110,18 @@ def file_store(errors: list[str],
                filepath: Path | str,
                mimetype: str,
                tags: dict = None,
+               part_size: int = None,
+               parallel_parts: int = None,
                client: Minio = None,
                logger: Logger = None) -> bool:
     """
     Store a file at the *MinIO* store.
 
+    Unless *part_size* and *parallel_parts* are provided, they are determined from the size of the file:
+    small files are uploaded in a single part, and large files in multiple parts, transferred concurrently.
+    If compression is configured, and the file is not smaller than the compression cutoff,
+    the file is compressed into a temporary spool, and uploaded from there.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to store the file at
@@ -103,7 +129,9 @@ def file_store(errors: list[str],
     :param filepath: the path specifying where the file is
     :param mimetype: the file mimetype
     :param tags: optional metadata describing the file
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param part_size: optional size in bytes of each part (determined from the file size, if omitted)
+    :param parallel_parts: optional number of parts uploaded concurrently (determined from the file size, if omitted)
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: 'True' if the file was successfully stored, 'False' otherwise
     """
@@ -117,23 +145,25 @@ def file_store(errors: list[str],
     if curr_client:
         # yes, proceed
         remotepath: Path = Path(basepath) / identifier
-        # have tags been defined ?
-        if tags:
-            # yes, store them
-            doc_tags = Tags(for_object=True)
-            for key, value in tags.items():
-                # normalize text, by removing all diacritics
-                doc_tags[key] = unidecode(value)
-        else:
-            # no
-            doc_tags = None
-        # store the file
+        # store the file, compressing it if so configured
         try:
-            curr_client.fput_object(bucket_name=bucket,
-                                    object_name=f"{remotepath}",
-                                    file_path=filepath,
-                                    content_type=mimetype,
-                                    tags=doc_tags)
+            with Path(filepath).open(mode="rb") as f, \
+                 _s3_compressed(engine="minio",
+                                source=f,
+                                size=os.fstat(f.fileno()).st_size) as (data, length, compression):
+                part_size, parallel_parts = _s3_upload_policy(engine="minio",
+                                                              size=length,
+                                                              part_size=part_size,
+                                                              parallel_parts=parallel_parts)
+                curr_client.put_object(bucket_name=bucket,
+                                       object_name=f"{remotepath}",
+                                       data=data,
+                                       length=length,
+                                       content_type=mimetype,
+                                       part_size=part_size,
+                                       num_parallel_uploads=parallel_parts,
+                                       metadata={_S3_COMPRESSION_META: compression} if compression else None,
+                                       tags=_tags_build(tags=tags))
             result = True
             _s3_log(logger=logger,
                     stmt=(f"Stored {remotepath}, bucket {bucket}, "
@@ -151,19 +181,29 @@ def file_retrieve(errors: list[str],
                   basepath: str,
                   identifier: str,
                   filepath: Path | str,
+                  parallel: bool = False,
+                  etag: str = None,
+                  modified_since: datetime = None,
                   client: Minio = None,
                   logger: Logger = None) -> Any:
     """
     Retrieve a file from the *MinIO* store.
 
+    If *parallel* is set, and the file is larger than the configured part size, its byte ranges
+    are fetched concurrently, and written directly at their offsets in *filepath*. Otherwise,
+    the file is fetched in a single stream, and decompressed as it arrives, if it was stored compressed.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to retrieve the file from
     :param identifier: the file identifier, tipically a file name
     :param filepath: the path to save the retrieved file at
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param parallel: whether to fetch byte ranges of the file concurrently (defaults to False)
+    :param etag: optional ETag of the copy at hand of the file, dispensing with its retrieval if still current
+    :param modified_since: optional moment the copy at hand of the file was obtained (if *etag* is not provided)
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
-    :return: information about the file retrieved
+    :return: information about the file retrieved, or 'S3_NOT_MODIFIED' if the copy at hand is still current
     """
     # initialize the return variable
     result: Any = None
@@ -175,10 +215,41 @@ def file_retrieve(errors: list[str],
     if curr_client:
         # yes, proceed
         remotepath: Path = Path(basepath) / identifier
+        part_size: int = _s3_get_param("minio", "part-size") or _S3_PART_SIZE
         try:
-            result = curr_client.fget_object(bucket_name=bucket,
-                                             object_name=f"{remotepath}",
-                                             file_path=filepath)
+            stat: MinioObject = curr_client.stat_object(bucket_name=bucket,
+                                                        object_name=f"{remotepath}")
+            compression: str | None = stat.metadata.get(f"x-amz-meta-{_S3_COMPRESSION_META}")
+            # is the copy at hand of the file still current ?
+            if _s3_not_modified(stat=stat,
+                                etag=etag,
+                                modified_since=modified_since):
+                # yes, dispense with its retrieval
+                result = S3_NOT_MODIFIED
+            # is the file to be fetched in ranges ?
+            elif parallel and not compression and stat.size > part_size:
+                # yes, fetch its ranges concurrently
+                _s3_ranged_download(filepath=filepath,
+                                    size=stat.size,
+                                    fetch=partial(_range_fetch,
+                                                  client=curr_client,
+                                                  bucket=bucket,
+                                                  object_name=f"{remotepath}",
+                                                  etag=stat.etag),
+                                    part_size=part_size,
+                                    max_workers=_s3_get_param("minio", "max-concurrency") or _S3_MAX_CONCURRENCY)
+            else:
+                # no, fetch it in a single stream, decompressing it if it was stored compressed
+                _s3_stream_download(filepath=filepath,
+                                    chunks=_s3_decompress(compression=compression,
+                                                          chunks=_range_fetch(start=0,
+                                                                              end=stat.size - 1,
+                                                                              client=curr_client,
+                                                                              bucket=bucket,
+                                                                              object_name=f"{remotepath}",
+                                                                              etag=stat.etag)))
+            if result is None:
+                result = stat
             _s3_log(logger=logger,
                     stmt=f"Retrieved {remotepath}, bucket {bucket}")
         except Exception as e:
@@ -203,7 +274,7 @@ def object_exists(errors: list[str],
     :param bucket: the bucket to use
     :param basepath: the path specifying where to locate the object
     :param identifier: optional object identifier
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: 'True' if the object was found, 'False' otherwise
     """
@@ -221,10 +292,19 @@ def object_exists(errors: list[str],
             objs: Iterator = objects_list(errors=errors,
                                           bucket=bucket,
                                           basepath=basepath,
-                                          recursive=False,
+                                          recursive=True,
+                                          page_size=1,
                                           client=curr_client,
                                           logger=logger)
-            result = next(objs, None) is None
+            # the folder exists if anything at all is listed in it
+            if objs is not None:
+                try:
+                    result = next(objs, None) is not None
+                except Exception as e:
+                    _s3_except_msg(errors=errors,
+                                   exception=e,
+                                   engine="minio",
+                                   logger=logger)
         # verify the status of the object
         elif object_stat(errors=errors,
                          bucket=bucket,
@@ -234,7 +314,7 @@ def object_exists(errors: list[str],
                          logger=logger):
             result = True
 
-        remotepath: Path = Path(basepath) / identifier
+        remotepath: Path = Path(basepath) / (identifier or "")
         existence: str = "exists" if result else "do not exist"
         _s3_log(logger=logger,
                 stmt=f"Object {remotepath}, bucket {bucket}, {existence}")
@@ -245,17 +325,19 @@ def object_exists(errors: list[str],
 def object_stat(errors: list[str],
                 bucket: str,
                 basepath: str,
-                identifier: str,
+                identifier: str = None,
                 client: Minio = None,
                 logger: Logger = None) -> MinioObject:
     """
     Retrieve and return the information about an object in the *MinIO* store.
 
+    If *identifier* is not provided, *basepath* is taken verbatim as the object's full name.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying where to locate the object
-    :param identifier: the object identifier
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param identifier: optional object identifier
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: metadata and information about the object
     """
@@ -268,7 +350,7 @@ def object_stat(errors: list[str],
     # was the MinIO client obtained ?
     if curr_client:
         # yes, proceed
-        remotepath: Path = Path(basepath) / identifier
+        remotepath: Path | str = Path(basepath) / identifier if identifier else basepath
         try:
             result = curr_client.stat_object(bucket_name=bucket,
                                              object_name=f"{remotepath}")
@@ -289,18 +371,24 @@ def object_store(errors: list[str],
                  identifier: str,
                  obj: Any,
                  tags: dict = None,
+                 codec: str = None,
                  client: Minio = None,
                  logger: Logger = None) -> bool:
     """
     Store an object at the *MinIO* store.
 
+    The object is serialized into an in-memory buffer, which is spooled to a temporary file
+    only if its size exceeds the configured spool threshold. If compression is configured,
+    and the serialized object is not smaller than the compression cutoff, it is compressed before upload.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to store the object at
     :param identifier: the object identifier
     :param obj: object to be stored
     :param tags: optional metadata describing the object
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param codec: the codec to serialize the object with (defaults to the one configured, or to 'pickle')
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: 'True' if the object was successfully stored, 'False' otherwise
     """
@@ -312,38 +400,43 @@ def object_store(errors: list[str],
                                           logger=logger)
     # proceed, if the MinIO client was obtained
     if curr_client:
-        # serialize the object into a file
-        temp_folder: Path = _s3_get_param("minio", "temp-folder")
-        filepath: Path = temp_folder / f"{uuid.uuid4()}.pickle"
-        with filepath.open("wb") as f:
-            pickle.dump(obj, f)
-
-        # store the file
-        op_errors: list[str] = []
-        file_store(errors=op_errors,
-                   bucket=bucket,
-                   basepath=basepath,
-                   identifier=identifier,
-                   filepath=filepath,
-                   mimetype="application/octet-stream",
-                   tags=tags,
-                   client=curr_client,
-                   logger=logger)
-
-        # errors ?
-        if op_errors:
-            # yes, report them
-            errors.extend(op_errors)
-            storage: str = "Unable to store"
-        else:
-            # no, remove the file from the file system
-            result = True
-            filepath.unlink()
-            storage: str = "Stored "
-
         remotepath: Path = Path(basepath) / identifier
-        _s3_log(logger=logger,
-                stmt=f"{storage} {remotepath}, bucket {bucket}")
+        try:
+            with _s3_spool(engine="minio") as f:
+                # serialize the object
+                curr_codec: str = _s3_codec(engine="minio",
+                                            codec=codec)
+                _s3_encode(codec=curr_codec,
+                           obj=obj,
+                           stream=f)
+                length: int = f.tell()
+                f.seek(0)
+                # store the serialized object, compressing it if so configured
+                with _s3_compressed(engine="minio",
+                                    source=f,
+                                    size=length) as (data, length, compression):
+                    metadata: dict[str, str] = {_S3_CODEC_META: curr_codec}
+                    if compression:
+                        metadata[_S3_COMPRESSION_META] = compression
+                    part_size, parallel_parts = _s3_upload_policy(engine="minio",
+                                                                  size=length)
+                    curr_client.put_object(bucket_name=bucket,
+                                           object_name=f"{remotepath}",
+                                           data=data,
+                                           length=length,
+                                           content_type="application/octet-stream",
+                                           part_size=part_size,
+                                           num_parallel_uploads=parallel_parts,
+                                           metadata=metadata,
+                                           tags=_tags_build(tags=tags))
+            result = True
+            _s3_log(logger=logger,
+                    stmt=f"Stored {remotepath}, bucket {bucket}, tags {tags}")
+        except Exception as e:
+            _s3_except_msg(errors=errors,
+                           exception=e,
+                           engine="minio",
+                           logger=logger)
 
     return result
 
@@ -352,18 +445,31 @@ def object_retrieve(errors: list[str],
                     bucket: str,
                     basepath: str,
                     identifier: str,
+                    buffer: bytearray = None,
+                    etag: str = None,
+                    modified_since: datetime = None,
+                    info: dict[str, Any] = None,
                     client: Minio = None,
                     logger: Logger = None) -> Any:
     """
     Retrieve an object from the *MinIO* store.
 
+    The serialized object is read from the response stream into memory, and unmarshalled from there.
+    If *buffer* is provided and is large enough to hold the serialized object, it is used for reading,
+    thus avoiding the allocation of a new buffer. If the object was stored compressed, it is decompressed
+    as it is read from the response stream, and *buffer* is not used.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to retrieve the object from
     :param identifier: the object identifier
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param buffer: optional preallocated buffer to read the serialized object into
+    :param etag: optional ETag of the copy at hand of the object, dispensing with its retrieval if still current
+    :param modified_since: optional moment the copy at hand of the object was obtained
+    :param info: optional dictionary to receive the *etag* and the serialized *size* of the object retrieved
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
-    :return: the object retrieved
+    :return: the object retrieved, or 'S3_NOT_MODIFIED' if the copy at hand is still current
     """
     # initialize the return variable
     result: Any = None
@@ -373,28 +479,50 @@ def object_retrieve(errors: list[str],
                                           logger=logger)
     # proceed, if the MinIO client was obtained
     if curr_client:
-        # retrieve the file containg the serialized object
-        temp_folder: Path = _s3_get_param("minio", "temp-folder")
-        filepath: Path = temp_folder / f"{uuid.uuid4()}.pickle"
-        stat: Any = file_retrieve(errors=errors,
-                                  bucket=bucket,
-                                  basepath=basepath,
-                                  identifier=identifier,
-                                  filepath=filepath,
-                                  client=curr_client,
-                                  logger=logger)
-
-        # was the file retrieved ?
-        if stat:
-            # yes, umarshall the corresponding object
-            with filepath.open("rb") as f:
-                result = pickle.load(f)
-            filepath.unlink()
-
-        retrieval: str = "Retrieved" if result else "Unable to retrieve"
         remotepath: Path = Path(basepath) / identifier
-        _s3_log(logger=logger,
-                stmt=f"{retrieval} {remotepath}, bucket {bucket}")
+        try:
+            # read the serialized object from the response stream
+            headers: dict[str, str] = {}
+            if etag:
+                headers["If-None-Match"] = f'"{etag}"'
+            if modified_since:
+                headers["If-Modified-Since"] = format_datetime(_s3_utc(moment=modified_since),
+                                                               usegmt=True)
+            response: BaseHTTPResponse = curr_client.get_object(bucket_name=bucket,
+                                                                object_name=f"{remotepath}",
+                                                                request_headers=headers or None)
+            try:
+                compression: str | None = response.headers.get(f"x-amz-meta-{_S3_COMPRESSION_META}")
+                if compression:
+                    chunks: Iterable[bytes] = _s3_decompress(compression=compression,
+                                                             chunks=response.stream(amt=_S3_COMPRESSION_CHUNK))
+                    data: memoryview = memoryview(b"".join(chunks))
+                else:
+                    data: memoryview = _s3_read_body(stream=response,
+                                                     length=int(response.headers.get("Content-Length")),
+                                                     buffer=buffer)
+            finally:
+                response.close()
+                response.release_conn()
+            if isinstance(info, dict):
+                info["etag"] = response.headers.get("ETag", "").strip('"')
+                info["size"] = len(data)
+            # unmarshall the object, with the codec it was serialized with
+            result = _s3_decode(errors=errors,
+                                codec=response.headers.get(f"x-amz-meta-{_S3_CODEC_META}"),
+                                data=data)
+            _s3_log(logger=logger,
+                    stmt=f"Retrieved {remotepath}, bucket {bucket}")
+        except Exception as e:
+            # has the object not been modified ?
+            if getattr(e, "status_code", None) == 304:
+                # yes, the copy at hand is still current
+                result = S3_NOT_MODIFIED
+            elif not hasattr(e, "code") or e.code != "NoSuchKey":
+                _s3_except_msg(errors=errors,
+                               exception=e,
+                               engine="minio",
+                               logger=logger)
 
     return result
 
@@ -403,18 +531,20 @@ def object_delete(errors: list[str],
                   bucket: str,
                   basepath: str,
                   identifier: str = None,
+                  failures: dict[str, str] = None,
                   client: Minio = None,
                   logger: Logger = None) -> bool:
     """
     Remove an object from the *MinIO* store.
 
-    If *identifier* is not provided, then the folder *basepath* is deleted
+    If *identifier* is not provided, then the folder *basepath* is deleted.
 
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to delete the object at
     :param identifier: optional object identifier
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param failures: optional *dict* to receive the names of the objects not removed, and the reasons
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: 'True' if the object or folder was deleted or did not exist, 'False' if an error ocurred
     """
@@ -432,6 +562,7 @@ def object_delete(errors: list[str],
             result = _folder_delete(errors=errors,
                                     bucket=bucket,
                                     basepath=basepath,
+                                    failures=failures,
                                     client=curr_client,
                                     logger=logger)
         else:
@@ -465,7 +596,7 @@ def object_tags_retrieve(errors: list[str],
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to retrieve the object from
     :param identifier: the object identifier
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: the metadata about the object
     """
@@ -502,16 +633,27 @@ def objects_list(errors: list[str],
                  bucket: str,
                  basepath: str,
                  recursive: bool = False,
+                 start_after: str = None,
+                 page_size: int = None,
                  client: Minio = None,
                  logger: Logger = None) -> Iterator:
     """
     Retrieve and return an iterator into the list of objects at *basepath*, in the *MinIO* store.
 
+    The iterator yields the objects, as well as the folders, if *recursive* is not set, in lexicographical order.
+    As *MinIO* yields the objects before the folders in each page of a non-recursive listing, the entries
+    at *basepath* are then read whole, and sorted, before being yielded.
+    The first page of entries is requested at once, and failures in obtaining it are reported in *errors*.
+    The subsequent pages are requested as the iteration proceeds, and failures in obtaining them are raised
+    to the consumer of the iterator.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to iterate from
     :param recursive: whether the location is iterated recursively
-    :param client: optional MinIO client (obtains a new one, if not provided)
+    :param start_after: optional name of the entry to start listing after
+    :param page_size: optional number of entries to request per page of a recursive listing (up to 1000, the default)
+    :param client: optional MinIO client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: the iterator into the list of objects, 'None' if the folder does not exist
     """
@@ -525,9 +667,12 @@ def objects_list(errors: list[str],
     if curr_client:
         # yes, proceed
         try:
-            result = curr_client.list_objects(bucket_name=bucket,
-                                              prefix=basepath,
-                                              recursive=recursive)
+            result = _objects_iterate(client=curr_client,
+                                      bucket=bucket,
+                                      basepath=basepath,
+                                      recursive=recursive,
+                                      start_after=start_after,
+                                      page_size=page_size)
             _s3_log(logger=logger,
                     stmt=f"Listed {basepath}, bucket {bucket}")
         except Exception as e:
@@ -539,44 +684,226 @@ def objects_list(errors: list[str],
     return result
 
 
+def _objects_iterate(client: Minio,
+                     bucket: str,
+                     basepath: str,
+                     recursive: bool,
+                     start_after: str = None,
+                     page_size: int = None) -> Iterator[MinioObject]:
+    """
+    Iterate on the pages of the *ListObjectsV2* operation, yielding their entries in lexicographical order.
+
+    The first page is requested at once, so that failures in accessing the store are raised to the caller,
+    whereas the subsequent pages are requested as the iteration proceeds. If *recursive* is not set,
+    all pages are requested at once, and their entries are sorted.
+
+    :param client: the MinIO client object
+    :param bucket: the bucket to use
+    :param basepath: the path specifying the location to iterate from
+    :param recursive: whether the location is iterated recursively
+    :param start_after: optional name of the entry to start listing after
+    :param page_size: optional number of entries to request per page of a recursive listing
+    :return: the iterator into the list of objects
+    """
+    # initialize the return variable
+    result: Iterator[MinioObject]
+
+    objs: Iterator[MinioObject] = client._list_objects(bucket_name=bucket,
+                                                       delimiter=None if recursive else "/",
+                                                       encoding_type="url",
+                                                       max_keys=min(page_size or _S3_LIST_PAGE_MAX,
+                                                                    _S3_LIST_PAGE_MAX) if recursive else None,
+                                                       prefix=basepath,
+                                                       start_after=start_after)
+    if recursive:
+        # request the first page at once
+        first: MinioObject | None = next(objs, None)
+        result = objs if first is None else chain([first], objs)
+    else:
+        # the page boundaries are not exposed, thus the entries at the folder are sorted as a whole
+        result = iter(sorted(objs,
+                             key=lambda entry: entry.object_name))
+
+    return result
+
+
+def _tags_build(tags: dict) -> Tags | None:
+    """
+    Build the *MinIO* tags for an object, from the contents of *tags*.
+
+    :param tags: the metadata describing the object
+    :return: the MinIO tags, or 'None' if *tags* is empty
+    """
+    # initialize the return variable
+    result: Tags | None = None
+
+    # have tags been defined ?
+    if tags:
+        # yes, build them
+        result = Tags(for_object=True)
+        for key, value in tags.items():
+            # normalize text, by removing all diacritics
+            result[key] = unidecode(value)
+
+    return result
+
+
+def _http_client() -> PoolManager:
+    """
+    Build the *urllib3* connection pool for the *MinIO* client, as per the current access parameters.
+
+    Parameters not specified assume the values *MinIO* uses for its own default pool.
+
+    :return: the connection pool
+    """
+    pool_size: int = _s3_get_param("minio", "pool-size") or 10
+    connect_timeout: float = _s3_get_param("minio", "connect-timeout") or 300
+    read_timeout: float = _s3_get_param("minio", "read-timeout") or 300
+    max_retries: int = _s3_get_param("minio", "max-retries")
+    if max_retries is None:
+        max_retries = 5
+
+    # enable TCP keep-alive, if so specified
+    socket_options: list[tuple] = list(HTTPConnection.default_socket_options)
+    if _s3_get_param("minio", "keep-alive"):
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+    return PoolManager(maxsize=pool_size,
+                       timeout=Timeout(connect=connect_timeout,
+                                       read=read_timeout),
+                       cert_reqs="CERT_REQUIRED",
+                       ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+                       retries=Retry(total=max_retries,
+                                     backoff_factor=0.2,
+                                     status_forcelist=[500, 502, 503, 504]),
+                       socket_options=socket_options)
+
+
+def _range_fetch(start: int,
+                 end: int,
+                 client: Minio,
+                 bucket: str,
+                 object_name: str,
+                 etag: str) -> Iterator[bytes]:
+    """
+    Fetch the byte range from *start* to *end* of an object in the *MinIO* store, yielding its chunks.
+
+    The range is fetched only if the object still matches *etag*.
+
+    :param start: position of the first byte in the range
+    :param end: position of the last byte in the range
+    :param client: the MinIO client object
+    :param bucket: the bucket to use
+    :param object_name: the name of the object
+    :param etag: the expected ETag of the object
+    :return: an iterator into the chunks in the range
+    """
+    response: BaseHTTPResponse = client.get_object(bucket_name=bucket,
+                                                   object_name=object_name,
+                                                   offset=start,
+                                                   length=end - start + 1,
+                                                   request_headers={"If-Match": f'"{etag}"'})
+    try:
+        yield from response.stream(amt=1024 * 1024)
+    finally:
+        response.close()
+        response.release_conn()
+
+
 def _folder_delete(errors: list[str],
                    bucket: str,
                    basepath: str,
                    client: Minio,
+                   failures: dict[str, str] = None,
                    logger: Logger = None) -> bool:
     """
     Traverse the folders recursively, removing its objects.
 
+    The objects are removed in batches by multi-object delete requests, which are issued concurrently,
+    as the pages of the folder's listing are obtained. The objects which could not be removed
+    are reported in *failures*, if provided, instead of interrupting the operation.
+
     :param errors: incidental error messages
     :param bucket: the bucket to use
     :param basepath: the path specifying the location to delete the objects at
     :param client: the MinIO client object
+    :param failures: optional *dict* to receive the names of the objects not removed, and the reasons
     :param logger: optional logger
+    :return: 'True' if all objects were removed, 'False' otherwise
     """
     # initialize the return variable
-    result: bool = True
+    result: bool = False
 
     # obtain the list of entries in the given folder
     objs: Iterator = objects_list(errors=errors,
                                   bucket=bucket,
                                   basepath=basepath,
                                   recursive=True,
-                                  logger=logger) or []
-    # traverse the list
-    for obj in objs:
+                                  client=client,
+                                  logger=logger)
+    # was the list obtained ?
+    if objs is not None:
+        # yes, remove its objects in batches, as the listing progresses
+        op_failures: dict[str, str] = {}
         try:
-            client.remove_object(bucket_name=bucket,
-                                 object_name=obj.object_name)
-            _s3_log(logger=logger,
-                    stmt=f"Removed folder {basepath}, bucket {bucket}")
+            _s3_pipeline(batches=_s3_batches(items=(obj.object_name for obj in objs),
+                                             size=_S3_DELETE_BATCH),
+                         func=lambda names: _objects_remove(bucket=bucket,
+                                                            basepath=basepath,
+                                                            names=names,
+                                                            client=client,
+                                                            logger=logger),
+                         max_workers=_s3_get_param("minio", "max-concurrency") or _S3_MAX_CONCURRENCY,
+                         results=op_failures)
+            result = not op_failures
         except Exception as e:
+            _s3_except_msg(errors=errors,
+                           exception=e,
+                           engine="minio",
+                           logger=logger)
+        # were there failures ?
+        if op_failures:
+            # yes, report them
+            if isinstance(failures, dict):
+                failures.update(op_failures)
+            _s3_log(logger=logger,
+                    err_msg=f"Unable to remove {len(op_failures)} objects in folder {basepath}, bucket {bucket}",
+                    level=ERROR,
+                    errors=errors)
+
+    return result
+
+
+def _objects_remove(bucket: str,
+                    basepath: str,
+                    names: list[str],
+                    client: Minio,
+                    logger: Logger = None) -> dict[str, str]:
+    """
+    Remove the objects in *names* with a multi-object delete request.
+
+    :param bucket: the bucket to use
+    :param basepath: the folder containing the objects, for logging purposes
+    :param names: the names of the objects to remove
+    :param client: the MinIO client object
+    :param logger: optional logger
+    :return: the names of the objects not removed, and the reasons
+    """
+    # initialize the return variable
+    result: dict[str, str] = {}
+
+    try:
+        # the errors are reported lazily, as the deletion progresses
+        for error in client.remove_objects(bucket_name=bucket,
+                                           delete_object_list=[DeleteObject(name=name) for name in names]):
             # SANITY CHECK: in case of concurrent exclusion
-            # ruff: noqa: PERF203
-            if not hasattr(e, "code") or e.code != "NoSuchKey":
-                result = False
-                _s3_except_msg(errors=errors,
-                               exception=e,
-                               engine="minio",
-                               logger=logger)
+            if error.code != "NoSuchKey":
+                result[error.name] = f"{error.code}: {error.message}"
+    except Exception as e:
+        for name in names:
+            result.setdefault(name, f"{e}")
+
+    _s3_log(logger=logger,
+            stmt=f"Removed {len(names) - len(result)} objects in folder {basepath}, bucket {bucket}")
 
     return result
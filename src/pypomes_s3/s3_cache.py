@@ -0,0 +1,733 @@
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from copy import deepcopy
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+
+class _S3Cache:
+    """
+    A thread-safe in-process cache, with time-to-live expiration and least-recently-used eviction.
+
+    Entries are keyed by tuples *(engine, bucket, remotepath)*, so that all entries under
+    a given path may be invalidated at once.
+    """
+
+    def __init__(self,
+                 ttl: float,
+                 max_entries: int,
+                 negative_ttl: float = 0) -> None:
+        """
+        Initialize the cache.
+
+        :param ttl: the time-to-live of the entries, in seconds
+        :param max_entries: the maximum number of entries held
+        :param negative_ttl: the time-to-live of the entries recording absent objects, in seconds
+        """
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self.negative_ttl: float = negative_ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        # the number of invalidations so far, so that values obtained before an invalidation are not cached
+        self._generation: int = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def generation(self) -> int:
+        """
+        Obtain the number of invalidations so far, to be provided when caching a value obtained afterwards.
+
+        :return: the number of invalidations so far
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self,
+            key: Hashable) -> tuple[bool, Any]:
+        """
+        Obtain the value cached for *key*, if it has not yet expired.
+
+        :param key: the key of the entry
+        :return: a tuple *(found, value)*
+        """
+        # initialize the return variable
+        result: tuple[bool, Any] = (False, None)
+
+        with self._lock:
+            entry: tuple[float, Any] | None = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                result = (True, entry[1])
+            else:
+                if entry:
+                    del self._entries[key]
+                self.misses += 1
+
+        return result
+
+    def put(self,
+            key: Hashable,
+            value: Any,
+            ttl: float = None,
+            generation: int = None) -> None:
+        """
+        Cache *value* for *key*, evicting the least recently used entries beyond the maximum number of entries.
+
+        If *generation* is provided, and entries have been invalidated since it was obtained,
+        *value* may be outdated, and is not cached.
+
+        :param key: the key of the entry
+        :param value: the value to cache
+        :param ttl: optional time-to-live of the entry, in seconds (defaults to the cache's)
+        :param generation: optional number of invalidations, as of the moment *value* started being obtained
+        """
+        with self._lock:
+            if generation is None or generation == self._generation:
+                self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+    def invalidate(self,
+                   key: Hashable) -> None:
+        """
+        Remove the entry for *key*, if it exists.
+
+        :param key: the key of the entry
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def invalidate_prefix(self,
+                          engine: str,
+                          bucket: str,
+                          prefix: str) -> None:
+        """
+        Remove all entries for objects located under *prefix*, in *bucket*.
+
+        :param engine: the reference S3 engine
+        :param bucket: the bucket holding the objects
+        :param prefix: the path the objects are located under
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if _s3_key_under(key=key,
+                                                                      engine=engine,
+                                                                      bucket=bucket,
+                                                                      prefix=prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Remove all entries, and reset the counters.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Obtain the current counters of the cache.
+
+        :return: the counters of hits, misses, evictions and entries held, and the cache's settings
+        """
+        with self._lock:
+            lookups: int = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit-rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max-entries": self.max_entries,
+                "ttl": self.ttl,
+                "negative-ttl": self.negative_ttl
+            }
+
+
+class _S3ObjectCache:
+    """
+    A thread-safe in-process cache of unmarshalled objects, bounded by their approximate size in bytes.
+
+    The size of an object is approximated by the size of its serialized form. Entries are evicted
+    in least-recently-used order, whenever the total size exceeds the maximum size. Each entry holds
+    the ETag of the object it was obtained from, so that it may be revalidated against the S3 store.
+    If *copy_on_hit* is set, deep copies of the objects are cached, and handed out, so that the callers
+    may modify the objects they obtain.
+    """
+
+    def __init__(self,
+                 max_bytes: int,
+                 revalidate_after: float,
+                 copy_on_hit: bool = False) -> None:
+        """
+        Initialize the cache.
+
+        :param max_bytes: the maximum total size in bytes of the objects held
+        :param revalidate_after: the time in seconds after which entries are revalidated, before being used
+        :param copy_on_hit: whether to hand out deep copies of the objects, instead of the objects cached
+        """
+        self.max_bytes: int = max_bytes
+        self.revalidate_after: float = revalidate_after
+        self.copy_on_hit: bool = copy_on_hit
+        self.bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidations: int = 0
+        self.evictions: int = 0
+        # the number of invalidations so far, so that objects obtained before an invalidation are not cached
+        self._generation: int = 0
+        # entries are tuples (etag, object, size, time of last validation)
+        self._entries: OrderedDict[Hashable, tuple[str, Any, int, float]] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def generation(self) -> int:
+        """
+        Obtain the number of invalidations so far, to be provided when caching an object obtained afterwards.
+
+        :return: the number of invalidations so far
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self,
+            key: Hashable) -> tuple[str, Any, bool] | None:
+        """
+        Obtain the entry for *key*.
+
+        A lookup finding no entry is counted as a miss, whereas the use of an entry found is counted
+        as a hit (see *hit*), or as a miss, if the entry turns out to be outdated (see *miss*).
+
+        :param key: the key of the entry
+        :return: a tuple *(etag, object, fresh)*, where *fresh* indicates that the entry may be used
+                 without revalidation, or 'None' if there is no entry for *key*
+        """
+        # initialize the return variable
+        result: tuple[str, Any, bool] | None = None
+
+        with self._lock:
+            entry: tuple[str, Any, int, float] | None = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                result = (entry[0], entry[1], time.monotonic() - entry[3] < self.revalidate_after)
+            else:
+                self.misses += 1
+        if result and self.copy_on_hit:
+            result = (result[0], deepcopy(result[1]), result[2])
+
+        return result
+
+    def hit(self,
+            key: Hashable,
+            revalidated: bool) -> None:
+        """
+        Record a use of the entry for *key*.
+
+        :param key: the key of the entry
+        :param revalidated: whether the entry has just been revalidated against the S3 store
+        """
+        with self._lock:
+            self.hits += 1
+            entry: tuple[str, Any, int, float] | None = self._entries.get(key)
+            if revalidated and entry:
+                self.revalidations += 1
+                self._entries[key] = (entry[0], entry[1], entry[2], time.monotonic())
+
+    def miss(self) -> None:
+        """
+        Record that the entry found for a key has turned out to be outdated.
+        """
+        with self._lock:
+            self.misses += 1
+
+    def put(self,
+            key: Hashable,
+            etag: str,
+            obj: Any,
+            size: int,
+            generation: int = None) -> None:
+        """
+        Cache *obj*, of approximate size *size*, for *key*, evicting the least recently used entries as needed.
+
+        Objects larger than the maximum size of the cache are not cached. If *generation* is provided,
+        and entries have been invalidated since it was obtained, *obj* may be outdated, and is not cached.
+
+        :param key: the key of the entry
+        :param etag: the ETag of the object in the S3 store
+        :param obj: the unmarshalled object
+        :param size: the approximate size of the object in bytes
+        :param generation: optional number of invalidations, as of the moment *obj* started being obtained
+        """
+        if self.copy_on_hit and size <= self.max_bytes:
+            obj = deepcopy(obj)
+        with self._lock:
+            old: tuple[str, Any, int, float] | None = self._entries.pop(key, None)
+            if old:
+                self.bytes -= old[2]
+            if size <= self.max_bytes and (generation is None or generation == self._generation):
+                self._entries[key] = (etag, obj, size, time.monotonic())
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    _, (_, _, evicted, _) = self._entries.popitem(last=False)
+                    self.bytes -= evicted
+                    self.evictions += 1
+
+    def invalidate(self,
+                   key: Hashable) -> None:
+        """
+        Remove the entry for *key*, if it exists.
+
+        :param key: the key of the entry
+        """
+        with self._lock:
+            self._generation += 1
+            entry: tuple[str, Any, int, float] | None = self._entries.pop(key, None)
+            if entry:
+                self.bytes -= entry[2]
+
+    def invalidate_prefix(self,
+                          engine: str,
+                          bucket: str,
+                          prefix: str) -> None:
+        """
+        Remove all entries for objects located under *prefix*, in *bucket*.
+
+        :param engine: the reference S3 engine
+        :param bucket: the bucket holding the objects
+        :param prefix: the path the objects are located under
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if _s3_key_under(key=key,
+                                                                      engine=engine,
+                                                                      bucket=bucket,
+                                                                      prefix=prefix)]:
+                self.bytes -= self._entries.pop(key)[2]
+
+    def clear(self) -> None:
+        """
+        Remove all entries, and reset the counters.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.revalidations = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Obtain the current counters of the cache.
+
+        :return: the counters of hits, misses, revalidations, evictions, entries and bytes held,
+                 and the cache's settings
+        """
+        with self._lock:
+            lookups: int = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit-rate": self.hits / lookups if lookups else 0.0,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max-bytes": self.max_bytes,
+                "revalidate-after": self.revalidate_after,
+                "copy-on-hit": self.copy_on_hit
+            }
+
+
+class _S3BloomFilter:
+    """
+    A thread-safe Bloom filter over the paths of the objects located under a given prefix.
+
+    A path not in the filter is definitely absent, whereas a path in the filter may or may not be present.
+    """
+
+    def __init__(self,
+                 capacity: int,
+                 error_rate: float) -> None:
+        """
+        Initialize the filter, sized for holding *capacity* paths with a false positive rate of *error_rate*.
+
+        :param capacity: the expected number of paths
+        :param error_rate: the acceptable rate of false positives
+        """
+        self.size: int = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes: int = max(1, round(self.size / capacity * math.log(2)))
+        self._bits: bytearray = bytearray((self.size + 7) // 8)
+        self._lock: Lock = Lock()
+
+    def _positions(self,
+                   path: str) -> Iterable[int]:
+        digest: bytes = hashlib.blake2b(path.encode(), digest_size=16).digest()
+        h1: int = int.from_bytes(digest[:8], "little")
+        h2: int = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self,
+            path: str) -> None:
+        """
+        Add *path* to the filter.
+
+        :param path: the path of the object
+        """
+        positions: list[int] = list(self._positions(path))
+        with self._lock:
+            for pos in positions:
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self,
+                     path: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(path))
+
+
+# marks the entries recording absent objects, in the cache of object information
+_S3_ABSENT: object = object()
+
+# default number of objects the Bloom filters are sized for
+_S3_BLOOM_CAPACITY: int = 1000000
+
+# the Bloom filters over the paths of the objects under given prefixes, keyed by engine, bucket, and prefix
+_S3_BLOOM_FILTERS: dict[tuple[str, str, str], _S3BloomFilter] = {}
+# the Bloom filters being built, which are fed the objects stored while their prefixes are listed
+_S3_BLOOM_PENDING: list[tuple[tuple[str, str, str], _S3BloomFilter]] = []
+_S3_BLOOM_LOCK: Lock = Lock()
+
+
+# the cache of object information, enabled with 's3_stat_cache_setup'
+_S3_STAT_CACHE: _S3Cache | None = None
+
+# the cache of unmarshalled objects, enabled with 's3_object_cache_setup'
+_S3_OBJECT_CACHE: _S3ObjectCache | None = None
+
+
+def s3_stat_cache_setup(ttl: float = 30.0,
+                        max_entries: int = 10000,
+                        negative_ttl: float = 5.0) -> None:
+    """
+    Enable, reconfigure, or disable the in-process cache of object information.
+
+    When enabled, the information obtained by *s3_object_stat* is cached for *ttl* seconds,
+    and is also used by *s3_object_exists* to establish the existence of objects. The absence
+    of objects is cached as well, for the usually shorter *negative_ttl* seconds.
+    Storing or deleting objects through this package invalidates the corresponding entries.
+    Changes made to the S3 store by other processes are noticed only once the entries expire.
+    Reconfiguring the cache discards its current entries.
+
+    :param ttl: the time-to-live of the entries, in seconds (a non-positive value disables the cache)
+    :param max_entries: the maximum number of entries, beyond which the least recently used are evicted
+    :param negative_ttl: the time-to-live of the entries recording absent objects, in seconds
+                         (a non-positive value disables caching the absence of objects)
+    """
+    global _S3_STAT_CACHE
+    _S3_STAT_CACHE = _S3Cache(ttl=ttl,
+                              max_entries=max_entries,
+                              negative_ttl=negative_ttl or 0) if ttl and ttl > 0 else None
+
+
+def s3_stat_cache_stats() -> dict[str, Any] | None:
+    """
+    Obtain the counters of the in-process cache of object information.
+
+    :return: the counters of hits, misses, evictions and entries held, or 'None' if the cache is not enabled
+    """
+    return _S3_STAT_CACHE.stats() if _S3_STAT_CACHE else None
+
+
+def s3_stat_cache_clear() -> None:
+    """
+    Remove all entries from the in-process cache of object information, and reset its counters.
+    """
+    if _S3_STAT_CACHE:
+        _S3_STAT_CACHE.clear()
+
+
+def s3_object_cache_setup(max_bytes: int = 64 * 1024 * 1024,
+                          revalidate_after: float = 0,
+                          copy_on_hit: bool = False) -> None:
+    """
+    Enable, reconfigure, or disable the in-process cache of objects retrieved by *s3_object_retrieve*.
+
+    When enabled, the unmarshalled objects are kept in memory, up to a total of approximately *max_bytes*,
+    as measured by the size of their serialized forms. A cached object is used only after a conditional
+    request confirms that it is still current, which transfers no contents, unless it has been validated
+    less than *revalidate_after* seconds before. Storing or deleting objects through this package
+    invalidates the corresponding entries. Reconfiguring the cache discards its current entries.
+
+    IMPORTANT: unless *copy_on_hit* is set, the cached objects are shared instances. All calls obtaining
+    a cached object, including the call which cached it, obtain the very same instance, and a modification
+    made to it by any caller is seen by all others. These objects must therefore be treated as read-only.
+    If *copy_on_hit* is set, deep copies of the objects are cached, and handed out, instead,
+    at the expense of copying the objects on each use.
+
+    :param max_bytes: the maximum total size in bytes of the objects held (a non-positive value disables the cache)
+    :param revalidate_after: the time in seconds during which objects are used without revalidation (defaults to 0)
+    :param copy_on_hit: whether to hand out deep copies of the cached objects (defaults to False)
+    """
+    global _S3_OBJECT_CACHE
+    _S3_OBJECT_CACHE = _S3ObjectCache(max_bytes=max_bytes,
+                                      revalidate_after=revalidate_after or 0,
+                                      copy_on_hit=copy_on_hit) if max_bytes and max_bytes > 0 else None
+
+
+def s3_object_cache_stats() -> dict[str, Any] | None:
+    """
+    Obtain the counters of the in-process cache of objects.
+
+    :return: the counters of hits, misses, revalidations, evictions, entries and bytes held,
+             or 'None' if the cache is not enabled
+    """
+    return _S3_OBJECT_CACHE.stats() if _S3_OBJECT_CACHE else None
+
+
+def s3_object_cache_clear() -> None:
+    """
+    Remove all entries from the in-process cache of objects, and reset its counters.
+    """
+    if _S3_OBJECT_CACHE:
+        _S3_OBJECT_CACHE.clear()
+
+
+def _s3_cache_key(engine: str,
+                  bucket: str,
+                  basepath: str,
+                  identifier: str) -> tuple[str, str, str]:
+    """
+    Build the cache key for the object *identifier*, located at *basepath* in *bucket*.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the object
+    :param basepath: the path specifying where to locate the object
+    :param identifier: the object identifier
+    :return: the cache key
+    """
+    return engine, bucket, f"{Path(basepath) / identifier}"
+
+
+def _s3_cache_invalidate(engine: str,
+                         bucket: str,
+                         basepath: str,
+                         identifier: str | None) -> None:
+    """
+    Invalidate the cached information on, and the cached copy of, the object *identifier*.
+
+    If *identifier* is not provided, this applies to all objects under *basepath*.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the object(s)
+    :param basepath: the path specifying where to locate the object(s)
+    :param identifier: optional object identifier
+    """
+    for cache in [_S3_STAT_CACHE, _S3_OBJECT_CACHE]:
+        if cache and identifier:
+            cache.invalidate(key=_s3_cache_key(engine=engine,
+                                               bucket=bucket,
+                                               basepath=basepath,
+                                               identifier=identifier))
+        elif cache:
+            cache.invalidate_prefix(engine=engine,
+                                    bucket=bucket,
+                                    prefix=f"{Path(basepath)}")
+
+
+def _s3_stat_cache() -> _S3Cache | None:
+    """
+    Obtain the in-process cache of object information.
+
+    :return: the cache, or 'None' if it is not enabled
+    """
+    return _S3_STAT_CACHE
+
+
+def _s3_object_cache() -> _S3ObjectCache | None:
+    """
+    Obtain the in-process cache of objects.
+
+    :return: the cache, or 'None' if it is not enabled
+    """
+    return _S3_OBJECT_CACHE
+
+
+def _s3_key_under(key: tuple[str, str, str],
+                  engine: str,
+                  bucket: str,
+                  prefix: str) -> bool:
+    """
+    Determine whether the cache key *key* refers to an object located under *prefix*, in *bucket*.
+
+    :param key: the cache key, as a tuple *(engine, bucket, remotepath)*
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the objects
+    :param prefix: the path the objects are located under ('.' for the root of the bucket)
+    :return: 'True' if the object is located under *prefix*, 'False' otherwise
+    """
+    return key[0] == engine and key[1] == bucket and \
+        (prefix == "." or key[2] == prefix or key[2].startswith(f"{prefix}/"))
+
+
+def _s3_bloom_prefix(basepath: str) -> str:
+    """
+    Normalize *basepath* into the prefix the Bloom filters are keyed by.
+
+    :param basepath: the path specifying the location of the objects
+    :return: the normalized prefix ('.' for the root of the bucket)
+    """
+    return f"{Path(basepath)}"
+
+
+def _s3_bloom_start(engine: str,
+                    bucket: str,
+                    basepath: str,
+                    capacity: int,
+                    error_rate: float) -> _S3BloomFilter:
+    """
+    Start building a Bloom filter for the objects under *basepath*, in *bucket*.
+
+    Until it is registered with *_s3_bloom_register*, or discarded with *_s3_bloom_discard*, the filter
+    is pending: it is not used to report objects absent, but the objects stored meanwhile are added to it,
+    so that none of them goes missing from it, should they be stored after their names have been listed.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the objects
+    :param basepath: the path specifying the location of the objects
+    :param capacity: the expected number of objects under *basepath*
+    :param error_rate: the acceptable rate of false positives
+    :return: the pending filter
+    """
+    result: _S3BloomFilter = _S3BloomFilter(capacity=capacity,
+                                            error_rate=error_rate)
+    with _S3_BLOOM_LOCK:
+        _S3_BLOOM_PENDING.append(((engine, bucket, _s3_bloom_prefix(basepath=basepath)), result))
+
+    return result
+
+
+def _s3_bloom_register(engine: str,
+                       bucket: str,
+                       basepath: str,
+                       bloom: _S3BloomFilter) -> None:
+    """
+    Register the pending Bloom filter *bloom* for the objects under *basepath*, in *bucket*.
+
+    A filter previously registered for the same location is replaced.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the objects
+    :param basepath: the path specifying the location of the objects
+    :param bloom: the filter, as obtained from *_s3_bloom_start*
+    """
+    key: tuple[str, str, str] = (engine, bucket, _s3_bloom_prefix(basepath=basepath))
+    with _S3_BLOOM_LOCK:
+        _S3_BLOOM_PENDING.remove((key, bloom))
+        _S3_BLOOM_FILTERS[key] = bloom
+
+
+def _s3_bloom_discard(engine: str,
+                      bucket: str,
+                      basepath: str,
+                      bloom: _S3BloomFilter) -> None:
+    """
+    Discard the pending Bloom filter *bloom*, built for the objects under *basepath*, in *bucket*.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the objects
+    :param basepath: the path specifying the location of the objects
+    :param bloom: the filter, as obtained from *_s3_bloom_start*
+    """
+    with _S3_BLOOM_LOCK:
+        _S3_BLOOM_PENDING.remove(((engine, bucket, _s3_bloom_prefix(basepath=basepath)), bloom))
+
+
+def _s3_bloom_unregister(engine: str,
+                         bucket: str,
+                         basepath: str) -> None:
+    """
+    Discard the Bloom filter registered for the objects under *basepath*, in *bucket*.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the objects
+    :param basepath: the path specifying the location of the objects
+    """
+    with _S3_BLOOM_LOCK:
+        _S3_BLOOM_FILTERS.pop((engine, bucket, _s3_bloom_prefix(basepath=basepath)), None)
+
+
+def _s3_bloom_covering(engine: str,
+                       bucket: str,
+                       path: str,
+                       pending: bool = False) -> list[_S3BloomFilter]:
+    """
+    Obtain the Bloom filters registered for prefixes *path* is located under.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the object
+    :param path: the path of the object
+    :param pending: whether to include the filters being built (defaults to False)
+    :return: the Bloom filters covering *path*
+    """
+    with _S3_BLOOM_LOCK:
+        blooms: list[tuple[tuple[str, str, str], _S3BloomFilter]] = list(_S3_BLOOM_FILTERS.items())
+        if pending:
+            blooms.extend(_S3_BLOOM_PENDING)
+    return [bloom for (bloom_engine, bloom_bucket, prefix), bloom in blooms
+            if bloom_engine == engine and bloom_bucket == bucket and
+            (prefix == "." or path.startswith(f"{prefix}/"))]
+
+
+def _s3_bloom_absent(engine: str,
+                     bucket: str,
+                     basepath: str,
+                     identifier: str) -> bool:
+    """
+    Determine whether the object *identifier*, located at *basepath* in *bucket*, is definitely absent.
+
+    This is the case if a Bloom filter covering its location does not hold its path.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the object
+    :param basepath: the path specifying where to locate the object
+    :param identifier: the object identifier
+    :return: 'True' if the object is definitely absent, 'False' if it may be present
+    """
+    path: str = f"{Path(basepath) / identifier}"
+    return any(path not in bloom for bloom in _s3_bloom_covering(engine=engine,
+                                                                 bucket=bucket,
+                                                                 path=path))
+
+
+def _s3_bloom_add(engine: str,
+                  bucket: str,
+                  basepath: str,
+                  identifier: str) -> None:
+    """
+    Add the object *identifier*, located at *basepath* in *bucket*, to the Bloom filters covering its location.
+
+    The filters being built for prefixes covering its location are included.
+
+    :param engine: the reference S3 engine
+    :param bucket: the bucket holding the object
+    :param basepath: the path specifying where to locate the object
+    :param identifier: the object identifier
+    """
+    path: str = f"{Path(basepath) / identifier}"
+    for bloom in _s3_bloom_covering(engine=engine,
+                                    bucket=bucket,
+                                    path=path,
+                                    pending=True):
+        bloom.add(path)
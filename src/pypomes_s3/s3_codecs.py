@@ -0,0 +1,147 @@
+import pickle
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import Any, BinaryIO
+
+from .s3_common import _s3_get_param
+
+# the object metadata entry recording the codec the object was serialized with
+# (objects lacking it are taken to have been serialized with 'pickle')
+_S3_CODEC_META: str = "codec"
+
+# the codec used when none is specified for the call or for the engine
+_S3_CODEC_DEFAULT: str = "pickle"
+
+
+def _pickle_encode(obj: Any,
+                   stream: BinaryIO) -> None:
+    pickle.dump(obj, stream, protocol=5)
+
+
+def _msgpack_encode(obj: Any,
+                    stream: BinaryIO) -> None:
+    import msgpack
+    msgpack.pack(obj, stream)
+
+
+def _msgpack_decode(data: memoryview) -> Any:
+    import msgpack
+    return msgpack.unpackb(data)
+
+
+def _orjson_encode(obj: Any,
+                   stream: BinaryIO) -> None:
+    import orjson
+    stream.write(orjson.dumps(obj))
+
+
+def _orjson_decode(data: memoryview) -> Any:
+    import orjson
+    return orjson.loads(data)
+
+
+def _bytes_encode(obj: bytes,
+                  stream: BinaryIO) -> None:
+    stream.write(obj)
+
+
+# the registered codecs, as tuples (encoder, decoder, required package)
+_S3_CODECS: dict[str, tuple[Callable[[Any, BinaryIO], None], Callable[[memoryview], Any], str | None]] = {
+    "pickle": (_pickle_encode, pickle.loads, None),
+    "msgpack": (_msgpack_encode, _msgpack_decode, "msgpack"),
+    "orjson": (_orjson_encode, _orjson_decode, "orjson"),
+    "bytes": (_bytes_encode, bytes, None)
+}
+
+
+def s3_codec_register(name: str,
+                      encoder: Callable[[Any, BinaryIO], None],
+                      decoder: Callable[[memoryview], Any]) -> None:
+    """
+    Register a codec for serializing objects stored at, and retrieved from, the S3 store.
+
+    The codec becomes available for selection, per call or per engine, by its *name*,
+    which is recorded in the metadata of the objects it serializes. If a codec with
+    the same name is already registered, it is replaced.
+
+    :param name: the name of the codec
+    :param encoder: the function writing the serialization of an object to a binary stream
+    :param decoder: the function restoring an object from a bytes-like serialization
+    """
+    _S3_CODECS[name] = (encoder, decoder, None)
+
+
+def _assert_codec(errors: list[str],
+                  engine: str,
+                  codec: str | None) -> str:
+    """
+    Verify if *codec* is a registered codec, whose required package is available.
+
+    If *codec* is not provided, the codec configured for *engine*, or the default codec, is verified.
+
+    :param errors: incidental errors
+    :param engine: the reference S3 engine
+    :param codec: the codec to verify
+    :return: the validated codec
+    """
+    # initialize the return variable
+    result: str | None = None
+
+    curr_codec: str = _s3_codec(engine=engine,
+                                codec=codec)
+    if curr_codec not in _S3_CODECS:
+        errors.append(f"Codec '{curr_codec}' unknown")
+    elif _S3_CODECS[curr_codec][2] and not find_spec(_S3_CODECS[curr_codec][2]):
+        errors.append(f"Codec '{curr_codec}' requires the package '{_S3_CODECS[curr_codec][2]}'")
+    else:
+        result = curr_codec
+
+    return result
+
+
+def _s3_codec(engine: str,
+              codec: str | None) -> str:
+    """
+    Determine the codec to use, in the order *codec*, the codec configured for *engine*, and the default codec.
+
+    :param engine: the reference S3 engine
+    :param codec: the codec specified for the call
+    :return: the codec to use
+    """
+    return codec or _s3_get_param(engine, "codec") or _S3_CODEC_DEFAULT
+
+
+def _s3_encode(codec: str,
+               obj: Any,
+               stream: BinaryIO) -> None:
+    """
+    Write the serialization of *obj* with *codec* to *stream*.
+
+    :param codec: the codec to use
+    :param obj: the object to serialize
+    :param stream: the stream to write to
+    """
+    _S3_CODECS[codec][0](obj, stream)
+
+
+def _s3_decode(errors: list[str],
+               codec: str | None,
+               data: memoryview) -> Any:
+    """
+    Restore an object from its serialization with *codec*.
+
+    :param errors: incidental errors
+    :param codec: the codec recorded in the object's metadata, if any
+    :param data: the serialized object
+    :return: the restored object, or 'None' if *codec* is not registered
+    """
+    # initialize the return variable
+    result: Any = None
+
+    curr_codec: str = codec or _S3_CODEC_DEFAULT
+    if curr_codec in _S3_CODECS:
+        result = _S3_CODECS[curr_codec][1](data)
+    else:
+        errors.append(f"Codec '{curr_codec}' not registered")
+
+    return result
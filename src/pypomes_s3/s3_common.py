@@ -1,9 +1,17 @@
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime, timezone
+from itertools import islice
 from logging import DEBUG, Logger
 from pathlib import Path
+from queue import Full, Queue
+from tempfile import SpooledTemporaryFile
 from pypomes_core import (
     APP_PREFIX,
-    env_get_bool, env_get_str, str_sanitize, str_get_positional
+    env_get_bool, env_get_float, env_get_int, env_get_str, str_sanitize, str_get_positional
 )
+from threading import Event, Lock
 from typing import Any
 
 # - the preferred way to specify S3 storage parameters is dynamically with 's3_setup_params'
@@ -17,6 +25,24 @@ from typing import Any
 #     {APP_PREFIX}_S3_REGION_NAME (for aws)
 #     {APP_PREFIX}_S3_ENDPOINT_URL (for minio)
 #     {APP_PREFIX}_S3_SECURE_ACCESS (for minio)
+#   optionally, the connection pool may be tuned with
+#     {APP_PREFIX}_S3_POOL_SIZE (maximum number of connections kept in the pool)
+#     {APP_PREFIX}_S3_CONNECT_TIMEOUT (in seconds)
+#     {APP_PREFIX}_S3_READ_TIMEOUT (in seconds)
+#     {APP_PREFIX}_S3_KEEP_ALIVE (whether to enable TCP keep-alive on pooled connections)
+#     {APP_PREFIX}_S3_MAX_RETRIES (maximum number of retries on connection and server errors)
+#   and the transfer of large files may be tuned with
+#     {APP_PREFIX}_S3_MULTIPART_THRESHOLD (size in bytes from which transfers are done in parts)
+#     {APP_PREFIX}_S3_PART_SIZE (size in bytes of each part)
+#     {APP_PREFIX}_S3_MAX_CONCURRENCY (maximum number of parts transferred, or requests issued, concurrently)
+#   and the in-memory serialization of objects may be bounded with
+#     {APP_PREFIX}_S3_SPOOL_THRESHOLD (size in bytes from which serialized objects are spooled to disk)
+#   and serialized with
+#     {APP_PREFIX}_S3_CODEC (one of 'pickle', 'msgpack', 'orjson', 'bytes', or a registered codec)
+#   and objects and files may be compressed upon storage with
+#     {APP_PREFIX}_S3_COMPRESSION (one of 'gzip', 'lz4', 'zstd')
+#     {APP_PREFIX}_S3_COMPRESSION_LEVEL (the compression level)
+#     {APP_PREFIX}_S3_COMPRESSION_CUTOFF (size in bytes from which payloads are compressed)
 #   2. alternatively, specify a comma-separated list of servers in
 #     {APP_PREFIX}_S3_ENGINES
 #     and, for each engine, specify the set above, replacing 'S3' with
@@ -25,6 +51,60 @@ from typing import Any
 _S3_ACCESS_DATA: dict = {}
 _S3_ENGINES: list[str] = []
 
+# registry of long-lived clients, keyed by engine and access parameters
+# (clients from both 'minio' and 'boto3' are thread-safe, and may be freely shared among threads)
+_S3_CLIENTS: dict[tuple, Any] = {}
+_S3_CLIENTS_LOCK: Lock = Lock()
+
+# the access parameters the clients are created with
+_S3_CLIENT_PARAMS: list[str] = [
+    "endpoint-url", "access-key", "secret-key", "region-name", "secure-access",
+    "pool-size", "max-concurrency", "connect-timeout", "read-timeout", "keep-alive", "max-retries"
+]
+
+# default size in bytes from which serialized objects are spooled to disk
+_S3_SPOOL_THRESHOLD: int = 32 * 1024 * 1024
+
+# default maximum number of parts transferred, or requests issued, concurrently
+_S3_MAX_CONCURRENCY: int = 10
+
+# default size in bytes of the parts in multipart and ranged transfers
+_S3_PART_SIZE: int = 8 * 1024 * 1024
+
+# default size in bytes from which uploads are done in multiple parts
+_S3_MULTIPART_THRESHOLD: int = 16 * 1024 * 1024
+
+# limits imposed by the S3 protocol on multipart uploads
+_S3_MIN_PART_SIZE: int = 5 * 1024 * 1024
+_S3_MAX_PART_SIZE: int = 5 * 1024 * 1024 * 1024
+_S3_MAX_PARTS: int = 10000
+
+# maximum number of keys accepted by a multi-object delete request
+_S3_DELETE_BATCH: int = 1000
+
+# maximum number of entries in each page of the listings returned by S3 stores
+_S3_LIST_PAGE_MAX: int = 1000
+
+# number of entries in the batches produced by concurrent listings
+_S3_LIST_BATCH: int = 1000
+
+# estimated cost of requesting a page of a listing, in requests for the information about an object
+# (a listing request is both priced and timed at about ten times a HEAD request)
+_S3_LIST_COST: int = 10
+
+# default number of batches held per producer, awaiting consumption (see '_s3_merge')
+_S3_MERGE_BUFFER: int = 4
+
+# serializes positioned writes, on platforms lacking 'os.pwrite'
+_S3_PWRITE_LOCK: Lock = Lock()
+
+# returned by conditional retrievals, when the copy at hand of the object is still current
+S3_NOT_MODIFIED: object = object()
+
+# the requests in flight, shared by concurrent identical calls (see '_s3_single_flight')
+_S3_IN_FLIGHT: dict[tuple, Future] = {}
+_S3_IN_FLIGHT_LOCK: Lock = Lock()
+
 _prefix: str = env_get_str(f"{APP_PREFIX}_S3_ENGINE",  None)
 if _prefix:
     _default_setup: bool = True
@@ -46,10 +126,23 @@ for engine in _S3_ENGINES:
         "access-key":  env_get_str(f"{APP_PREFIX}_{_tag}_ACCESS_KEY"),
         "secret-key": env_get_str(f"{APP_PREFIX}_{_tag}_SECRET_KEY"),
         "bucket-name": env_get_str(f"{APP_PREFIX}_{_tag}_BUCKET_NAME"),
-        "temp-folder": Path(env_get_str(f"{APP_PREFIX}_{_tag}_TEMP_FOLDER"))
+        "temp-folder": Path(env_get_str(f"{APP_PREFIX}_{_tag}_TEMP_FOLDER")),
+        "pool-size": env_get_int(f"{APP_PREFIX}_{_tag}_POOL_SIZE"),
+        "connect-timeout": env_get_float(f"{APP_PREFIX}_{_tag}_CONNECT_TIMEOUT"),
+        "read-timeout": env_get_float(f"{APP_PREFIX}_{_tag}_READ_TIMEOUT"),
+        "keep-alive": env_get_bool(f"{APP_PREFIX}_{_tag}_KEEP_ALIVE"),
+        "max-retries": env_get_int(f"{APP_PREFIX}_{_tag}_MAX_RETRIES"),
+        "multipart-threshold": env_get_int(f"{APP_PREFIX}_{_tag}_MULTIPART_THRESHOLD"),
+        "part-size": env_get_int(f"{APP_PREFIX}_{_tag}_PART_SIZE"),
+        "max-concurrency": env_get_int(f"{APP_PREFIX}_{_tag}_MAX_CONCURRENCY"),
+        "spool-threshold": env_get_int(f"{APP_PREFIX}_{_tag}_SPOOL_THRESHOLD"),
+        "codec": env_get_str(f"{APP_PREFIX}_{_tag}_CODEC"),
+        "compression": env_get_str(f"{APP_PREFIX}_{_tag}_COMPRESSION"),
+        "compression-level": env_get_int(f"{APP_PREFIX}_{_tag}_COMPRESSION_LEVEL"),
+        "compression-cutoff": env_get_int(f"{APP_PREFIX}_{_tag}_COMPRESSION_CUTOFF")
     }
     if engine == "aws":
-        _s3_data["client"] = env_get_str(f"{APP_PREFIX}_{_tag}_REGION_NAME")
+        _s3_data["region-name"] = env_get_str(f"{APP_PREFIX}_{_tag}_REGION_NAME")
     elif engine == "minio":
         _s3_data["endpoint-url"] = env_get_str(f"{APP_PREFIX}_{_tag}_ENDPOINT_URL")
         _s3_data["secure-access"] = env_get_bool(f"{APP_PREFIX}_{_tag}_SECURE_ACCESS")
@@ -122,6 +215,519 @@ def _s3_get_params(engine: str) -> tuple:
     return result
 
 
+def _s3_get_client(engine: str) -> Any:
+    """
+    Return the registered client for the current configuration of *engine*, if one exists.
+
+    :param engine: the reference S3 engine
+    :return: the registered client, or 'None' if no client is registered for the current configuration
+    """
+    return _S3_CLIENTS.get(_s3_client_key(engine=engine))
+
+
+def _s3_register_client(engine: str,
+                        client: Any) -> Any:
+    """
+    Register *client* as the long-lived client for the current configuration of *engine*.
+
+    If another thread has concurrently registered a client for the same configuration,
+    that client prevails, and is returned instead.
+
+    :param engine: the reference S3 engine
+    :param client: the client to register
+    :return: the client registered for the current configuration of *engine*
+    """
+    with _S3_CLIENTS_LOCK:
+        return _S3_CLIENTS.setdefault(_s3_client_key(engine=engine), client)
+
+
+def _s3_invalidate_clients(engine: str) -> None:
+    """
+    Discard all clients registered for *engine*.
+
+    :param engine: the reference S3 engine
+    """
+    with _S3_CLIENTS_LOCK:
+        for key in [key for key in _S3_CLIENTS if key[0] == engine]:
+            _S3_CLIENTS.pop(key)
+
+
+def _s3_client_key(engine: str) -> tuple:
+    """
+    Build the registry key for the current configuration of *engine*.
+
+    The key holds only the parameters the clients are created with, so that changes to the other
+    parameters do not lead to the creation of new clients.
+
+    :param engine: the reference S3 engine
+    :return: the registry key
+    """
+    return engine, *(_S3_ACCESS_DATA[engine].get(param) for param in _S3_CLIENT_PARAMS)
+
+
+def _s3_spool(engine: str) -> SpooledTemporaryFile:
+    """
+    Create a buffer for serializing objects, to be uploaded to *engine*.
+
+    The buffer is held in memory, until its contents exceed the configured spool threshold.
+    At that point, it is transparently moved to a temporary file in *engine*'s temp folder,
+    which is removed as soon as the buffer is closed.
+
+    :param engine: the reference S3 engine
+    :return: the spooled buffer
+    """
+    return SpooledTemporaryFile(max_size=_s3_get_param(engine, "spool-threshold") or _S3_SPOOL_THRESHOLD,
+                                mode="w+b",
+                                dir=_s3_get_param(engine, "temp-folder"))
+
+
+def _s3_read_body(stream: Any,
+                  length: int,
+                  buffer: bytearray = None) -> memoryview:
+    """
+    Read the *length* bytes of an object's contents from *stream*.
+
+    The contents are read directly into *buffer*, if it is provided and is large enough to hold them,
+    or else into a buffer allocated with the exact size required.
+
+    :param stream: the stream to read from, as obtained from the S3 engine
+    :param length: the size in bytes of the object's contents
+    :param buffer: optional preallocated buffer to read the contents into
+    :return: a view on the contents read
+    """
+    # initialize the return variable
+    result: memoryview = memoryview(buffer if buffer is not None and len(buffer) >= length
+                                    else bytearray(length))[:length]
+    offset: int = 0
+    while offset < length:
+        count: int = stream.readinto(result[offset:])
+        if not count:
+            raise EOFError(f"Stream ended after {offset} of {length} bytes")
+        offset += count
+
+    return result
+
+
+def _s3_upload_policy(engine: str,
+                      size: int,
+                      part_size: int = None,
+                      parallel_parts: int = None) -> tuple[int, int]:
+    """
+    Determine the part size, and the number of parts uploaded concurrently, for uploading *size* bytes to *engine*.
+
+    Values provided for *part_size* and *parallel_parts* prevail, with the part size kept within
+    the 5 MiB to 5 GiB range accepted by S3 stores. Otherwise, contents not larger than
+    the multipart threshold are uploaded in a single part, thus avoiding the overhead of multipart uploads.
+    Larger contents are split into parts of the configured part size, enlarged as needed to keep within
+    the maximum number of parts per upload, and these are uploaded concurrently, up to the configured
+    maximum concurrency.
+
+    :param engine: the reference S3 engine
+    :param size: the size in bytes of the contents to upload
+    :param part_size: optional size in bytes of each part
+    :param parallel_parts: optional number of parts uploaded concurrently
+    :return: the part size, and the number of parts uploaded concurrently
+    """
+    if not part_size:
+        threshold: int = _s3_get_param(engine, "multipart-threshold") or _S3_MULTIPART_THRESHOLD
+        if size <= threshold:
+            # upload in a single part
+            part_size = max(size, _S3_MIN_PART_SIZE)
+        else:
+            # upload in parts, rounded up to whole MiBs
+            part_size = max(_s3_get_param(engine, "part-size") or _S3_PART_SIZE,
+                            -(-size // _S3_MAX_PARTS),
+                            _S3_MIN_PART_SIZE)
+            part_size = -(-part_size // (1024 * 1024)) * 1024 * 1024
+    # keep within the part sizes accepted by S3 stores
+    part_size = min(max(part_size, _S3_MIN_PART_SIZE), _S3_MAX_PART_SIZE)
+
+    if not parallel_parts:
+        parallel_parts = min(_s3_get_param(engine, "max-concurrency") or _S3_MAX_CONCURRENCY,
+                             max(1, -(-size // part_size)))
+
+    return part_size, parallel_parts
+
+
+def _s3_batches(items: Iterable,
+                size: int) -> Iterator[list]:
+    """
+    Split *items* into lists of at most *size* elements, as they are iterated on.
+
+    :param items: the items to split
+    :param size: the maximum size of each list
+    :return: an iterator into the lists
+    """
+    iterator: Iterator = iter(items)
+    batch: list = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
+
+
+def _s3_pipeline(batches: Iterator[list],
+                 func: Callable[[list], dict],
+                 max_workers: int,
+                 results: dict) -> None:
+    """
+    Apply *func* to each batch yielded by *batches*, in a pool of up to *max_workers* threads.
+
+    The batches are processed as soon as they are yielded, thus overlapping their production
+    (typically, paging through a listing) with their processing. At most *max_workers* batches
+    are kept in flight at any time. The *dict* returned by each invocation of *func* is merged
+    into *results*, which retains the partial results should *batches* raise an exception.
+
+    :param batches: the batches to process
+    :param func: the function to apply to each batch
+    :param max_workers: the maximum number of batches processed concurrently
+    :param results: the *dict* to merge the results into
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: set[Future] = set()
+        try:
+            for batch in batches:
+                pending.add(executor.submit(func, batch))
+                # bound the number of batches in flight
+                if len(pending) >= max_workers:
+                    done, pending = wait(fs=pending,
+                                         return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results.update(future.result())
+        finally:
+            for future in wait(fs=pending).done:
+                results.update(future.result())
+
+
+def _s3_fan_out(func: Callable[[Any], Any],
+                items: Iterable,
+                max_workers: int,
+                in_order: bool = True) -> Iterator[tuple[Any, Any]]:
+    """
+    Apply *func* to each element of *items*, in a pool of up to *max_workers* threads.
+
+    The invocations of *func* are submitted before this function returns, and thus proceed regardless
+    of the iteration on the results. The pairs *(item, result)* are yielded in the order of *items*,
+    if *in_order* is set, or else as the invocations of *func* complete. Should the iteration be abandoned,
+    the invocations not yet started are cancelled.
+
+    :param func: the function to apply to each item
+    :param items: the items to apply the function to
+    :param max_workers: the maximum number of items processed concurrently
+    :param in_order: whether to yield the results in the order of *items* (defaults to True)
+    :return: an iterator into the pairs *(item, result)*
+    """
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures: dict[Future, Any] = {executor.submit(func, item): item for item in items}
+    except Exception:
+        executor.shutdown(wait=True,
+                          cancel_futures=True)
+        raise
+
+    return _s3_fan_in(executor=executor,
+                      futures=futures,
+                      in_order=in_order)
+
+
+def _s3_fan_in(executor: ThreadPoolExecutor,
+               futures: dict[Future, Any],
+               in_order: bool) -> Iterator[tuple[Any, Any]]:
+    """
+    Yield the pairs *(item, result)* of the invocations in *futures*, shutting down *executor* at the end.
+
+    :param executor: the pool of threads the invocations were submitted to
+    :param futures: the invocations, mapped to their items
+    :param in_order: whether to yield the results in the order of submission
+    :return: an iterator into the pairs *(item, result)*
+    """
+    try:
+        for future in futures if in_order else as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        executor.shutdown(wait=True,
+                          cancel_futures=True)
+
+
+def _s3_single_flight(errors: list[str],
+                      key: tuple,
+                      func: Callable[..., Any]) -> Any:
+    """
+    Invoke *func*, unless an invocation for *key* is already in flight, in which case its outcome is shared.
+
+    The first caller for *key* invokes *func*, with the keyword argument *errors*, while the concurrent
+    callers for the same *key* wait for it to complete. All of them then obtain the same result,
+    and the same error messages, or have the same exception raised, as the case may be.
+
+    :param errors: incidental error messages
+    :param key: the key identifying the invocation
+    :param func: the function to invoke
+    :return: the result of the invocation
+    """
+    with _S3_IN_FLIGHT_LOCK:
+        future: Future | None = _S3_IN_FLIGHT.get(key)
+        leader: bool = future is None
+        if leader:
+            future = Future()
+            _S3_IN_FLIGHT[key] = future
+
+    # is this the first caller for the key ?
+    if leader:
+        # yes, invoke the function on behalf of all callers
+        try:
+            func_errors: list[str] = []
+            future.set_result((func(errors=func_errors), func_errors))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with _S3_IN_FLIGHT_LOCK:
+                _S3_IN_FLIGHT.pop(key, None)
+
+    result, func_errors = future.result()
+    errors.extend(func_errors)
+
+    return result
+
+
+def _s3_merge(producers: list[Callable[[], Iterable[list]]],
+              max_workers: int,
+              in_order: bool,
+              buffer_size: int = _S3_MERGE_BUFFER) -> Iterator[Any]:
+    """
+    Invoke *producers* in a pool of up to *max_workers* threads, yielding the elements in the batches they produce.
+
+    Each producer is invoked with no arguments, and must return an iterable of batches (lists) of elements.
+    The elements are yielded in the order of *producers*, and in the order each produces them,
+    if *in_order* is set, or else as the batches become available. Up to *buffer_size* batches
+    per producer are held awaiting consumption, after which the producer waits, thus bounding
+    the memory in use. Should a producer fail, its exception is raised. Should the iteration
+    be abandoned, the producers are stopped.
+
+    :param producers: the functions producing the batches of elements
+    :param max_workers: the maximum number of producers invoked concurrently
+    :param in_order: whether to yield the elements in the order of *producers*
+    :param buffer_size: the number of batches held per producer, awaiting consumption
+    :return: an iterator into the elements produced
+    """
+    stop: Event = Event()
+    queues: list[Queue] = ([Queue(maxsize=buffer_size) for _ in producers] if in_order
+                           else [Queue(maxsize=buffer_size * max_workers)])
+
+    def put(queue: Queue,
+            item: tuple[str, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(item=item,
+                          timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce(index: int) -> None:
+        queue: Queue = queues[index if in_order else 0]
+        try:
+            for batch in producers[index]():
+                if not put(queue=queue,
+                           item=("batch", batch)):
+                    return
+            put(queue=queue,
+                item=("done", None))
+        except BaseException as e:
+            put(queue=queue,
+                item=("error", e))
+
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for index in range(len(producers)):
+            executor.submit(produce, index)
+        pending: int = len(producers)
+        while pending:
+            # with *in_order* set, the producers are drained one at a time, in their order
+            kind, payload = queues[len(producers) - pending if in_order else 0].get()
+            if kind == "batch":
+                yield from payload
+            elif kind == "done":
+                pending -= 1
+            else:
+                raise payload
+    finally:
+        stop.set()
+        executor.shutdown(wait=True,
+                          cancel_futures=True)
+
+
+def _s3_ranged_download(filepath: Path | str,
+                        size: int,
+                        fetch: Callable[[int, int], Iterable[bytes]],
+                        part_size: int,
+                        max_workers: int) -> None:
+    """
+    Download the *size* bytes of an object's contents into *filepath*, by fetching byte ranges concurrently.
+
+    The file is preallocated with its final size, and each range is written at its own offset
+    as its chunks arrive, without any intermediate buffering or reassembly. *fetch* is invoked
+    with the first and last byte positions of a range, and must yield the chunks in that range.
+    Should any range fail, or yield other than its own number of bytes, the file is removed,
+    and the corresponding exception is raised.
+
+    :param filepath: the path to save the object's contents at
+    :param size: the size in bytes of the object's contents
+    :param fetch: the function to obtain the chunks in a byte range
+    :param part_size: the size in bytes of each range
+    :param max_workers: the maximum number of ranges fetched concurrently
+    """
+    fd: int = os.open(filepath, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0))
+    try:
+        # preallocate the file
+        if hasattr(os, "posix_fallocate") and size > 0:
+            os.posix_fallocate(fd, 0, size)
+        else:
+            os.ftruncate(fd, size)
+
+        def fetch_range(start: int) -> None:
+            end: int = min(start + part_size, size) - 1
+            offset: int = start
+            for chunk in fetch(start, end):
+                _s3_pwrite(fd=fd,
+                           data=chunk,
+                           offset=offset)
+                offset += len(chunk)
+            if offset != end + 1:
+                raise EOFError(f"Range {start}-{end} ended after {offset - start} bytes")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(fetch_range, start) for start in range(0, size, part_size)]:
+                future.result()
+    except Exception:
+        os.close(fd)
+        Path(filepath).unlink(missing_ok=True)
+        raise
+    os.close(fd)
+
+
+def _s3_stream_download(filepath: Path | str,
+                        chunks: Iterable[bytes]) -> None:
+    """
+    Download an object's contents into *filepath*, by writing *chunks* sequentially, as they arrive.
+
+    The contents are written to a temporary file alongside *filepath*, which is moved into place
+    only once all the chunks have been written. Should the download fail, the temporary file
+    is removed, and the corresponding exception is raised.
+
+    :param filepath: the path to save the object's contents at
+    :param chunks: the chunks of the object's contents
+    """
+    partpath: Path = Path(f"{filepath}.part")
+    try:
+        with partpath.open(mode="wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(partpath, filepath)
+    except Exception:
+        partpath.unlink(missing_ok=True)
+        raise
+
+
+def _s3_pwrite(fd: int,
+               data: bytes,
+               offset: int) -> None:
+    """
+    Write all of *data* to the file descriptor *fd*, at position *offset*.
+
+    On platforms lacking *os.pwrite*, the seek and write operations are serialized with a lock.
+
+    :param fd: the file descriptor
+    :param data: the data to write
+    :param offset: the position to write the data at
+    """
+    view: memoryview = memoryview(data)
+    if hasattr(os, "pwrite"):
+        while view:
+            count: int = os.pwrite(fd, view, offset)
+            view = view[count:]
+            offset += count
+    else:
+        with _S3_PWRITE_LOCK:
+            os.lseek(fd, offset, os.SEEK_SET)
+            while view:
+                view = view[os.write(fd, view):]
+
+
+def _s3_entry_name(entry: Any) -> str:
+    """
+    Obtain the name of an entry yielded by listing objects, regardless of the S3 engine it came from.
+
+    :param entry: the listing entry (a *MinIO* object, or an *AWS* dictionary)
+    :return: the name of the object, or of the folder, the entry refers to
+    """
+    return (entry.get("Key") or entry.get("Prefix")) if isinstance(entry, dict) else entry.object_name
+
+
+def _s3_entry_is_folder(entry: Any) -> bool:
+    """
+    Determine whether an entry yielded by listing objects refers to a folder, regardless of the S3 engine it came from.
+
+    :param entry: the listing entry (a *MinIO* object, or an *AWS* dictionary)
+    :return: 'True' if the entry refers to a folder, 'False' otherwise
+    """
+    return "Prefix" in entry if isinstance(entry, dict) else entry.is_dir
+
+
+def _s3_entry_size(entry: Any) -> int:
+    """
+    Obtain the size of an entry yielded by listing objects, regardless of the S3 engine it came from.
+
+    :param entry: the listing entry (a *MinIO* object, or an *AWS* dictionary)
+    :return: the size in bytes of the object the entry refers to (0, for folders)
+    """
+    return (entry.get("Size") if isinstance(entry, dict) else entry.size) or 0
+
+
+def _s3_stat_etag(stat: Any) -> str:
+    """
+    Obtain the *ETag* from the information about an object, regardless of the S3 engine it came from.
+
+    :param stat: the information about the object (a *MinIO* object, or an *AWS* dictionary)
+    :return: the object's ETag, without the enclosing quotes
+    """
+    return (stat.get("ETag") if isinstance(stat, dict) else stat.etag).strip('"')
+
+
+def _s3_not_modified(stat: Any,
+                     etag: str | None,
+                     modified_since: datetime | None) -> bool:
+    """
+    Determine whether the copy at hand of an object is still current, as per its *ETag* or its moment of retrieval.
+
+    As with HTTP conditional requests, *modified_since* is considered only if *etag* is not provided.
+
+    :param stat: the information about the object (a *MinIO* object, or an *AWS* dictionary)
+    :param etag: the ETag of the copy at hand of the object
+    :param modified_since: the moment the copy at hand of the object was obtained
+    :return: 'True' if the copy at hand of the object is still current, 'False' otherwise
+    """
+    # initialize the return variable
+    result: bool = False
+
+    if etag:
+        result = _s3_stat_etag(stat=stat) == etag.strip('"')
+    elif modified_since:
+        last_modified: datetime = stat.get("LastModified") if isinstance(stat, dict) else stat.last_modified
+        result = last_modified is not None and last_modified <= _s3_utc(moment=modified_since)
+
+    return result
+
+
+def _s3_utc(moment: datetime) -> datetime:
+    """
+    Express *moment* in UTC, taking it to be in UTC already if it carries no timezone.
+
+    :param moment: the moment to express
+    :return: the moment, in UTC
+    """
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+
+
 def _s3_except_msg(errors: list[str],
                    exception: Exception,
                    engine: str,
@@ -0,0 +1,163 @@
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from typing import BinaryIO
+
+from .s3_common import _s3_get_param, _s3_spool
+
+# the object metadata entry recording the algorithm the object was compressed with
+# (objects lacking it are taken to be uncompressed)
+_S3_COMPRESSION_META: str = "compression"
+
+# default size in bytes from which payloads are compressed
+_S3_COMPRESSION_CUTOFF: int = 4 * 1024
+
+# size in bytes of the chunks fed to the compressors
+_S3_COMPRESSION_CHUNK: int = 1024 * 1024
+
+
+def _gzip_compress(chunks: Iterable[bytes],
+                   level: int | None) -> Iterator[bytes]:
+    compressor = zlib.compressobj(level=-1 if level is None else level,
+                                  wbits=31)
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _gzip_decompress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj(wbits=31)
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+    yield decompressor.flush()
+
+
+def _zstd_compress(chunks: Iterable[bytes],
+                   level: int | None) -> Iterator[bytes]:
+    import zstandard
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _zstd_decompress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    import zstandard
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+
+
+def _lz4_compress(chunks: Iterable[bytes],
+                  level: int | None) -> Iterator[bytes]:
+    import lz4.frame
+    compressor = lz4.frame.LZ4FrameCompressor(compression_level=level or 0)
+    yield compressor.begin()
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _lz4_decompress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    import lz4.frame
+    decompressor = lz4.frame.LZ4FrameDecompressor()
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+
+
+# the supported compression algorithms, as tuples (compressor, decompressor)
+_S3_COMPRESSIONS: dict[str, tuple[Callable[[Iterable[bytes], int | None], Iterator[bytes]],
+                                  Callable[[Iterable[bytes]], Iterator[bytes]]]] = {
+    "gzip": (_gzip_compress, _gzip_decompress),
+    "zstd": (_zstd_compress, _zstd_decompress),
+    "lz4": (_lz4_compress, _lz4_decompress)
+}
+
+
+def _assert_compression(errors: list[str],
+                        engine: str) -> bool:
+    """
+    Verify if the compression algorithm configured for *engine*, if any, is a supported algorithm.
+
+    :param errors: incidental errors
+    :param engine: the reference S3 engine
+    :return: 'True' if no algorithm is configured, or if it is supported, 'False' otherwise
+    """
+    compression: str = _s3_get_param(engine, "compression")
+    result: bool = not compression or compression in _S3_COMPRESSIONS
+    if not result:
+        errors.append(f"Compression '{compression}' unknown")
+
+    return result
+
+
+def _s3_compression(engine: str,
+                    size: int) -> str | None:
+    """
+    Determine the algorithm to compress a payload of *size* bytes with, as configured for *engine*.
+
+    :param engine: the reference S3 engine
+    :param size: the size in bytes of the payload
+    :return: the compression algorithm, or 'None' if the payload is not to be compressed
+    """
+    # initialize the return variable
+    result: str | None = None
+
+    compression: str = _s3_get_param(engine, "compression")
+    if compression and size >= (_s3_get_param(engine, "compression-cutoff") or _S3_COMPRESSION_CUTOFF):
+        result = compression
+
+    return result
+
+
+@contextmanager
+def _s3_compressed(engine: str,
+                   source: BinaryIO,
+                   size: int) -> Iterator[tuple[BinaryIO, int, str | None]]:
+    """
+    Provide the content of *source*, compressed as configured for *engine*.
+
+    If the content is to be compressed, it is compressed into a spooled temporary file,
+    and *(spool, compressed size, compression algorithm)* is yielded. Otherwise,
+    *(source, size, None)* is yielded.
+
+    :param engine: the reference S3 engine
+    :param source: the stream holding the content, positioned at its start
+    :param size: the size in bytes of the content
+    :return: the stream to read the content from, its size, and the compression algorithm
+    """
+    compression: str = _s3_compression(engine=engine,
+                                       size=size)
+    if compression:
+        with _s3_spool(engine=engine) as target:
+            compress: Callable = _S3_COMPRESSIONS[compression][0]
+            for chunk in compress(iter(partial(source.read, _S3_COMPRESSION_CHUNK), b""),
+                                  _s3_get_param(engine, "compression-level")):
+                target.write(chunk)
+            length: int = target.tell()
+            target.seek(0)
+            yield target, length, compression
+    else:
+        yield source, size, None
+
+
+def _s3_decompress(compression: str | None,
+                   chunks: Iterable[bytes]) -> Iterable[bytes]:
+    """
+    Decompress *chunks*, as they are consumed, with the algorithm recorded in the object's metadata.
+
+    :param compression: the compression algorithm recorded in the object's metadata, if any
+    :param chunks: the chunks of the object's content
+    :return: the decompressed chunks, or *chunks* itself, if the object is not compressed
+    :raises ValueError: if *compression* is not a supported algorithm
+    """
+    # initialize the return variable
+    result: Iterable[bytes] = chunks
+
+    if compression:
+        if compression not in _S3_COMPRESSIONS:
+            raise ValueError(f"Compression '{compression}' not registered")
+        result = _S3_COMPRESSIONS[compression][1](chunks)
+
+    return result
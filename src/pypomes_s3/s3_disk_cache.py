@@ -0,0 +1,402 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from .s3_common import S3_NOT_MODIFIED, _s3_single_flight, _s3_stat_etag
+
+try:
+    import fcntl
+except ImportError:
+    # file locking is not available (e.g., on Windows), the cache is shared among threads only
+    fcntl = None
+
+# default maximum size in bytes of the contents held in the local disk cache
+_S3_DISK_CACHE_SIZE: int = 1024 * 1024 * 1024
+
+# number of locks the entries of the cached objects are distributed among, within this process
+_S3_DISK_CACHE_STRIPES: int = 64
+
+
+class _S3DiskCache:
+    """
+    A read-through cache of file contents on local disk, which may be shared among processes on the same host.
+
+    For each cached object, the folder holds:
+      - *<name>.stat*: the object's ETag, size, and moment of last modification, as a JSON record
+      - *<name>.<etag hash>.data*: the object's contents, as of the ETag in that information
+      - *<name>.lock*: the lock file serializing the access to the object's entries, removed along with them
+    where *<name>* is a hash of the engine, bucket, and object path. Files are written to temporary files
+    in the same folder, and renamed into place, so that their contents are never seen partially written.
+    """
+
+    def __init__(self,
+                 folder: Path,
+                 max_size: int) -> None:
+        """
+        Initialize the cache.
+
+        :param folder: the folder holding the cache's contents
+        :param max_size: the maximum size in bytes of the contents held
+        """
+        self.folder: Path = folder
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._lock: Lock = Lock()
+        self._key_locks: list[Lock] = [Lock() for _ in range(_S3_DISK_CACHE_STRIPES)]
+        folder.mkdir(parents=True,
+                     exist_ok=True)
+
+    @contextmanager
+    def _locked(self,
+                name: str,
+                blocking: bool = True) -> Iterator[bool]:
+        """
+        Hold the lock for the entries of the object *name*, among the threads in this process and among processes.
+
+        :param name: the name of the object's entries
+        :param blocking: whether to wait for the lock, if it is held elsewhere
+        :return: whether the lock was acquired
+        """
+        # the entries of several objects may share the same lock among the threads in this process
+        key_lock: Lock = self._key_locks[int(name[:8], 16) % _S3_DISK_CACHE_STRIPES]
+        if key_lock.acquire(blocking=blocking):
+            try:
+                if fcntl:
+                    with (self.folder / f"{name}.lock").open(mode="a") as f:
+                        try:
+                            fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        except BlockingIOError:
+                            yield False
+                        else:
+                            try:
+                                yield True
+                            finally:
+                                fcntl.flock(f, fcntl.LOCK_UN)
+                else:
+                    yield True
+            finally:
+                key_lock.release()
+        else:
+            yield False
+
+    def retrieve(self,
+                 errors: list[str],
+                 key: tuple[str, str, str],
+                 filepath: Path | str,
+                 fetch: Callable[..., Any]) -> Any:
+        """
+        Copy the contents of the object identified by *key* into *filepath*, fetching them only if needed.
+
+        *fetch* is invoked with the keyword arguments *errors*, *filepath*, the path to retrieve the object into,
+        and *etag*, the ETag of the cached contents, if any. It must return *S3_NOT_MODIFIED* if these
+        contents are still current, the information about the object if it was retrieved, or 'None'
+        if it could not be retrieved. The lock on the object's entries is held only for inspecting and
+        publishing them, and not while fetching the object, whereas the concurrent calls for the same object
+        in this process share a single fetch. If the cached contents are used, the information returned
+        is limited to the object's ETag, size, and moment of last modification.
+
+        :param errors: incidental error messages
+        :param key: the key of the object, as a tuple *(engine, bucket, remotepath)*
+        :param filepath: the path to save the object's contents at
+        :param fetch: the function to retrieve, or revalidate, the object
+        :return: information about the object, or 'None' if it could not be retrieved
+        """
+        # initialize the return variable
+        result: Any = None
+
+        name: str = hashlib.sha256("\0".join(key).encode()).hexdigest()
+        # bring the cached contents up to date, sharing the fetch with the concurrent calls for the object
+        record: dict[str, Any] | None = _s3_single_flight(errors=errors,
+                                                          key=("disk-cache", f"{self.folder}", name),
+                                                          func=partial(self._refresh,
+                                                                       name=name,
+                                                                       fetch=fetch))
+        if record is not None:
+            # copy the cached contents into place
+            with self._locked(name=name):
+                datapath: Path = self._datapath(name=name,
+                                                etag=record["etag"])
+                copied: bool = datapath.exists()
+                if copied:
+                    shutil.copyfile(datapath, filepath)
+            if copied:
+                result = _stat_restore(key=key,
+                                       record=record)
+            else:
+                # the contents have been evicted meanwhile, retrieve the object directly
+                result = fetch(errors=errors,
+                               filepath=filepath,
+                               etag=None)
+
+        return result
+
+    def _refresh(self,
+                 errors: list[str],
+                 name: str,
+                 fetch: Callable[..., Any]) -> dict[str, Any] | None:
+        """
+        Bring the cached contents of the object *name* up to date, fetching the object if needed.
+
+        :param errors: incidental error messages
+        :param name: the name of the object's entries
+        :param fetch: the function to retrieve, or revalidate, the object
+        :return: the record of the current contents, or 'None' if the object could not be retrieved
+        """
+        statpath: Path = self.folder / f"{name}.stat"
+        temppath: Path = self.folder / f"{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        # obtain the record of the cached contents, if any
+        with self._locked(name=name):
+            record: dict[str, Any] | None = _record_read(statpath=statpath)
+            if record and not self._datapath(name=name,
+                                             etag=record["etag"]).exists():
+                record = None
+        try:
+            reply: Any = fetch(errors=errors,
+                               filepath=temppath,
+                               etag=record["etag"] if record else None)
+            # are the cached contents still current ?
+            if reply is S3_NOT_MODIFIED:
+                # yes, mark them as recently used
+                with self._locked(name=name):
+                    datapath: Path = self._datapath(name=name,
+                                                    etag=record["etag"])
+                    if datapath.exists():
+                        os.utime(datapath)
+                with self._lock:
+                    self.hits += 1
+            # were the contents retrieved ?
+            elif reply is not None:
+                # yes, publish them, replacing the outdated ones
+                record = _stat_record(stat=reply)
+                with self._locked(name=name):
+                    outdated: dict[str, Any] | None = _record_read(statpath=statpath)
+                    os.replace(temppath, self._datapath(name=name,
+                                                        etag=record["etag"]))
+                    temppath.write_text(json.dumps(record))
+                    os.replace(temppath, statpath)
+                    if outdated and outdated["etag"] != record["etag"]:
+                        self._datapath(name=name,
+                                       etag=outdated["etag"]).unlink(missing_ok=True)
+                with self._lock:
+                    self.misses += 1
+                # keep the contents within the maximum size
+                self.evict()
+            else:
+                record = None
+        finally:
+            temppath.unlink(missing_ok=True)
+
+        return record
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used contents, until those remaining fit in the cache's maximum size.
+
+        Contents being accessed at the moment, by this or by other processes, are skipped.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.folder.glob("*.data"):
+            try:
+                info: os.stat_result = path.stat()
+                entries.append((info.st_mtime, info.st_size, path))
+            except FileNotFoundError:
+                pass
+        size: int = sum(entry[1] for entry in entries)
+        for _, length, path in sorted(entries, key=lambda entry: entry[0]):
+            if size <= self.max_size:
+                break
+            name: str = path.name.split(".", 1)[0]
+            with self._locked(name=name,
+                              blocking=False) as acquired:
+                if acquired:
+                    path.unlink(missing_ok=True)
+                    (self.folder / f"{name}.stat").unlink(missing_ok=True)
+                    (self.folder / f"{name}.lock").unlink(missing_ok=True)
+                    size -= length
+                    with self._lock:
+                        self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all contents from the cache, and reset its counters.
+        """
+        for path in self.folder.glob("*.data"):
+            path.unlink(missing_ok=True)
+        for path in self.folder.glob("*.stat"):
+            path.unlink(missing_ok=True)
+        for path in self.folder.glob("*.lock"):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Obtain the current counters of the cache.
+
+        The counters of hits, misses and evictions refer to this process,
+        whereas the number of files and the size refer to the contents held in the folder.
+
+        :return: the counters of hits, misses, evictions, files and size held, and the cache's settings
+        """
+        sizes: list[int] = []
+        for path in self.folder.glob("*.data"):
+            try:
+                sizes.append(path.stat().st_size)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            lookups: int = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit-rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "files": len(sizes),
+                "size": sum(sizes),
+                "max-size": self.max_size,
+                "folder": f"{self.folder}"
+            }
+
+    def _datapath(self,
+                  name: str,
+                  etag: str) -> Path:
+        return self.folder / f"{name}.{hashlib.sha256(etag.encode()).hexdigest()[:32]}.data"
+
+
+def _stat_record(stat: Any) -> dict[str, Any]:
+    """
+    Obtain the record kept in the cache from the information about an object.
+
+    :param stat: the information about the object (a *MinIO* object, or an *AWS* dictionary)
+    :return: the object's ETag, size, and moment of last modification
+    """
+    size: int
+    modified: datetime | None
+    if isinstance(stat, dict):
+        size = stat.get("ContentLength") or 0
+        modified = stat.get("LastModified")
+    else:
+        size = stat.size or 0
+        modified = stat.last_modified
+
+    return {
+        "etag": _s3_stat_etag(stat=stat),
+        "size": size,
+        "last-modified": modified.isoformat() if modified else None
+    }
+
+
+def _record_read(statpath: Path) -> dict[str, Any] | None:
+    """
+    Read the record kept in the cache for an object, at *statpath*.
+
+    :param statpath: the path of the record
+    :return: the record, or 'None' if it does not exist, or is not valid
+    """
+    # initialize the return variable
+    result: dict[str, Any] | None = None
+
+    try:
+        record: Any = json.loads(statpath.read_text())
+        if isinstance(record, dict) and isinstance(record.get("etag"), str):
+            result = record
+    except (FileNotFoundError, ValueError):
+        pass
+
+    return result
+
+
+def _stat_restore(key: tuple[str, str, str],
+                  record: dict[str, Any]) -> Any:
+    """
+    Restore the information about an object from the record kept in the cache, in the form of its S3 engine.
+
+    :param key: the key of the object, as a tuple *(engine, bucket, remotepath)*
+    :param record: the record kept in the cache
+    :return: the information about the object (a *MinIO* object, or an *AWS* dictionary)
+    """
+    # initialize the return variable
+    result: Any
+
+    modified: datetime | None = None
+    if record.get("last-modified"):
+        modified = datetime.fromisoformat(record["last-modified"])
+    if key[0] == "minio":
+        from minio.datatypes import Object
+        result = Object(bucket_name=key[1],
+                        object_name=key[2],
+                        last_modified=modified,
+                        etag=record["etag"],
+                        size=record.get("size"))
+    else:
+        result = {
+            "ETag": f'"{record["etag"]}"',
+            "ContentLength": record.get("size"),
+            "LastModified": modified
+        }
+
+    return result
+
+
+# the local disk cache of file contents, enabled with 's3_disk_cache_setup'
+_S3_DISK_CACHE: _S3DiskCache | None = None
+
+
+def s3_disk_cache_setup(folder: Path | str | None,
+                        max_size: int = _S3_DISK_CACHE_SIZE) -> None:
+    """
+    Enable, reconfigure, or disable the local disk cache of file contents.
+
+    When enabled, the files retrieved by *s3_file_retrieve* are kept in *folder*, keyed by bucket,
+    path, and ETag, and are copied from there on subsequent retrievals, for as long as they remain current.
+    Whether they remain current is established with a cheap conditional request, which transfers no contents.
+    Several processes on the same host may share *folder*, as writes are done atomically, and, where
+    file locking is available, the retrieval of a given file is serialized among processes.
+    The least recently used files are removed once their total size exceeds *max_size*.
+
+    :param folder: the folder to keep the files in ('None' disables the cache)
+    :param max_size: the maximum size in bytes of the files kept (defaults to 1 GiB)
+    """
+    global _S3_DISK_CACHE
+    _S3_DISK_CACHE = _S3DiskCache(folder=Path(folder),
+                                  max_size=max_size) if folder else None
+
+
+def s3_disk_cache_stats() -> dict[str, Any] | None:
+    """
+    Obtain the counters of the local disk cache of file contents.
+
+    :return: the counters of hits, misses, evictions, files and size held, or 'None' if the cache is not enabled
+    """
+    return _S3_DISK_CACHE.stats() if _S3_DISK_CACHE else None
+
+
+def s3_disk_cache_clear() -> None:
+    """
+    Remove all files from the local disk cache of file contents, and reset its counters.
+    """
+    if _S3_DISK_CACHE:
+        _S3_DISK_CACHE.clear()
+
+
+def _s3_disk_cache() -> _S3DiskCache | None:
+    """
+    Obtain the local disk cache of file contents.
+
+    :return: the cache, or 'None' if it is not enabled
+    """
+    return _S3_DISK_CACHE
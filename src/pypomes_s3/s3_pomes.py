@@ -1,11 +1,25 @@
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from functools import partial
+from itertools import islice, takewhile
 from logging import Logger
 from pathlib import Path
 from typing import Any
 
 from .s3_common import (
-    _S3_ENGINES, _S3_ACCESS_DATA,
-    _assert_engine, _s3_get_param
+    S3_NOT_MODIFIED, _S3_ENGINES, _S3_ACCESS_DATA, _S3_MAX_CONCURRENCY, _S3_LIST_BATCH, _S3_LIST_COST,
+    _assert_engine, _s3_get_param, _s3_invalidate_clients, _s3_fan_out, _s3_single_flight,
+    _s3_merge, _s3_batches, _s3_entry_name, _s3_entry_is_folder, _s3_entry_size,
+    _s3_except_msg, _s3_log
+)
+from .s3_codecs import _assert_codec
+from .s3_compression import _S3_COMPRESSIONS, _assert_compression
+from .s3_disk_cache import _S3DiskCache, _s3_disk_cache
+from .s3_records import S3ObjectInfo, S3ObjectStat, _s3_object_info, _s3_stat_info, _s3_stat_details
+from .s3_cache import (
+    _S3_ABSENT, _S3_BLOOM_CAPACITY, _S3Cache, _S3ObjectCache, _S3BloomFilter,
+    _s3_stat_cache, _s3_object_cache, _s3_cache_key, _s3_cache_invalidate,
+    _s3_bloom_start, _s3_bloom_register, _s3_bloom_discard, _s3_bloom_unregister, _s3_bloom_absent, _s3_bloom_add
 )
 
 
@@ -16,7 +30,20 @@ def s3_setup(engine: str,
              temp_folder: str | Path,
              region_name: str = None,
              endpoint_url: str = None,
-             secure_access: bool = None) -> bool:
+             secure_access: bool = None,
+             pool_size: int = None,
+             connect_timeout: float = None,
+             read_timeout: float = None,
+             keep_alive: bool = None,
+             max_retries: int = None,
+             multipart_threshold: int = None,
+             part_size: int = None,
+             max_concurrency: int = None,
+             spool_threshold: int = None,
+             codec: str = None,
+             compression: str = None,
+             compression_level: int = None,
+             compression_cutoff: int = None) -> bool:
     """
     Establish the provided parameters for access to *engine*.
 
@@ -33,6 +60,19 @@ def s3_setup(engine: str,
     :param region_name: the name of the region where the engine is located (AWS only)
     :param endpoint_url: the access URL for the service (MinIO only)
     :param secure_access: whether or not to use Transport Security Layer (MinIO only)
+    :param pool_size: optional maximum number of connections kept in the connection pool
+    :param connect_timeout: optional timeout for establishing connections, in seconds
+    :param read_timeout: optional timeout for reading from connections, in seconds
+    :param keep_alive: optional flag to enable TCP keep-alive on pooled connections
+    :param max_retries: optional maximum number of retries on connection and server errors
+    :param multipart_threshold: optional size in bytes from which transfers are done in parts
+    :param part_size: optional size in bytes of each part in multipart transfers
+    :param max_concurrency: optional maximum number of parts transferred, or requests issued, concurrently
+    :param spool_threshold: optional size in bytes from which serialized objects are spooled to disk
+    :param codec: optional name of the codec to serialize objects with (defaults to 'pickle')
+    :param compression: optional algorithm to compress stored objects and files with (one of [gzip, lz4, zstd])
+    :param compression_level: optional compression level (defaults to the algorithm's own default)
+    :param compression_cutoff: optional size in bytes from which objects and files are compressed
     :return: True if the data was accepted, False otherwise
     """
     # initialize the return variable
@@ -46,18 +86,34 @@ def s3_setup(engine: str,
         not (engine != "minio" and endpoint_url) and
         not (engine == "minio" and not endpoint_url) and
         not (engine != "minio" and secure_access is not None) and
-        not (engine == "minio" and secure_access is None)):
+        not (engine == "minio" and secure_access is None) and
+        not (compression and compression not in _S3_COMPRESSIONS)):
         _S3_ACCESS_DATA[engine] = {
             "access-key": access_key,
-            "access-secret": access_secret,
+            "secret-key": access_secret,
             "bucket-name": bucket_name,
-            "temp-folder": temp_folder
+            "temp-folder": temp_folder,
+            "pool-size": pool_size,
+            "connect-timeout": connect_timeout,
+            "read-timeout": read_timeout,
+            "keep-alive": keep_alive,
+            "max-retries": max_retries,
+            "multipart-threshold": multipart_threshold,
+            "part-size": part_size,
+            "max-concurrency": max_concurrency,
+            "spool-threshold": spool_threshold,
+            "codec": codec,
+            "compression": compression,
+            "compression-level": compression_level,
+            "compression-cutoff": compression_cutoff
         }
         if engine == "aws":
             _S3_ACCESS_DATA[engine]["region-name"] = region_name
         elif engine == "minio":
             _S3_ACCESS_DATA[engine]["endpoint-url"] = endpoint_url
             _S3_ACCESS_DATA[engine]["secure-access"] = secure_access
+        # discard the clients obtained with the previous parameters
+        _s3_invalidate_clients(engine=engine)
         if engine not in _S3_ENGINES:
             _S3_ENGINES.append(engine)
         result = True
@@ -131,6 +187,8 @@ def s3_access(errors: list[str] | None,
     Obtain and return a client to *engine*, or *None* if the client cannot be obtained.
 
     The target S3 engine, default or specified, must have been previously configured.
+    Clients are long-lived and shared: the same client is returned for as long as
+    the engine's access parameters remain unchanged.
 
     :param errors: incidental error messages
     :param engine: the S3 engine to use (uses the default engine, if not provided)
@@ -216,10 +274,20 @@ def s3_file_store(errors: list[str],
                   bucket: str = None,
                   engine: Any = None,
                   client: Any = None,
-                  logger: Logger = None) -> bool:
+                  logger: Logger = None,
+                  part_size: int = None,
+                  parallel_parts: int = None) -> bool:
     """
     Store a file at the S3 store.
 
+    Files not larger than the configured multipart threshold are uploaded in a single part.
+    Larger files are uploaded in parts of the configured part size (enlarged as needed to keep
+    within the maximum number of parts per upload), transferred concurrently up to the configured
+    maximum concurrency. Values provided for *part_size* and *parallel_parts* prevail, with the part size
+    kept within the 5 MiB to 5 GiB range accepted by S3 stores.
+    If compression is configured, files not smaller than the configured compression cutoff
+    are compressed before upload, and the compression algorithm is recorded in the object's metadata.
+
     :param errors: incidental error messages
     :param basepath: the path specifying the location to store the file at
     :param identifier: the file identifier, tipically a file name
@@ -228,8 +296,10 @@ def s3_file_store(errors: list[str],
     :param tags: optional metadata describing the file
     :param bucket: the bucket to use (uses the default bucket, if not provided)
     :param engine: the S3 engine to use (uses the default engine, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
+    :param part_size: optional size in bytes of each part (determined from the file size, if omitted)
+    :param parallel_parts: optional number of parts uploaded concurrently (determined from the file size, if omitted)
     :return: True if the file was successfully stored, False otherwise
     """
     # initialize the return variable
@@ -238,14 +308,16 @@ def s3_file_store(errors: list[str],
     # initialize the local errors list
     op_errors: list[str] = []
 
-    # determine the S3 engine
+    # determine the S3 engine, and verify its compression algorithm
     curr_engine: str = _assert_engine(errors=op_errors,
                                       engine=engine)
+    compressible: bool = curr_engine is not None and _assert_compression(errors=op_errors,
+                                                                         engine=curr_engine)
     # make sure to have a bucket name
     if not bucket:
         bucket = _s3_get_param(engine=curr_engine,
                                param="bucket-name")
-    if curr_engine == "aws":
+    if curr_engine == "aws" and compressible:
         from . import aws_pomes
         result = aws_pomes.file_store(errors=op_errors,
                                       bucket=bucket,
@@ -254,9 +326,11 @@ def s3_file_store(errors: list[str],
                                       filepath=filepath,
                                       mimetype=mimetype,
                                       tags=tags,
+                                      part_size=part_size,
+                                      parallel_parts=parallel_parts,
                                       client=client,
                                       logger=logger)
-    elif curr_engine == "minio":
+    elif curr_engine == "minio" and compressible:
         from . import minio_pomes
         result = minio_pomes.file_store(errors=op_errors,
                                         bucket=bucket,
@@ -265,9 +339,22 @@ def s3_file_store(errors: list[str],
                                         filepath=filepath,
                                         mimetype=mimetype,
                                         tags=tags,
+                                        part_size=part_size,
+                                        parallel_parts=parallel_parts,
                                         client=client,
                                         logger=logger)
 
+    # discard the cached information on the file, and record its existence in the Bloom filters
+    if result:
+        _s3_cache_invalidate(engine=curr_engine,
+                             bucket=bucket,
+                             basepath=basepath,
+                             identifier=identifier)
+        _s3_bloom_add(engine=curr_engine,
+                      bucket=bucket,
+                      basepath=basepath,
+                      identifier=identifier)
+
     # acknowledge eventual local errors
     errors.extend(op_errors)
 
@@ -281,19 +368,37 @@ def s3_file_retrieve(errors: list[str],
                      bucket: str = None,
                      engine: str = None,
                      client: Any = None,
-                     logger: Logger = None) -> Any:
+                     logger: Logger = None,
+                     parallel: bool = False,
+                     cache: bool = True,
+                     etag: str = None,
+                     modified_since: datetime = None) -> Any:
     """
     Retrieve a file from the S3 store.
 
+    If *parallel* is set, the file is split into byte ranges of the configured part size, which are fetched
+    concurrently, up to the configured maximum concurrency, and written directly at their offsets in *filepath*.
+    All ranges are required to match the *ETag* obtained beforehand, and the size of the resulting file
+    is verified. Files stored compressed are fetched in a single stream, and decompressed as they arrive.
+    If the local disk cache of file contents is enabled (see *s3_disk_cache_setup*), and *cache* is set,
+    the file is copied from the cache, if its cached contents are still current, and cached otherwise.
+    If *etag* or *modified_since* is provided, the caller already holds a copy of the file, which is
+    revalidated with the S3 store, bypassing the local disk cache: the file is retrieved only if it has
+    changed since, and *S3_NOT_MODIFIED* is returned otherwise.
+
     :param errors: incidental error messages
     :param basepath: the path specifying the location to retrieve the file from
     :param identifier: the file identifier, tipically a file name
     :param filepath: the path to save the retrieved file at
     :param bucket: the bucket to use (uses the default bucket, if not provided)
     :param engine: the S3 engine to use (uses the default engine, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
-    :return: information about the file retrieved
+    :param parallel: whether to fetch byte ranges of the file concurrently (defaults to False)
+    :param cache: whether to go through the local disk cache of file contents, if enabled (defaults to True)
+    :param etag: optional ETag of the copy at hand of the file
+    :param modified_since: optional moment the copy at hand of the file was obtained (if *etag* is not provided)
+    :return: information about the file retrieved, or *S3_NOT_MODIFIED* if the copy at hand is still current
     """
     # initialize the return variable
     result: Any = None
@@ -308,24 +413,40 @@ def s3_file_retrieve(errors: list[str],
     if not bucket:
         bucket = _s3_get_param(engine=curr_engine,
                                param="bucket-name")
-    if curr_engine == "aws":
-        from . import aws_pomes
-        result = aws_pomes.file_retrieve(errors=op_errors,
-                                         bucket=bucket,
-                                         basepath=basepath,
-                                         identifier=identifier,
+    # is the file to be retrieved through the local disk cache ?
+    conditional: bool = bool(etag or modified_since)
+    disk_cache: _S3DiskCache | None = _s3_disk_cache() if cache and curr_engine and not conditional else None
+    if disk_cache:
+        # yes, retrieve it
+        try:
+            result = disk_cache.retrieve(errors=op_errors,
+                                         key=(curr_engine, bucket, f"{Path(basepath) / identifier}"),
                                          filepath=filepath,
-                                         client=client,
-                                         logger=logger)
-    elif curr_engine == "minio":
-        from . import minio_pomes
-        result = minio_pomes.file_retrieve(errors=op_errors,
-                                           bucket=bucket,
-                                           basepath=basepath,
-                                           identifier=identifier,
-                                           filepath=filepath,
-                                           client=client,
-                                           logger=logger)
+                                         fetch=partial(_file_retrieve,
+                                                       engine=curr_engine,
+                                                       bucket=bucket,
+                                                       basepath=basepath,
+                                                       identifier=identifier,
+                                                       parallel=parallel,
+                                                       client=client,
+                                                       logger=logger))
+        except Exception as e:
+            _s3_except_msg(errors=op_errors,
+                           exception=e,
+                           engine=curr_engine,
+                           logger=logger)
+    elif curr_engine:
+        result = _file_retrieve(errors=op_errors,
+                                engine=curr_engine,
+                                bucket=bucket,
+                                basepath=basepath,
+                                identifier=identifier,
+                                filepath=filepath,
+                                parallel=parallel,
+                                etag=etag.strip('"') if etag else None,
+                                modified_since=modified_since,
+                                client=client,
+                                logger=logger)
 
     # acknowledge eventual local errors
     errors.extend(op_errors)
@@ -343,12 +464,17 @@ def s3_object_exists(errors: list[str],
     """
     Determine if a given object exists in the S3 store.
 
+    If the in-process cache of object information is enabled (see *s3_stat_cache_setup*),
+    the existence of an object is established from its cached information, whenever available.
+    If a Bloom filter covers the object's location (see *s3_bloom_build*), and it does not hold
+    the object's path, the object is reported absent without accessing the S3 store.
+
     :param errors: incidental error messages
     :param basepath: the path specifying where to locate the object
     :param identifier: optional object identifier
     :param bucket: the bucket to use (uses the default bucket, if not provided)
     :param engine: the S3 engine to use (uses the default engine, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: True if the object was found, false otherwise
     """
@@ -365,7 +491,24 @@ def s3_object_exists(errors: list[str],
     if not bucket:
         bucket = _s3_get_param(engine=curr_engine,
                                param="bucket-name")
-    if curr_engine == "aws":
+    # is the object definitely absent ?
+    if curr_engine and identifier and _s3_bloom_absent(engine=curr_engine,
+                                                       bucket=bucket,
+                                                       basepath=basepath,
+                                                       identifier=identifier):
+        # yes, report it as such
+        result = False
+    # is the object's information to be obtained through the cache ?
+    elif curr_engine and identifier and _s3_stat_cache():
+        # yes, obtain it
+        result = s3_object_stat(errors=op_errors,
+                                basepath=basepath,
+                                identifier=identifier,
+                                bucket=bucket,
+                                engine=curr_engine,
+                                client=client,
+                                logger=logger) is not None
+    elif curr_engine == "aws":
         from . import aws_pomes
         result = aws_pomes.object_exists(errors=op_errors,
                                          bucket=bucket,
@@ -398,12 +541,18 @@ def s3_object_stat(errors: list[str],
     """
     Retrieve and return the information about an object in the S3 store.
 
+    If the in-process cache of object information is enabled (see *s3_stat_cache_setup*),
+    the information is obtained from the cache, if available there, and cached otherwise.
+    The absence of the object is cached as well, for a shorter period. If a Bloom filter covers
+    the object's location (see *s3_bloom_build*), and it does not hold the object's path,
+    'None' is returned without accessing the S3 store.
+
     :param errors: incidental error messages
     :param basepath: the path specifying where to locate the object
     :param identifier: the object identifier
     :param bucket: the bucket to use (uses the default bucket, if not provided)
     :param engine: the S3 engine to use (uses the default engine, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: metadata and information about the object
     """
@@ -420,7 +569,25 @@ def s3_object_stat(errors: list[str],
     if not bucket:
         bucket = _s3_get_param(engine=curr_engine,
                                param="bucket-name")
-    if curr_engine == "aws":
+    # is the object definitely absent, or is the information on the object cached ?
+    stat_cache: _S3Cache | None = _s3_stat_cache() if curr_engine else None
+    generation: int | None = stat_cache.generation() if stat_cache else None
+    cache_key: tuple[str, str, str] | None = None
+    cached: bool = False
+    if curr_engine and _s3_bloom_absent(engine=curr_engine,
+                                        bucket=bucket,
+                                        basepath=basepath,
+                                        identifier=identifier):
+        cached = True
+    elif stat_cache:
+        cache_key = _s3_cache_key(engine=curr_engine,
+                                  bucket=bucket,
+                                  basepath=basepath,
+                                  identifier=identifier)
+        cached, result = stat_cache.get(key=cache_key)
+        if result is _S3_ABSENT:
+            result = None
+    if curr_engine == "aws" and not cached:
         from . import aws_pomes
         result = aws_pomes.object_stat(errors=op_errors,
                                        bucket=bucket,
@@ -428,7 +595,7 @@ def s3_object_stat(errors: list[str],
                                        identifier=identifier,
                                        client=client,
                                        logger=logger)
-    elif curr_engine == "minio":
+    elif curr_engine == "minio" and not cached:
         from . import minio_pomes
         result = minio_pomes.object_stat(errors=op_errors,
                                          bucket=bucket,
@@ -436,6 +603,17 @@ def s3_object_stat(errors: list[str],
                                          identifier=identifier,
                                          client=client,
                                          logger=logger)
+    # cache the information obtained, or the absence of the object
+    if stat_cache and not cached and not op_errors:
+        if result is not None:
+            stat_cache.put(key=cache_key,
+                           value=result,
+                           generation=generation)
+        elif stat_cache.negative_ttl > 0:
+            stat_cache.put(key=cache_key,
+                           value=_S3_ABSENT,
+                           ttl=stat_cache.negative_ttl,
+                           generation=generation)
 
     # acknowledge eventual local errors
     errors.extend(op_errors)
@@ -451,10 +629,22 @@ def s3_object_store(errors: list[str],
                     bucket: str = None,
                     engine: str = None,
                     client: Any = None,
-                    logger: Logger = None) -> bool:
+                    logger: Logger = None,
+                    codec: str = None) -> bool:
     """
     Store an object at the S3 store.
 
+    The object is serialized with *codec*, whose name is recorded in the object's metadata,
+    so that the object may be properly unmarshalled upon retrieval.
+    The codecs available by default are:
+      - *pickle*: the Python object serialization, with protocol 5
+      - *msgpack*: the MessagePack binary format (requires the package *msgpack*)
+      - *orjson*: the JSON format (requires the package *orjson*)
+      - *bytes*: raw bytes-like objects, stored as is
+    Further codecs may be made available with *s3_codec_register*.
+    If compression is configured, serialized objects not smaller than the configured compression cutoff
+    are compressed before upload, and the compression algorithm is also recorded in the object's metadata.
+
     :param errors: incidental error messages
     :param basepath: the path specifying the location to store the object at
     :param identifier: the object identifier
@@ -462,8 +652,9 @@ def s3_object_store(errors: list[str],
     :param tags: optional metadata describing the object
     :param engine: the S3 engine to use (uses the default engine, if not provided)
     :param bucket: the bucket to use (uses the default bucket, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
+    :param codec: the codec to serialize the object with (defaults to the one configured, or to 'pickle')
     :return: True if the object was successfully stored, False otherwise
     """
     # initialize the return variable
@@ -475,11 +666,18 @@ def s3_object_store(errors: list[str],
     # determine the S3 engine
     curr_engine: str = _assert_engine(errors=op_errors,
                                       engine=engine)
+    # determine the codec, and verify the compression algorithm
+    curr_codec: str | None = None
+    if curr_engine and _assert_compression(errors=op_errors,
+                                           engine=curr_engine):
+        curr_codec = _assert_codec(errors=op_errors,
+                                   engine=curr_engine,
+                                   codec=codec)
     # make sure to have a bucket name
     if not bucket:
         bucket = _s3_get_param(engine=curr_engine,
                                param="bucket-name")
-    if curr_engine == "aws":
+    if curr_engine == "aws" and curr_codec:
         from . import aws_pomes
         result = aws_pomes.object_store(errors=op_errors,
                                         bucket=bucket,
@@ -487,9 +685,10 @@ def s3_object_store(errors: list[str],
                                         identifier=identifier,
                                         obj=obj,
                                         tags=tags,
+                                        codec=curr_codec,
                                         client=client,
                                         logger=logger)
-    elif curr_engine == "minio":
+    elif curr_engine == "minio" and curr_codec:
         from . import minio_pomes
         result = minio_pomes.object_store(errors=op_errors,
                                           bucket=bucket,
@@ -497,9 +696,94 @@ def s3_object_store(errors: list[str],
                                           identifier=identifier,
                                           obj=obj,
                                           tags=tags,
+                                          codec=curr_codec,
                                           client=client,
                                           logger=logger)
 
+    # discard the cached information on the object, and record its existence in the Bloom filters
+    if result:
+        _s3_cache_invalidate(engine=curr_engine,
+                             bucket=bucket,
+                             basepath=basepath,
+                             identifier=identifier)
+        _s3_bloom_add(engine=curr_engine,
+                      bucket=bucket,
+                      basepath=basepath,
+                      identifier=identifier)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result
+
+
+def s3_object_store_many(errors: list[str],
+                         basepath: str,
+                         items: dict[str, Any] | Iterable[tuple[str, Any]],
+                         tags: dict = None,
+                         codec: str = None,
+                         max_workers: int = None,
+                         in_order: bool = True,
+                         bucket: str = None,
+                         engine: str = None,
+                         client: Any = None,
+                         logger: Logger = None) -> Iterator[tuple[str, bool, list[str]]] | None:
+    """
+    Store objects at the S3 store, concurrently.
+
+    The objects are stored by a pool of up to *max_workers* threads, sharing the same S3 client.
+    The operations start before this function returns, and proceed regardless of the iteration on
+    the iterator returned. For each object, a tuple *(identifier, outcome, errors)* is yielded,
+    in the order of *items*, if *in_order* is set, or else as the operations complete.
+    Abandoning the iteration cancels the operations not yet started.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to store the objects at
+    :param items: the objects to be stored, keyed by their identifiers
+    :param tags: optional metadata describing the objects
+    :param codec: the codec to serialize the objects with (defaults to the one configured, or to 'pickle')
+    :param max_workers: maximum number of objects stored concurrently (defaults to the configured concurrency)
+    :param in_order: whether to yield the outcomes in the order of *items* (defaults to True)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: an iterator into the outcomes of the operations, or 'None' if the S3 client could not be obtained
+    """
+    # initialize the return variable
+    result: Iterator[tuple[str, bool, list[str]]] | None = None
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    # make sure to have a S3 client
+    curr_client: Any = None
+    if curr_engine:
+        curr_client = client or s3_access(errors=op_errors,
+                                          engine=curr_engine,
+                                          logger=logger)
+    # was the S3 client obtained ?
+    if curr_client:
+        # yes, proceed
+        workers: int = max_workers or _s3_get_param(curr_engine, "max-concurrency") or _S3_MAX_CONCURRENCY
+        object_store: partial = partial(_object_store_item,
+                                        basepath=basepath,
+                                        tags=tags,
+                                        codec=codec,
+                                        bucket=bucket,
+                                        engine=curr_engine,
+                                        client=curr_client,
+                                        logger=logger)
+        result = ((item[0], outcome, item_errors)
+                  for item, (outcome, item_errors)
+                  in _s3_fan_out(func=object_store,
+                                 items=items.items() if isinstance(items, dict) else items,
+                                 max_workers=workers,
+                                 in_order=in_order))
+
     # acknowledge eventual local errors
     errors.extend(op_errors)
 
@@ -512,18 +796,40 @@ def s3_object_retrieve(errors: list[str],
                        bucket: str = None,
                        engine: str = None,
                        client: Any = None,
-                       logger: Logger = None) -> Any:
+                       logger: Logger = None,
+                       buffer: bytearray = None,
+                       cache: bool = True,
+                       etag: str = None,
+                       modified_since: datetime = None,
+                       coalesce: bool = False) -> Any:
     """
     Retrieve an object from the S3 store.
 
+    The object is unmarshalled with the codec recorded in its metadata upon storage,
+    or with *pickle*, if no codec has been recorded. Objects stored compressed are
+    decompressed as they are read. If the in-process cache of objects is enabled
+    (see *s3_object_cache_setup*), and *cache* is set, the cached copy of the object is returned,
+    if it is still current, and the object retrieved is cached otherwise. If *etag* or *modified_since*
+    is provided, the caller already holds a copy of the object, which is revalidated with a conditional
+    request to the S3 store, bypassing the in-process cache: the object is transferred only if it has
+    changed since, and *S3_NOT_MODIFIED* is returned otherwise. If *coalesce* is set, concurrent calls
+    for the same object, also having *coalesce* set, share a single request in flight, and obtain the same
+    object, or the same errors. As the object is then shared among the callers, it must not be modified,
+    as is the case with objects obtained from the in-process cache, unless it hands out copies.
+
     :param errors: incidental error messages
     :param basepath: the path specifying the location to retrieve the object from
     :param identifier: the object identifier
     :param bucket: the bucket to use (uses the default bucket, if not provided)
     :param engine: the S3 engine to use (uses the default engine, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
-    :return: the object retrieved
+    :param buffer: optional preallocated buffer to read the serialized object into (used only if large enough)
+    :param cache: whether to go through the in-process cache of objects, if enabled (defaults to True)
+    :param etag: optional ETag of the copy at hand of the object
+    :param modified_since: optional moment the copy at hand of the object was obtained
+    :param coalesce: whether to share the request with concurrent calls for the same object (defaults to False)
+    :return: the object retrieved, or *S3_NOT_MODIFIED* if the copy at hand is still current
     """
     # initialize the return variable
     result: Any = None
@@ -538,22 +844,133 @@ def s3_object_retrieve(errors: list[str],
     if not bucket:
         bucket = _s3_get_param(engine=curr_engine,
                                param="bucket-name")
-    if curr_engine == "aws":
-        from . import aws_pomes
-        result = aws_pomes.object_retrieve(errors=op_errors,
-                                           bucket=bucket,
+    # is the object to be retrieved through the in-process cache ?
+    conditional: bool = bool(etag or modified_since)
+    object_cache: _S3ObjectCache | None = _s3_object_cache() if cache and curr_engine and not conditional else None
+    generation: int | None = object_cache.generation() if object_cache else None
+    cache_key: tuple[str, str, str] | None = None
+    entry: tuple[str, Any, bool] | None = None
+    if object_cache:
+        cache_key = _s3_cache_key(engine=curr_engine,
+                                  bucket=bucket,
+                                  basepath=basepath,
+                                  identifier=identifier)
+        entry = object_cache.get(key=cache_key)
+    # may the cached copy of the object be used without revalidation ?
+    if entry and entry[2]:
+        # yes, use it
+        result = entry[1]
+        object_cache.hit(key=cache_key,
+                         revalidated=False)
+    elif curr_engine:
+        # no, retrieve the object, unless the cached copy is still current
+        info: dict[str, Any] = {}
+        curr_etag: str | None = entry[0] if entry else (etag.strip('"') if etag else None)
+        retrieve: partial = partial(_object_retrieve,
+                                    engine=curr_engine,
+                                    bucket=bucket,
+                                    basepath=basepath,
+                                    identifier=identifier,
+                                    buffer=buffer,
+                                    etag=curr_etag,
+                                    modified_since=modified_since,
+                                    info=info,
+                                    client=client,
+                                    logger=logger)
+        # is the request to be shared with concurrent calls for the same object ?
+        if coalesce:
+            # yes, join the request in flight, if any
+            result = _s3_single_flight(errors=op_errors,
+                                       key=(curr_engine, bucket, f"{Path(basepath) / identifier}",
+                                            curr_etag, modified_since),
+                                       func=retrieve)
+        else:
+            # no, issue it
+            result = retrieve(errors=op_errors)
+        # is the cached copy of the object still current ?
+        if result is S3_NOT_MODIFIED and entry:
+            # yes, use it
+            result = entry[1]
+            object_cache.hit(key=cache_key,
+                             revalidated=True)
+        elif object_cache:
+            # no, count the outdated copy, if any, as a miss, and cache the object retrieved
+            if entry:
+                object_cache.miss()
+            if info and not op_errors:
+                object_cache.put(key=cache_key,
+                                 etag=info["etag"],
+                                 obj=result,
+                                 size=info["size"],
+                                 generation=generation)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result
+
+
+def s3_object_retrieve_many(errors: list[str],
+                            basepath: str,
+                            identifiers: Iterable[str],
+                            max_workers: int = None,
+                            in_order: bool = True,
+                            bucket: str = None,
+                            engine: str = None,
+                            client: Any = None,
+                            logger: Logger = None) -> Iterator[tuple[str, Any, list[str]]] | None:
+    """
+    Retrieve objects from the S3 store, concurrently.
+
+    The objects are retrieved by a pool of up to *max_workers* threads, sharing the same S3 client.
+    The retrievals start before this function returns, and proceed regardless of the iteration on
+    the iterator returned, which holds on to the objects retrieved until they are yielded.
+    For each object, a tuple *(identifier, object, errors)* is yielded, in the order of *identifiers*,
+    if *in_order* is set, or else as the operations complete. Abandoning the iteration cancels
+    the retrievals not yet started.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to retrieve the objects from
+    :param identifiers: the object identifiers
+    :param max_workers: maximum number of objects retrieved concurrently (defaults to the configured concurrency)
+    :param in_order: whether to yield the objects in the order of *identifiers* (defaults to True)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: an iterator into the objects retrieved, or 'None' if the S3 client could not be obtained
+    """
+    # initialize the return variable
+    result: Iterator[tuple[str, Any, list[str]]] | None = None
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    # make sure to have a S3 client
+    curr_client: Any = None
+    if curr_engine:
+        curr_client = client or s3_access(errors=op_errors,
+                                          engine=curr_engine,
+                                          logger=logger)
+    # was the S3 client obtained ?
+    if curr_client:
+        # yes, proceed
+        workers: int = max_workers or _s3_get_param(curr_engine, "max-concurrency") or _S3_MAX_CONCURRENCY
+        object_retrieve: partial = partial(_object_retrieve_item,
                                            basepath=basepath,
-                                           identifier=identifier,
-                                           client=client,
+                                           bucket=bucket,
+                                           engine=curr_engine,
+                                           client=curr_client,
                                            logger=logger)
-    elif curr_engine == "minio":
-        from . import minio_pomes
-        result = minio_pomes.object_retrieve(errors=op_errors,
-                                             bucket=bucket,
-                                             basepath=basepath,
-                                             identifier=identifier,
-                                             client=client,
-                                             logger=logger)
+        result = ((identifier, obj, item_errors)
+                  for identifier, (obj, item_errors)
+                  in _s3_fan_out(func=object_retrieve,
+                                 items=identifiers,
+                                 max_workers=workers,
+                                 in_order=in_order))
 
     # acknowledge eventual local errors
     errors.extend(op_errors)
@@ -567,17 +984,23 @@ def s3_object_delete(errors: list[str],
                      bucket: str = None,
                      engine: str = None,
                      client: Any = None,
-                     logger: Logger = None) -> bool:
+                     logger: Logger = None,
+                     failures: dict[str, str] = None) -> bool:
     """
     Remove an object from the S3 store.
 
+    If *identifier* is not provided, then the folder *basepath* is deleted, with its objects
+    being removed in batches by multi-object delete requests. In this case, the objects which
+    could not be removed are reported in *failures*, if provided, with the corresponding reasons.
+
     :param errors: incidental error messages
     :param basepath: the path specifying the location to retrieve the object from
     :param identifier: optional object identifier
     :param bucket: the bucket to use (uses the default bucket, if not provided)
     :param engine: the S3 engine to use (uses the default engine, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
+    :param failures: optional *dict* to receive the names of the objects not removed, and the reasons
     :return: True if the object was successfully deleted, False otherwise
     """
     # initialize the return variable
@@ -599,6 +1022,7 @@ def s3_object_delete(errors: list[str],
                                          bucket=bucket,
                                          basepath=basepath,
                                          identifier=identifier,
+                                         failures=failures,
                                          client=client,
                                          logger=logger)
     elif curr_engine == "minio":
@@ -607,9 +1031,17 @@ def s3_object_delete(errors: list[str],
                                            bucket=bucket,
                                            basepath=basepath,
                                            identifier=identifier,
+                                           failures=failures,
                                            client=client,
                                            logger=logger)
 
+    # discard the cached information on the object, or on the objects in the folder
+    if curr_engine:
+        _s3_cache_invalidate(engine=curr_engine,
+                             bucket=bucket,
+                             basepath=basepath,
+                             identifier=identifier)
+
     # acknowledge eventual local errors
     errors.extend(op_errors)
 
@@ -631,7 +1063,7 @@ def s3_object_tags_retrieve(errors: list[str],
     :param identifier: the object identifier
     :param bucket: the bucket to use (uses the default bucket, if not provided)
     :param engine: the S3 engine to use (uses the default engine, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
     :return: the metadata about the object
     """
@@ -671,23 +1103,150 @@ def s3_object_tags_retrieve(errors: list[str],
     return result
 
 
+def s3_bloom_build(errors: list[str],
+                   basepath: str,
+                   capacity: int = None,
+                   error_rate: float = 0.01,
+                   bucket: str = None,
+                   engine: str = None,
+                   client: Any = None,
+                   logger: Logger = None) -> bool:
+    """
+    Build a Bloom filter over the paths of the objects located under *basepath*, in the S3 store.
+
+    The objects are listed recursively, and the filter built is used by *s3_object_exists*
+    and *s3_object_stat* to report objects under *basepath* absent, without accessing the S3 store.
+    Objects stored through this package are added to the filter. Objects deleted remain in the filter,
+    thus requiring access to the S3 store to establish their absence. Objects stored by other processes
+    are not in the filter, and thus the filter should be rebuilt, or dropped with *s3_bloom_drop*,
+    whenever other processes may store objects under *basepath*.
+    The objects are added to the filter as they are listed, and those stored through this package while
+    the filter is built are added to it as well. A filter previously built for *basepath* is replaced.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location of the objects
+    :param capacity: the expected number of objects (defaults to one million)
+    :param error_rate: the acceptable rate of false positives (defaults to 1%)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: True if the filter was built, False otherwise
+    """
+    # initialize the return variable
+    result: bool = False
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    # make sure to have a bucket name
+    if curr_engine and not bucket:
+        bucket = _s3_get_param(engine=curr_engine,
+                               param="bucket-name")
+    if curr_engine:
+        # start the filter before listing, so that it holds the objects stored meanwhile
+        bloom: _S3BloomFilter = _s3_bloom_start(engine=curr_engine,
+                                                bucket=bucket,
+                                                basepath=basepath,
+                                                capacity=capacity or _S3_BLOOM_CAPACITY,
+                                                error_rate=error_rate)
+        # list the objects under the location
+        prefix: str = f"{Path(basepath)}"
+        entries: Iterator | None = s3_objects_list(errors=op_errors,
+                                                   basepath="" if prefix == "." else f"{prefix}/",
+                                                   recursive=True,
+                                                   bucket=bucket,
+                                                   engine=curr_engine,
+                                                   client=client,
+                                                   logger=logger)
+        # were the objects listed ?
+        if entries is not None:
+            # yes, add them to the filter, as they are listed
+            try:
+                for entry in entries:
+                    bloom.add(_s3_entry_name(entry=entry))
+                _s3_bloom_register(engine=curr_engine,
+                                   bucket=bucket,
+                                   basepath=basepath,
+                                   bloom=bloom)
+                result = True
+            except Exception as e:
+                _s3_except_msg(errors=op_errors,
+                               exception=e,
+                               engine=curr_engine,
+                               logger=logger)
+        if not result:
+            _s3_bloom_discard(engine=curr_engine,
+                              bucket=bucket,
+                              basepath=basepath,
+                              bloom=bloom)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result
+
+
+def s3_bloom_drop(basepath: str,
+                  bucket: str = None,
+                  engine: str = None) -> None:
+    """
+    Discard the Bloom filter built for the objects located under *basepath*, if any.
+
+    :param basepath: the path specifying the location of the objects
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    """
+    curr_engine: str = _assert_engine(errors=[],
+                                      engine=engine)
+    if curr_engine:
+        _s3_bloom_unregister(engine=curr_engine,
+                             bucket=bucket or _s3_get_param(engine=curr_engine,
+                                                            param="bucket-name"),
+                             basepath=basepath)
+
+
 def s3_objects_list(errors: list[str],
                     basepath: str,
                     recursive: bool = False,
                     bucket: str = None,
                     engine: str = None,
                     client: Any = None,
-                    logger: Logger = None) -> Iterator:
+                    logger: Logger = None,
+                    start_after: str = None,
+                    max_keys: int = None,
+                    compact: bool = False,
+                    prefetch: int = 0) -> Iterator:
     """
     Retrieve and return an iterator into the list of objects at *basepath*, in the S3 store.
 
+    The entries are listed in lexicographical order of their names, with both engines (as *MinIO* yields
+    the objects before the folders in each page of a non-recursive listing, the entries at *basepath*
+    are then read whole, and sorted, with that engine). If *start_after* is provided,
+    the listing starts after the entry so named (typically, the last entry of a previous listing,
+    or the continuation token returned by *s3_objects_page*), and if *max_keys* is provided,
+    the listing stops after that many entries.
+    Failures in obtaining the first page of entries are reported in *errors*, whereas failures in obtaining
+    the subsequent pages are raised to the consumer of the iterator, as the iteration proceeds.
+    If *compact* is set, the entries are listed as compact, engine-neutral *S3ObjectInfo* records.
+    If *prefetch* is positive, a background thread obtains up to that many pages of entries ahead of
+    the iteration, so that the network latency overlaps with the processing of the entries at hand,
+    while the memory in use remains bounded by the pages held.
+
     :param errors: incidental error messages
     :param basepath: the path specifying the location to iterate from
     :param recursive: whether the location is iterated recursively
     :param bucket: the bucket to use (uses the default bucket, if not provided)
     :param engine: the S3 engine to use (uses the default engine, if not provided)
-    :param client: optional S3 client (obtains a new one, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
     :param logger: optional logger
+    :param start_after: optional name of the entry to start listing after
+    :param max_keys: optional maximum number of entries to list
+    :param compact: whether to list *S3ObjectInfo* records, instead of the engine's entries (defaults to False)
+    :param prefetch: the number of pages of entries to obtain ahead of the iteration (defaults to 0, no read-ahead)
     :return: the iterator into the list of objects, 'None' if the folder does not exist
     """
     # initialize the return variable
@@ -709,6 +1268,8 @@ def s3_objects_list(errors: list[str],
                                         bucket=bucket,
                                         basepath=basepath,
                                         recursive=recursive,
+                                        start_after=start_after,
+                                        page_size=max_keys,
                                         client=client,
                                         logger=logger)
     elif curr_engine == "minio":
@@ -717,10 +1278,996 @@ def s3_objects_list(errors: list[str],
                                           bucket=bucket,
                                           basepath=basepath,
                                           recursive=recursive,
+                                          start_after=start_after,
+                                          page_size=max_keys,
                                           client=client,
                                           logger=logger)
+    if result is not None:
+        # skip the folder the listing starts after, which is listed again if not listing recursively
+        if start_after:
+            result = (entry for entry in result if _s3_entry_name(entry=entry) > start_after)
+        if max_keys:
+            result = islice(result, max_keys)
+        if compact:
+            result = map(_s3_object_info, result)
+        if prefetch > 0:
+            result = _s3_merge(producers=[partial(_s3_batches,
+                                                  items=result,
+                                                  size=_S3_LIST_BATCH)],
+                               max_workers=1,
+                               in_order=True,
+                               buffer_size=prefetch)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result
+
+
+def s3_objects_page(errors: list[str],
+                    basepath: str,
+                    recursive: bool = False,
+                    page_size: int = 1000,
+                    continuation: str = None,
+                    compact: bool = False,
+                    bucket: str = None,
+                    engine: str = None,
+                    client: Any = None,
+                    logger: Logger = None) -> tuple[list, str | None]:
+    """
+    Retrieve a page of the list of objects at *basepath*, in the S3 store.
+
+    The page holds up to *page_size* entries, in lexicographical order of their names, following
+    the entries of the page *continuation* was returned with. The continuation token returned
+    is the name of the last entry in the page, or 'None' if there are no more entries to list.
+    As it depends on nothing but the listing itself, it may be persisted, and used to resume
+    the listing at a later time, or by another process.
+    If *compact* is set, the entries are listed as compact, engine-neutral *S3ObjectInfo* records.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to iterate from
+    :param recursive: whether the location is iterated recursively
+    :param page_size: the maximum number of entries in the page (defaults to 1000)
+    :param continuation: optional continuation token returned with the previous page
+    :param compact: whether to list *S3ObjectInfo* records, instead of the engine's entries (defaults to False)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the entries in the page, and the continuation token for the next page
+    """
+    # initialize the return variables
+    result: list = []
+    token: str | None = None
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    # list one entry beyond the page, to establish whether there are more entries to list
+    entries: Iterator | None = s3_objects_list(errors=op_errors,
+                                               basepath=basepath,
+                                               recursive=recursive,
+                                               start_after=continuation,
+                                               max_keys=page_size + 1,
+                                               bucket=bucket,
+                                               engine=curr_engine,
+                                               client=client,
+                                               logger=logger) if curr_engine else None
+    if entries is not None:
+        try:
+            result = list(entries)
+            if len(result) > page_size:
+                result = result[:page_size]
+                token = _s3_entry_name(entry=result[-1])
+            if compact:
+                result = [_s3_object_info(entry=entry) for entry in result]
+        except Exception as e:
+            result = []
+            _s3_except_msg(errors=op_errors,
+                           exception=e,
+                           engine=curr_engine,
+                           logger=logger)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result, token
+
+
+def s3_objects_list_parallel(errors: list[str],
+                             basepath: str,
+                             depth: int = 1,
+                             boundaries: list[str] = None,
+                             in_order: bool = False,
+                             max_workers: int = None,
+                             compact: bool = False,
+                             bucket: str = None,
+                             engine: str = None,
+                             client: Any = None,
+                             logger: Logger = None) -> Iterator | None:
+    """
+    Retrieve and return an iterator into the objects under *basepath*, listed in concurrent partitions.
+
+    The location is listed recursively. If *boundaries* is provided, its keys are partitioned into the ranges
+    delimited by *basepath* followed by each boundary (e.g., *["4", "8", "c"]* splits hexadecimal names into
+    four ranges). Otherwise, the partitions are the folders found in *basepath*, or in its subfolders down to
+    *depth* levels, along with the objects found alongside them. The partitions are listed by a pool of up to
+    *max_workers* threads, sharing the same S3 client, and their entries are yielded in lexicographical order
+    of their names, if *in_order* is set, or else as the pages of each partition are obtained. Failures in
+    starting the listing of a partition are added to *errors* as the iteration proceeds, the partition then
+    yielding no entries, whereas exceptions raised while listing a partition are re-raised to the consumer
+    of the iterator, and end the iteration.
+    If *compact* is set, the entries are listed as compact, engine-neutral *S3ObjectInfo* records.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to iterate from
+    :param depth: the number of folder levels to look for partitions in, if *boundaries* is not provided
+    :param boundaries: optional names delimiting the ranges of keys to partition the listing into
+    :param in_order: whether to yield the entries in lexicographical order (defaults to False)
+    :param max_workers: maximum number of partitions listed concurrently (defaults to the configured concurrency)
+    :param compact: whether to list *S3ObjectInfo* records, instead of the engine's entries (defaults to False)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the iterator into the list of objects, or 'None' if the partitions could not be established
+    """
+    # initialize the return variable
+    result: Iterator | None = None
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    # make sure to have a S3 client
+    curr_client: Any = None
+    if curr_engine:
+        curr_client = client or s3_access(errors=op_errors,
+                                          engine=curr_engine,
+                                          logger=logger)
+    # was the S3 client obtained ?
+    if curr_client:
+        # yes, establish the partitions
+        list_partition: partial = partial(_partition_list,
+                                          errors=errors,
+                                          bucket=bucket,
+                                          engine=curr_engine,
+                                          client=curr_client,
+                                          logger=logger)
+        partitions: list[Callable[[], Iterable[list]]] | None = None
+        if boundaries:
+            # partition the keys into ranges
+            bounds: list[str] = [basepath + boundary for boundary in sorted(boundaries)]
+            partitions = [partial(list_partition,
+                                  prefix=basepath,
+                                  start_after=lower,
+                                  end_at=upper) for lower, upper in zip([None, *bounds], [*bounds, None])]
+        else:
+            # partition the keys by folder
+            try:
+                partitions = _partitions_discover(errors=op_errors,
+                                                  prefix=basepath,
+                                                  depth=depth,
+                                                  list_partition=list_partition,
+                                                  bucket=bucket,
+                                                  engine=curr_engine,
+                                                  client=curr_client,
+                                                  logger=logger)
+            except Exception as e:
+                _s3_except_msg(errors=op_errors,
+                               exception=e,
+                               engine=curr_engine,
+                               logger=logger)
+        if partitions is not None and not op_errors:
+            workers: int = max_workers or _s3_get_param(curr_engine, "max-concurrency") or _S3_MAX_CONCURRENCY
+            result = _s3_merge(producers=partitions,
+                               max_workers=workers,
+                               in_order=in_order)
+            if compact:
+                result = map(_s3_object_info, result)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result
+
+
+def s3_prefix_exists(errors: list[str],
+                     prefix: str,
+                     bucket: str = None,
+                     engine: str = None,
+                     client: Any = None,
+                     logger: Logger = None) -> bool:
+    """
+    Determine whether there are objects whose names start with *prefix*, in the S3 store.
+
+    The listing stops at the first object found, which is requested as a single-key page.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: 'True' if at least one object was found, 'False' otherwise
+    """
+    # initialize the return variable
+    result: bool = False
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    entries: Iterator | None = s3_objects_list(errors=op_errors,
+                                               basepath=prefix,
+                                               recursive=True,
+                                               max_keys=1,
+                                               bucket=bucket,
+                                               engine=curr_engine,
+                                               client=client,
+                                               logger=logger) if curr_engine else None
+    if entries is not None:
+        try:
+            result = next(entries, None) is not None
+        except Exception as e:
+            _s3_except_msg(errors=op_errors,
+                           exception=e,
+                           engine=curr_engine,
+                           logger=logger)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result
+
+
+def s3_prefix_count(errors: list[str],
+                    prefix: str,
+                    parallel: bool = False,
+                    max_workers: int = None,
+                    bucket: str = None,
+                    engine: str = None,
+                    client: Any = None,
+                    logger: Logger = None) -> int | None:
+    """
+    Obtain the number of the objects whose names start with *prefix*, in the S3 store.
+
+    The listing pages are streamed, and only the running totals are kept. If *parallel* is set,
+    the folders in *prefix* are listed concurrently, by a pool of up to *max_workers* threads.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param parallel: whether to list the folders in *prefix* concurrently (defaults to False)
+    :param max_workers: maximum number of folders listed concurrently (defaults to the configured concurrency)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the number of objects, or 'None' if error
+    """
+    # initialize the return variable
+    result: int | None = None
+
+    totals: tuple[int, int] | None = _prefix_aggregate(errors=errors,
+                                                       prefix=prefix,
+                                                       parallel=parallel,
+                                                       max_workers=max_workers,
+                                                       bucket=bucket,
+                                                       engine=engine,
+                                                       client=client,
+                                                       logger=logger)
+    if totals:
+        result = totals[0]
+
+    return result
+
+
+def s3_prefix_size(errors: list[str],
+                   prefix: str,
+                   parallel: bool = False,
+                   max_workers: int = None,
+                   bucket: str = None,
+                   engine: str = None,
+                   client: Any = None,
+                   logger: Logger = None) -> int | None:
+    """
+    Obtain the total size in bytes of the objects whose names start with *prefix*, in the S3 store.
+
+    The listing pages are streamed, and only the running totals are kept. If *parallel* is set,
+    the folders in *prefix* are listed concurrently, by a pool of up to *max_workers* threads.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param parallel: whether to list the folders in *prefix* concurrently (defaults to False)
+    :param max_workers: maximum number of folders listed concurrently (defaults to the configured concurrency)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the total size in bytes of the objects, or 'None' if error
+    """
+    # initialize the return variable
+    result: int | None = None
+
+    totals: tuple[int, int] | None = _prefix_aggregate(errors=errors,
+                                                       prefix=prefix,
+                                                       parallel=parallel,
+                                                       max_workers=max_workers,
+                                                       bucket=bucket,
+                                                       engine=engine,
+                                                       client=client,
+                                                       logger=logger)
+    if totals:
+        result = totals[1]
+
+    return result
+
+
+def s3_objects_exist(errors: list[str],
+                     basepath: str,
+                     identifiers: Iterable[str],
+                     strategy: str = "auto",
+                     max_workers: int = None,
+                     bucket: str = None,
+                     engine: str = None,
+                     client: Any = None,
+                     logger: Logger = None) -> dict[str, S3ObjectInfo | None] | None:
+    """
+    Determine which of the given objects exist in the S3 store, and obtain their size and ETag.
+
+    The objects are grouped by the folder holding them, and are resolved either by listing the range
+    of names they span in the folder, or by inquiring on each one of them, with concurrent HEAD requests.
+    With *strategy* set to 'auto', a folder is listed only if its objects are numerous enough to pay for
+    at least one page of the listing, a page being estimated to cost as much as ten HEAD requests.
+    The listing is then abandoned once its pages cost as much as inquiring on the objects would have,
+    and the objects beyond the names listed so far are inquired on. With *strategy* set to 'list'
+    or to 'head', all folders are resolved by listing, or by inquiring on their objects, respectively.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying where to locate the objects
+    :param identifiers: the object identifiers
+    :param strategy: how to resolve the objects ('auto', 'list', or 'head', defaults to 'auto')
+    :param max_workers: maximum number of requests issued concurrently (defaults to the configured concurrency)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the information about each object found, or 'None' for those not found, or 'None' if error
+    """
+    # initialize the return variable
+    result: dict[str, S3ObjectInfo | None] | None = None
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    # make sure to have a S3 client
+    curr_client: Any = None
+    if curr_engine:
+        curr_client = client or s3_access(errors=op_errors,
+                                          engine=curr_engine,
+                                          logger=logger)
+    if strategy not in ["auto", "list", "head"]:
+        op_errors.append(f"Strategy '{strategy}' unknown")
+    # was the S3 client obtained ?
+    elif curr_client:
+        # yes, group the objects by folder
+        result = {}
+        folders: dict[str, dict[str, str]] = {}
+        for identifier in identifiers:
+            key: str = f"{Path(basepath) / identifier}"
+            folders.setdefault(key.rpartition("/")[0], {})[key] = identifier
+            result[identifier] = None
+        workers: int = max_workers or _s3_get_param(curr_engine, "max-concurrency") or _S3_MAX_CONCURRENCY
+
+        # resolve the folders by listing, where worthwhile
+        pending: list[str] = []
+        listings: list[tuple[str, list[str], int | None]] = []
+        for folder, keys in folders.items():
+            max_pages: int | None = None
+            if strategy == "auto":
+                max_pages = len(keys) // _S3_LIST_COST
+            elif strategy == "head":
+                max_pages = 0
+            if max_pages == 0:
+                pending.extend(keys)
+            else:
+                listings.append((folder, sorted(keys), max_pages))
+
+        def folder_resolve(listing: tuple[str, list[str], int | None]) -> tuple[dict[str, S3ObjectInfo], list[str]]:
+            return _folder_resolve(folder=listing[0],
+                                   keys=listing[1],
+                                   max_pages=listing[2],
+                                   bucket=bucket,
+                                   engine=curr_engine,
+                                   client=curr_client,
+                                   logger=logger)
+
+        for (folder, _, _), (found, unresolved) in _s3_fan_out(func=folder_resolve,
+                                                               items=listings,
+                                                               max_workers=workers,
+                                                               in_order=False):
+            for key, info in found.items():
+                result[folders[folder][key]] = info
+            pending.extend(unresolved)
+
+        # resolve the remaining objects by inquiring on them
+        def object_stat(key: str) -> tuple[Any, list[str]]:
+            item_errors: list[str] = []
+            stat: Any = s3_object_stat(errors=item_errors,
+                                       basepath=key.rpartition("/")[0],
+                                       identifier=key.rpartition("/")[2],
+                                       bucket=bucket,
+                                       engine=curr_engine,
+                                       client=curr_client,
+                                       logger=logger)
+            return stat, item_errors
+
+        for key, (stat, item_errors) in _s3_fan_out(func=object_stat,
+                                                    items=pending,
+                                                    max_workers=workers,
+                                                    in_order=False):
+            op_errors.extend(item_errors)
+            if stat is not None:
+                result[folders[key.rpartition("/")[0]][key]] = _s3_stat_info(key=key,
+                                                                             stat=stat)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result
+
+
+def s3_objects_stat(errors: list[str],
+                    prefix: str,
+                    head: bool = False,
+                    parallel: bool = False,
+                    max_workers: int = None,
+                    bucket: str = None,
+                    engine: str = None,
+                    client: Any = None,
+                    logger: Logger = None) -> dict[str, S3ObjectStat] | None:
+    """
+    Obtain the information about the objects whose names start with *prefix*, in the S3 store.
+
+    The information is built from the pages of the listing of *prefix*, which carry the size,
+    ETag, moment of last modification, and storage class of the objects, without inquiring on
+    each one of them. If *head* is set, the objects are additionally inquired on, with concurrent
+    HEAD requests, for the information listings do not carry (their content type and user metadata).
+    If *parallel* is set, the folders in *prefix* are listed concurrently.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param head: whether to inquire on the objects for their content type and user metadata (defaults to False)
+    :param parallel: whether to list the folders in *prefix* concurrently (defaults to False)
+    :param max_workers: maximum number of requests issued concurrently (defaults to the configured concurrency)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the information about the objects, keyed by their full names, or 'None' if error
+    """
+    # initialize the return variable
+    result: dict[str, S3ObjectStat] | None = None
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    # make sure to have a S3 client
+    curr_client: Any = None
+    if curr_engine:
+        curr_client = client or s3_access(errors=op_errors,
+                                          engine=curr_engine,
+                                          logger=logger)
+    # was the S3 client obtained ?
+    if curr_client:
+        # yes, build the information from the listing
+        workers: int = max_workers or _s3_get_param(curr_engine, "max-concurrency") or _S3_MAX_CONCURRENCY
+        entries: Iterator | None
+        if parallel:
+            entries = s3_objects_list_parallel(errors=op_errors,
+                                               basepath=prefix,
+                                               compact=True,
+                                               max_workers=workers,
+                                               bucket=bucket,
+                                               engine=curr_engine,
+                                               client=curr_client,
+                                               logger=logger)
+        else:
+            entries = s3_objects_list(errors=op_errors,
+                                      basepath=prefix,
+                                      recursive=True,
+                                      compact=True,
+                                      bucket=bucket,
+                                      engine=curr_engine,
+                                      client=curr_client,
+                                      logger=logger)
+        if entries is not None:
+            try:
+                stats: dict[str, S3ObjectStat] = {info.key: S3ObjectStat(key=info.key,
+                                                                          size=info.size,
+                                                                          etag=info.etag,
+                                                                          last_modified=info.last_modified,
+                                                                          storage_class=info.storage_class)
+                                                   for info in entries}
+                if not op_errors:
+                    result = stats
+            except Exception as e:
+                _s3_except_msg(errors=op_errors,
+                               exception=e,
+                               engine=curr_engine,
+                               logger=logger)
+
+        # inquire on the objects, if so requested
+        if result and head:
+            if not bucket:
+                bucket = _s3_get_param(engine=curr_engine,
+                                       param="bucket-name")
+
+            # inquire on the very keys listed, as the paths built from their components would be normalized
+            def object_stat(key: str) -> tuple[Any, list[str]]:
+                item_errors: list[str] = []
+                stat: Any = None
+                if curr_engine == "aws":
+                    from . import aws_pomes
+                    stat = aws_pomes.object_stat(errors=item_errors,
+                                                 bucket=bucket,
+                                                 basepath=key,
+                                                 client=curr_client,
+                                                 logger=logger)
+                elif curr_engine == "minio":
+                    from . import minio_pomes
+                    stat = minio_pomes.object_stat(errors=item_errors,
+                                                   bucket=bucket,
+                                                   basepath=key,
+                                                   client=curr_client,
+                                                   logger=logger)
+                return stat, item_errors
+
+            for key, (stat, item_errors) in _s3_fan_out(func=object_stat,
+                                                        items=list(result),
+                                                        max_workers=workers,
+                                                        in_order=False):
+                op_errors.extend(item_errors)
+                if stat is not None:
+                    result[key].content_type, result[key].metadata = _s3_stat_details(stat=stat)
+                # has the object been removed since it was listed ?
+                elif not item_errors:
+                    # yes, it is not to be reported
+                    result.pop(key, None)
+
+    # acknowledge eventual local errors
+    errors.extend(op_errors)
+
+    return result
+
+
+def _file_retrieve(errors: list[str],
+                   engine: str,
+                   bucket: str,
+                   basepath: str,
+                   identifier: str,
+                   filepath: Path | str,
+                   parallel: bool,
+                   etag: str = None,
+                   modified_since: datetime = None,
+                   client: Any = None,
+                   logger: Logger = None) -> Any:
+    """
+    Retrieve a file from the S3 store, with the module for *engine*.
+
+    :param errors: incidental error messages
+    :param engine: the S3 engine to use
+    :param bucket: the bucket to use
+    :param basepath: the path specifying the location to retrieve the file from
+    :param identifier: the file identifier, tipically a file name
+    :param filepath: the path to save the retrieved file at
+    :param parallel: whether to fetch byte ranges of the file concurrently
+    :param etag: optional ETag of the copy at hand of the file, dispensing with its retrieval if still current
+    :param modified_since: optional moment the copy at hand of the file was obtained
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: information about the file retrieved, or 'S3_NOT_MODIFIED' if the copy at hand is still current
+    """
+    # initialize the return variable
+    result: Any = None
+
+    if engine == "aws":
+        from . import aws_pomes
+        result = aws_pomes.file_retrieve(errors=errors,
+                                         bucket=bucket,
+                                         basepath=basepath,
+                                         identifier=identifier,
+                                         filepath=filepath,
+                                         parallel=parallel,
+                                         etag=etag,
+                                         modified_since=modified_since,
+                                         client=client,
+                                         logger=logger)
+    elif engine == "minio":
+        from . import minio_pomes
+        result = minio_pomes.file_retrieve(errors=errors,
+                                           bucket=bucket,
+                                           basepath=basepath,
+                                           identifier=identifier,
+                                           filepath=filepath,
+                                           parallel=parallel,
+                                           etag=etag,
+                                           modified_since=modified_since,
+                                           client=client,
+                                           logger=logger)
+
+    return result
+
+
+def _object_retrieve(errors: list[str],
+                     engine: str,
+                     bucket: str,
+                     basepath: str,
+                     identifier: str,
+                     buffer: bytearray = None,
+                     etag: str = None,
+                     modified_since: datetime = None,
+                     info: dict[str, Any] = None,
+                     client: Any = None,
+                     logger: Logger = None) -> Any:
+    """
+    Retrieve an object from the S3 store, with the module for *engine*.
+
+    :param errors: incidental error messages
+    :param engine: the S3 engine to use
+    :param bucket: the bucket to use
+    :param basepath: the path specifying the location to retrieve the object from
+    :param identifier: the object identifier
+    :param buffer: optional preallocated buffer to read the serialized object into (used only if large enough)
+    :param etag: optional ETag of the copy at hand of the object, dispensing with its retrieval if still current
+    :param modified_since: optional moment the copy at hand of the object was obtained
+    :param info: optional dictionary to receive the *etag* and the serialized *size* of the object retrieved
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the object retrieved, or 'S3_NOT_MODIFIED' if the copy at hand is still current
+    """
+    # initialize the return variable
+    result: Any = None
+
+    if engine == "aws":
+        from . import aws_pomes
+        result = aws_pomes.object_retrieve(errors=errors,
+                                           bucket=bucket,
+                                           basepath=basepath,
+                                           identifier=identifier,
+                                           buffer=buffer,
+                                           etag=etag,
+                                           modified_since=modified_since,
+                                           info=info,
+                                           client=client,
+                                           logger=logger)
+    elif engine == "minio":
+        from . import minio_pomes
+        result = minio_pomes.object_retrieve(errors=errors,
+                                             bucket=bucket,
+                                             basepath=basepath,
+                                             identifier=identifier,
+                                             buffer=buffer,
+                                             etag=etag,
+                                             modified_since=modified_since,
+                                             info=info,
+                                             client=client,
+                                             logger=logger)
+
+    return result
+
+
+def _object_store_item(item: tuple[str, Any],
+                       basepath: str,
+                       tags: dict | None,
+                       codec: str | None,
+                       bucket: str | None,
+                       engine: str,
+                       client: Any,
+                       logger: Logger | None) -> tuple[bool, list[str]]:
+    """
+    Store the object in *item* at the S3 store, on behalf of *s3_object_store_many*.
+
+    :param item: the object to be stored, as a tuple *(identifier, object)*
+    :param basepath: the path specifying the location to store the object at
+    :param tags: optional metadata describing the object
+    :param codec: the codec to serialize the object with
+    :param bucket: the bucket to use
+    :param engine: the S3 engine to use
+    :param client: the S3 client to use
+    :param logger: optional logger
+    :return: the outcome of the operation, and its error messages
+    """
+    errors: list[str] = []
+    outcome: bool = s3_object_store(errors=errors,
+                                    basepath=basepath,
+                                    identifier=item[0],
+                                    obj=item[1],
+                                    tags=tags,
+                                    bucket=bucket,
+                                    engine=engine,
+                                    client=client,
+                                    logger=logger,
+                                    codec=codec)
+    return outcome, errors
+
+
+def _object_retrieve_item(identifier: str,
+                          basepath: str,
+                          bucket: str | None,
+                          engine: str,
+                          client: Any,
+                          logger: Logger | None) -> tuple[Any, list[str]]:
+    """
+    Retrieve the object *identifier* from the S3 store, on behalf of *s3_object_retrieve_many*.
+
+    :param identifier: the object identifier
+    :param basepath: the path specifying the location to retrieve the object from
+    :param bucket: the bucket to use
+    :param engine: the S3 engine to use
+    :param client: the S3 client to use
+    :param logger: optional logger
+    :return: the object retrieved, and the error messages of the operation
+    """
+    errors: list[str] = []
+    obj: Any = s3_object_retrieve(errors=errors,
+                                  basepath=basepath,
+                                  identifier=identifier,
+                                  bucket=bucket,
+                                  engine=engine,
+                                  client=client,
+                                  logger=logger)
+    return obj, errors
+
+
+def _partitions_discover(errors: list[str],
+                         prefix: str,
+                         depth: int,
+                         list_partition: Callable[..., Iterator[list]],
+                         bucket: str,
+                         engine: str,
+                         client: Any,
+                         logger: Logger) -> list[Callable[[], Iterable[list]]] | None:
+    """
+    Establish the partitions for listing the objects under *prefix* concurrently.
+
+    Each folder found in *prefix* is a partition, unless *depth* is greater than one, in which case
+    partitions are sought in the folder itself. The objects found alongside the folders are grouped
+    into partitions of their own, so that the partitions follow the lexicographical order of their entries.
+
+    :param errors: incidental error messages
+    :param prefix: the path specifying the location to look for partitions in
+    :param depth: the number of folder levels to look for partitions in
+    :param list_partition: the function producing the batches of entries under a folder
+    :param bucket: the bucket to use
+    :param engine: the S3 engine to use
+    :param client: the S3 client to use
+    :param logger: optional logger
+    :return: the functions producing the batches of entries in each partition, or 'None' if error
+    """
+    # initialize the return variable
+    result: list[Callable[[], Iterable[list]]] | None = None
+
+    entries: Iterator | None = s3_objects_list(errors=errors,
+                                               basepath=prefix,
+                                               recursive=False,
+                                               bucket=bucket,
+                                               engine=engine,
+                                               client=client,
+                                               logger=logger)
+    if entries is not None:
+        result = []
+        objects: list = []
+        # the engines differ on the order folders and objects are listed in
+        for entry in sorted(entries, key=lambda item: _s3_entry_name(entry=item)):
+            if not _s3_entry_is_folder(entry=entry):
+                objects.append(entry)
+                continue
+            # the objects listed so far make up a partition of their own
+            if objects:
+                result.append(partial(iter, [objects]))
+                objects = []
+            folder: str = _s3_entry_name(entry=entry)
+            if depth > 1:
+                partitions: list[Callable[[], Iterable[list]]] | None
+                partitions = _partitions_discover(errors=errors,
+                                                  prefix=folder,
+                                                  depth=depth - 1,
+                                                  list_partition=list_partition,
+                                                  bucket=bucket,
+                                                  engine=engine,
+                                                  client=client,
+                                                  logger=logger)
+                if partitions is None:
+                    result = None
+                    break
+                result.extend(partitions)
+            else:
+                result.append(partial(list_partition,
+                                      prefix=folder))
+        if objects and result is not None:
+            result.append(partial(iter, [objects]))
+
+    return result
+
+
+def _partition_list(errors: list[str],
+                    prefix: str,
+                    bucket: str,
+                    engine: str,
+                    client: Any,
+                    logger: Logger,
+                    start_after: str = None,
+                    end_at: str = None) -> Iterator[list]:
+    """
+    List the objects under *prefix*, recursively, in batches.
+
+    :param errors: incidental error messages
+    :param prefix: the path specifying the location to iterate from
+    :param bucket: the bucket to use
+    :param engine: the S3 engine to use
+    :param client: the S3 client to use
+    :param logger: optional logger
+    :param start_after: optional name of the entry to start listing after
+    :param end_at: optional name of the entry to stop listing at, inclusive
+    :return: an iterator into the batches of entries
+    """
+    entries: Iterator | None = s3_objects_list(errors=errors,
+                                               basepath=prefix,
+                                               recursive=True,
+                                               start_after=start_after,
+                                               bucket=bucket,
+                                               engine=engine,
+                                               client=client,
+                                               logger=logger)
+    if entries is not None:
+        if end_at:
+            entries = takewhile(lambda entry: _s3_entry_name(entry=entry) <= end_at, entries)
+        yield from _s3_batches(items=entries,
+                               size=_S3_LIST_BATCH)
+
+
+def _prefix_aggregate(errors: list[str],
+                      prefix: str,
+                      parallel: bool,
+                      max_workers: int | None,
+                      bucket: str | None,
+                      engine: str | None,
+                      client: Any,
+                      logger: Logger | None) -> tuple[int, int] | None:
+    """
+    Obtain the number and the total size in bytes of the objects whose names start with *prefix*.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param parallel: whether to list the folders in *prefix* concurrently
+    :param max_workers: maximum number of folders listed concurrently
+    :param bucket: the bucket to use
+    :param engine: the S3 engine to use
+    :param client: optional S3 client
+    :param logger: optional logger
+    :return: the number and the total size in bytes of the objects, or 'None' if error
+    """
+    # initialize the return variable
+    result: tuple[int, int] | None = None
+
+    # initialize the local errors list
+    op_errors: list[str] = []
+
+    # determine the S3 engine
+    curr_engine: str = _assert_engine(errors=op_errors,
+                                      engine=engine)
+    entries: Iterator | None = None
+    if curr_engine and parallel:
+        entries = s3_objects_list_parallel(errors=op_errors,
+                                           basepath=prefix,
+                                           max_workers=max_workers,
+                                           bucket=bucket,
+                                           engine=curr_engine,
+                                           client=client,
+                                           logger=logger)
+    elif curr_engine:
+        entries = s3_objects_list(errors=op_errors,
+                                  basepath=prefix,
+                                  recursive=True,
+                                  bucket=bucket,
+                                  engine=curr_engine,
+                                  client=client,
+                                  logger=logger)
+    if entries is not None:
+        try:
+            count: int = 0
+            size: int = 0
+            for entry in entries:
+                count += 1
+                size += _s3_entry_size(entry=entry)
+            # errors incurred while listing are reported as the listing proceeds
+            if not op_errors:
+                result = (count, size)
+        except Exception as e:
+            _s3_except_msg(errors=op_errors,
+                           exception=e,
+                           engine=curr_engine,
+                           logger=logger)
 
     # acknowledge eventual local errors
     errors.extend(op_errors)
 
     return result
+
+
+def _folder_resolve(folder: str,
+                    keys: list[str],
+                    max_pages: int | None,
+                    bucket: str,
+                    engine: str,
+                    client: Any,
+                    logger: Logger) -> tuple[dict[str, S3ObjectInfo], list[str]]:
+    """
+    Resolve the existence of the objects *keys* in *folder*, by listing the range of names they span.
+
+    Should the listing fail, or take more than *max_pages* pages, the objects beyond the names listed
+    are left unresolved.
+
+    :param folder: the folder holding the objects
+    :param keys: the full names of the objects, in lexicographical order
+    :param max_pages: the maximum number of pages to list, or 'None' for no limit
+    :param bucket: the bucket to use
+    :param engine: the S3 engine to use
+    :param client: the S3 client to use
+    :param logger: optional logger
+    :return: the information about the objects found, and the names of the objects left unresolved
+    """
+    # initialize the return variables
+    found: dict[str, S3ObjectInfo] = {}
+    unresolved: list[str] = keys
+
+    max_keys: int | None = max_pages * _S3_LIST_BATCH if max_pages else None
+    list_errors: list[str] = []
+    entries: Iterator | None = s3_objects_list(errors=list_errors,
+                                               basepath=f"{folder}/" if folder else "",
+                                               recursive=False,
+                                               # start listing just ahead of the first object
+                                               start_after=keys[0][:-1] or None,
+                                               max_keys=max_keys,
+                                               bucket=bucket,
+                                               engine=engine,
+                                               client=client,
+                                               logger=logger)
+    if entries is not None and not list_errors:
+        try:
+            wanted: set[str] = set(keys)
+            count: int = 0
+            name: str | None = None
+            for entry in entries:
+                count += 1
+                name = _s3_entry_name(entry=entry)
+                if name > keys[-1]:
+                    break
+                if name in wanted and not _s3_entry_is_folder(entry=entry):
+                    found[name] = _s3_object_info(entry=entry)
+            # was the listing cut short, before the range of names was fully listed ?
+            if max_keys and count == max_keys and name <= keys[-1]:
+                # yes, the objects beyond the last name listed remain unresolved
+                unresolved = [key for key in keys if key > name]
+            else:
+                unresolved = []
+        except Exception as e:
+            _s3_log(logger=logger,
+                    stmt=f"Listing {folder}, bucket {bucket}, failed: {e}")
+            found = {}
+
+    return found, unresolved
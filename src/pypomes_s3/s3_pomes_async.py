@@ -0,0 +1,908 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from logging import Logger
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from .s3_common import _S3_ACCESS_DATA, _s3_batches
+from .s3_records import S3ObjectInfo, S3ObjectStat
+from .s3_pomes import (
+    s3_access, s3_assert_access, s3_bloom_build, s3_file_retrieve, s3_file_store, s3_object_delete,
+    s3_object_exists, s3_object_retrieve, s3_object_retrieve_many, s3_object_stat, s3_object_store,
+    s3_object_store_many, s3_object_tags_retrieve, s3_objects_exist, s3_objects_list,
+    s3_objects_list_parallel, s3_objects_page, s3_objects_stat, s3_prefix_count, s3_prefix_exists,
+    s3_prefix_size, s3_startup
+)
+
+# the asynchronous operations are carried out by the synchronous ones, in a dedicated pool of worker threads,
+# sharing the long-lived clients (and their connection pools) with the synchronous API
+_S3_EXECUTOR: ThreadPoolExecutor | None = None
+_S3_EXECUTOR_SIZE: int = 0
+_S3_EXECUTOR_LOCK: Lock = Lock()
+
+# minimum number of worker threads in the pool
+_S3_ASYNC_WORKERS: int = 64
+
+# number of entries in a page of an object listing
+_S3_LIST_PAGE: int = 1000
+
+# number of outcomes of concurrent operations consumed per worker thread hop (each is yielded once available)
+_S3_OUTCOME_PAGE: int = 1
+
+
+async def s3_assert_access_async(errors: list[str] | None,
+                                 engine: str = None,
+                                 logger: Logger = None) -> bool:
+    """
+    Asynchronously determine whether the *engine*'s current configuration allows for accessing the S3 services.
+
+    The operation is carried out by *s3_assert_access*, in a worker thread.
+
+    :param errors: incidental errors
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param logger: optional logger
+    :return: True if the accessing succeeded, False otherwise
+    """
+    return await _s3_run(func=s3_assert_access,
+                         errors=errors,
+                         engine=engine,
+                         logger=logger)
+
+
+async def s3_access_async(errors: list[str] | None,
+                          engine: str = None,
+                          logger: Logger = None) -> Any:
+    """
+    Asynchronously obtain and return a client to *engine*, or *None* if the client cannot be obtained.
+
+    The operation is carried out by *s3_access*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param logger: optional logger
+    :return: the client to the S3 engine
+    """
+    return await _s3_run(func=s3_access,
+                         errors=errors,
+                         engine=engine,
+                         logger=logger)
+
+
+async def s3_startup_async(errors: list[str],
+                           bucket: str = None,
+                           engine: str = None,
+                           logger: Logger = None) -> bool:
+    """
+    Asynchronously prepare the S3 *client* for operations.
+
+    The operation is carried out by *s3_startup*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param logger: optional logger
+    :return: True if service is fully functional
+    """
+    return await _s3_run(func=s3_startup,
+                         errors=errors,
+                         bucket=bucket,
+                         engine=engine,
+                         logger=logger)
+
+
+async def s3_file_store_async(errors: list[str],
+                              basepath: str,
+                              identifier: str,
+                              filepath: Path | str,
+                              mimetype: str,
+                              tags: dict = None,
+                              bucket: str = None,
+                              engine: Any = None,
+                              client: Any = None,
+                              logger: Logger = None,
+                              part_size: int = None,
+                              parallel_parts: int = None) -> bool:
+    """
+    Asynchronously store a file at the S3 store.
+
+    The operation is carried out by *s3_file_store*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to store the file at
+    :param identifier: the file identifier, tipically a file name
+    :param filepath: the path specifying where the file is
+    :param mimetype: the file mimetype
+    :param tags: optional metadata describing the file
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :param part_size: optional size in bytes of each part (determined from the file size, if omitted)
+    :param parallel_parts: optional number of parts uploaded concurrently (determined from the file size, if omitted)
+    :return: True if the file was successfully stored, False otherwise
+    """
+    return await _s3_run(func=s3_file_store,
+                         errors=errors,
+                         basepath=basepath,
+                         identifier=identifier,
+                         filepath=filepath,
+                         mimetype=mimetype,
+                         tags=tags,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger,
+                         part_size=part_size,
+                         parallel_parts=parallel_parts)
+
+
+async def s3_file_retrieve_async(errors: list[str],
+                                 basepath: str,
+                                 identifier: str,
+                                 filepath: Path | str,
+                                 bucket: str = None,
+                                 engine: str = None,
+                                 client: Any = None,
+                                 logger: Logger = None,
+                                 parallel: bool = False,
+                                 cache: bool = True,
+                                 etag: str = None,
+                                 modified_since: datetime = None) -> Any:
+    """
+    Asynchronously retrieve a file from the S3 store.
+
+    The operation is carried out by *s3_file_retrieve*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to retrieve the file from
+    :param identifier: the file identifier, tipically a file name
+    :param filepath: the path to save the retrieved file at
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :param parallel: whether to fetch byte ranges of the file concurrently (defaults to False)
+    :param cache: whether to go through the local disk cache of file contents, if enabled (defaults to True)
+    :param etag: optional ETag of the copy at hand of the file
+    :param modified_since: optional moment the copy at hand of the file was obtained (if *etag* is not provided)
+    :return: information about the file retrieved, or *S3_NOT_MODIFIED* if the copy at hand is still current
+    """
+    return await _s3_run(func=s3_file_retrieve,
+                         errors=errors,
+                         basepath=basepath,
+                         identifier=identifier,
+                         filepath=filepath,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger,
+                         parallel=parallel,
+                         cache=cache,
+                         etag=etag,
+                         modified_since=modified_since)
+
+
+async def s3_object_exists_async(errors: list[str],
+                                 basepath: str,
+                                 identifier: str | None,
+                                 bucket: str = None,
+                                 engine: str = None,
+                                 client: Any = None,
+                                 logger: Logger = None) -> bool:
+    """
+    Asynchronously determine if a given object exists in the S3 store.
+
+    The operation is carried out by *s3_object_exists*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying where to locate the object
+    :param identifier: optional object identifier
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: True if the object was found, false otherwise
+    """
+    return await _s3_run(func=s3_object_exists,
+                         errors=errors,
+                         basepath=basepath,
+                         identifier=identifier,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_object_stat_async(errors: list[str],
+                               basepath: str,
+                               identifier: str,
+                               bucket: str = None,
+                               engine: str = None,
+                               client: Any = None,
+                               logger: Logger = None) -> Any:
+    """
+    Asynchronously retrieve and return the information about an object in the S3 store.
+
+    The operation is carried out by *s3_object_stat*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying where to locate the object
+    :param identifier: the object identifier
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: metadata and information about the object
+    """
+    return await _s3_run(func=s3_object_stat,
+                         errors=errors,
+                         basepath=basepath,
+                         identifier=identifier,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_object_store_async(errors: list[str],
+                                basepath: str,
+                                identifier: str,
+                                obj: Any,
+                                tags: dict = None,
+                                bucket: str = None,
+                                engine: str = None,
+                                client: Any = None,
+                                logger: Logger = None,
+                                codec: str = None) -> bool:
+    """
+    Asynchronously store an object at the S3 store.
+
+    The operation is carried out by *s3_object_store*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to store the object at
+    :param identifier: the object identifier
+    :param obj: object to be stored
+    :param tags: optional metadata describing the object
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :param codec: the codec to serialize the object with (defaults to the one configured, or to 'pickle')
+    :return: True if the object was successfully stored, False otherwise
+    """
+    return await _s3_run(func=s3_object_store,
+                         errors=errors,
+                         basepath=basepath,
+                         identifier=identifier,
+                         obj=obj,
+                         tags=tags,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger,
+                         codec=codec)
+
+
+async def s3_object_retrieve_async(errors: list[str],
+                                   basepath: str,
+                                   identifier: str,
+                                   bucket: str = None,
+                                   engine: str = None,
+                                   client: Any = None,
+                                   logger: Logger = None,
+                                   buffer: bytearray = None,
+                                   cache: bool = True,
+                                   etag: str = None,
+                                   modified_since: datetime = None,
+                                   coalesce: bool = False) -> Any:
+    """
+    Asynchronously retrieve an object from the S3 store.
+
+    The operation is carried out by *s3_object_retrieve*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to retrieve the object from
+    :param identifier: the object identifier
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :param buffer: optional preallocated buffer to read the serialized object into (used only if large enough)
+    :param cache: whether to go through the in-process cache of objects, if enabled (defaults to True)
+    :param etag: optional ETag of the copy at hand of the object
+    :param modified_since: optional moment the copy at hand of the object was obtained
+    :param coalesce: whether to share the request with concurrent calls for the same object (defaults to False)
+    :return: the object retrieved, or *S3_NOT_MODIFIED* if the copy at hand is still current
+    """
+    return await _s3_run(func=s3_object_retrieve,
+                         errors=errors,
+                         basepath=basepath,
+                         identifier=identifier,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger,
+                         buffer=buffer,
+                         cache=cache,
+                         etag=etag,
+                         modified_since=modified_since,
+                         coalesce=coalesce)
+
+
+async def s3_object_delete_async(errors: list[str],
+                                 basepath: str,
+                                 identifier: str = None,
+                                 bucket: str = None,
+                                 engine: str = None,
+                                 client: Any = None,
+                                 logger: Logger = None,
+                                 failures: dict[str, str] = None) -> bool:
+    """
+    Asynchronously remove an object from the S3 store.
+
+    The operation is carried out by *s3_object_delete*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to retrieve the object from
+    :param identifier: optional object identifier
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :param failures: optional *dict* to receive the names of the objects not removed, and the reasons
+    :return: True if the object was successfully deleted, False otherwise
+    """
+    return await _s3_run(func=s3_object_delete,
+                         errors=errors,
+                         basepath=basepath,
+                         identifier=identifier,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger,
+                         failures=failures)
+
+
+async def s3_object_tags_retrieve_async(errors: list[str],
+                                        basepath: str,
+                                        identifier: str,
+                                        bucket: str = None,
+                                        engine: str = None,
+                                        client: Any = None,
+                                        logger: Logger = None) -> dict:
+    """
+    Asynchronously retrieve and return the metadata information for an object in the S3 store.
+
+    The operation is carried out by *s3_object_tags_retrieve*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to retrieve the object from
+    :param identifier: the object identifier
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the metadata about the object
+    """
+    return await _s3_run(func=s3_object_tags_retrieve,
+                         errors=errors,
+                         basepath=basepath,
+                         identifier=identifier,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_bloom_build_async(errors: list[str],
+                               basepath: str,
+                               capacity: int = None,
+                               error_rate: float = 0.01,
+                               bucket: str = None,
+                               engine: str = None,
+                               client: Any = None,
+                               logger: Logger = None) -> bool:
+    """
+    Asynchronously build a Bloom filter over the paths of the objects located under *basepath*, in the S3 store.
+
+    The operation is carried out by *s3_bloom_build*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location of the objects
+    :param capacity: the expected number of objects (defaults to one million)
+    :param error_rate: the acceptable rate of false positives (defaults to 1%)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: True if the filter was built, False otherwise
+    """
+    return await _s3_run(func=s3_bloom_build,
+                         errors=errors,
+                         basepath=basepath,
+                         capacity=capacity,
+                         error_rate=error_rate,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_objects_page_async(errors: list[str],
+                                basepath: str,
+                                recursive: bool = False,
+                                page_size: int = 1000,
+                                continuation: str = None,
+                                compact: bool = False,
+                                bucket: str = None,
+                                engine: str = None,
+                                client: Any = None,
+                                logger: Logger = None) -> tuple[list, str | None]:
+    """
+    Asynchronously retrieve a page of the list of objects at *basepath*, in the S3 store.
+
+    The operation is carried out by *s3_objects_page*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to iterate from
+    :param recursive: whether the location is iterated recursively
+    :param page_size: the maximum number of entries in the page (defaults to 1000)
+    :param continuation: optional continuation token returned with the previous page
+    :param compact: whether to list *S3ObjectInfo* records, instead of the engine's entries (defaults to False)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the entries in the page, and the continuation token for the next page
+    """
+    return await _s3_run(func=s3_objects_page,
+                         errors=errors,
+                         basepath=basepath,
+                         recursive=recursive,
+                         page_size=page_size,
+                         continuation=continuation,
+                         compact=compact,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_prefix_exists_async(errors: list[str],
+                                 prefix: str,
+                                 bucket: str = None,
+                                 engine: str = None,
+                                 client: Any = None,
+                                 logger: Logger = None) -> bool:
+    """
+    Asynchronously determine whether there are objects whose names start with *prefix*, in the S3 store.
+
+    The operation is carried out by *s3_prefix_exists*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: 'True' if at least one object was found, 'False' otherwise
+    """
+    return await _s3_run(func=s3_prefix_exists,
+                         errors=errors,
+                         prefix=prefix,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_prefix_count_async(errors: list[str],
+                                prefix: str,
+                                parallel: bool = False,
+                                max_workers: int = None,
+                                bucket: str = None,
+                                engine: str = None,
+                                client: Any = None,
+                                logger: Logger = None) -> int | None:
+    """
+    Asynchronously obtain the number of the objects whose names start with *prefix*, in the S3 store.
+
+    The operation is carried out by *s3_prefix_count*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param parallel: whether to list the folders in *prefix* concurrently (defaults to False)
+    :param max_workers: maximum number of folders listed concurrently (defaults to the configured concurrency)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the number of objects, or 'None' if error
+    """
+    return await _s3_run(func=s3_prefix_count,
+                         errors=errors,
+                         prefix=prefix,
+                         parallel=parallel,
+                         max_workers=max_workers,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_prefix_size_async(errors: list[str],
+                               prefix: str,
+                               parallel: bool = False,
+                               max_workers: int = None,
+                               bucket: str = None,
+                               engine: str = None,
+                               client: Any = None,
+                               logger: Logger = None) -> int | None:
+    """
+    Asynchronously obtain the total size in bytes of the objects whose names start with *prefix*, in the S3 store.
+
+    The operation is carried out by *s3_prefix_size*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param parallel: whether to list the folders in *prefix* concurrently (defaults to False)
+    :param max_workers: maximum number of folders listed concurrently (defaults to the configured concurrency)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the total size in bytes of the objects, or 'None' if error
+    """
+    return await _s3_run(func=s3_prefix_size,
+                         errors=errors,
+                         prefix=prefix,
+                         parallel=parallel,
+                         max_workers=max_workers,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_objects_exist_async(errors: list[str],
+                                 basepath: str,
+                                 identifiers: Iterable[str],
+                                 strategy: str = "auto",
+                                 max_workers: int = None,
+                                 bucket: str = None,
+                                 engine: str = None,
+                                 client: Any = None,
+                                 logger: Logger = None) -> dict[str, S3ObjectInfo | None] | None:
+    """
+    Asynchronously determine which of the given objects exist in the S3 store, and obtain their size and ETag.
+
+    The operation is carried out by *s3_objects_exist*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying where to locate the objects
+    :param identifiers: the object identifiers
+    :param strategy: how to resolve the objects ('auto', 'list', or 'head', defaults to 'auto')
+    :param max_workers: maximum number of requests issued concurrently (defaults to the configured concurrency)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the information about each object found, or 'None' for those not found, or 'None' if error
+    """
+    return await _s3_run(func=s3_objects_exist,
+                         errors=errors,
+                         basepath=basepath,
+                         identifiers=identifiers,
+                         strategy=strategy,
+                         max_workers=max_workers,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_objects_stat_async(errors: list[str],
+                                prefix: str,
+                                head: bool = False,
+                                parallel: bool = False,
+                                max_workers: int = None,
+                                bucket: str = None,
+                                engine: str = None,
+                                client: Any = None,
+                                logger: Logger = None) -> dict[str, S3ObjectStat] | None:
+    """
+    Asynchronously obtain the information about the objects whose names start with *prefix*, in the S3 store.
+
+    The operation is carried out by *s3_objects_stat*, in a worker thread.
+
+    :param errors: incidental error messages
+    :param prefix: the prefix of the names of the objects
+    :param head: whether to inquire on the objects for their content type and user metadata (defaults to False)
+    :param parallel: whether to list the folders in *prefix* concurrently (defaults to False)
+    :param max_workers: maximum number of requests issued concurrently (defaults to the configured concurrency)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: the information about the objects, keyed by their full names, or 'None' if error
+    """
+    return await _s3_run(func=s3_objects_stat,
+                         errors=errors,
+                         prefix=prefix,
+                         head=head,
+                         parallel=parallel,
+                         max_workers=max_workers,
+                         bucket=bucket,
+                         engine=engine,
+                         client=client,
+                         logger=logger)
+
+
+async def s3_objects_list_async(errors: list[str],
+                                basepath: str,
+                                recursive: bool = False,
+                                bucket: str = None,
+                                engine: str = None,
+                                client: Any = None,
+                                logger: Logger = None,
+                                start_after: str = None,
+                                max_keys: int = None,
+                                compact: bool = False,
+                                prefetch: int = 0) -> AsyncIterator:
+    """
+    Asynchronously retrieve and return an iterator into the list of objects at *basepath*, in the S3 store.
+
+    The listing is obtained with *s3_objects_list* in a worker thread, and is consumed in pages,
+    one worker thread hop per page, so that the event loop is never blocked by the network.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to iterate from
+    :param recursive: whether the location is iterated recursively
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :param start_after: optional name of the entry to start listing after
+    :param max_keys: optional maximum number of entries to list
+    :param compact: whether to list *S3ObjectInfo* records, instead of the engine's entries (defaults to False)
+    :param prefetch: the number of pages of entries to obtain ahead of the iteration (defaults to 0, no read-ahead)
+    :return: an asynchronous iterator into the list of objects (empty, if the listing failed)
+    """
+    objs: Iterator = await _s3_run(func=s3_objects_list,
+                                   errors=errors,
+                                   basepath=basepath,
+                                   recursive=recursive,
+                                   bucket=bucket,
+                                   engine=engine,
+                                   client=client,
+                                   logger=logger,
+                                   start_after=start_after,
+                                   max_keys=max_keys,
+                                   compact=compact,
+                                   prefetch=prefetch)
+    # was the listing obtained ?
+    if objs is not None:
+        # yes, consume it in pages
+        pages: Iterator[list] = _s3_batches(items=objs,
+                                            size=_S3_LIST_PAGE)
+        page: list = await _s3_run(func=_next_page,
+                                   pages=pages)
+        while page:
+            for obj in page:
+                yield obj
+            page = await _s3_run(func=_next_page,
+                                 pages=pages)
+
+
+async def s3_objects_list_parallel_async(errors: list[str],
+                                         basepath: str,
+                                         depth: int = 1,
+                                         boundaries: list[str] = None,
+                                         in_order: bool = False,
+                                         max_workers: int = None,
+                                         compact: bool = False,
+                                         bucket: str = None,
+                                         engine: str = None,
+                                         client: Any = None,
+                                         logger: Logger = None) -> AsyncIterator:
+    """
+    Asynchronously retrieve and return an iterator into the objects under *basepath*, listed in concurrent partitions.
+
+    The listing is obtained with *s3_objects_list_parallel* in a worker thread, and is consumed in pages,
+    one worker thread hop per page, so that the event loop is never blocked by the network.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to iterate from
+    :param depth: the number of folder levels to look for partitions in, if *boundaries* is not provided
+    :param boundaries: optional names delimiting the ranges of keys to partition the listing into
+    :param in_order: whether to yield the entries in lexicographical order (defaults to False)
+    :param max_workers: maximum number of partitions listed concurrently (defaults to the configured concurrency)
+    :param compact: whether to list *S3ObjectInfo* records, instead of the engine's entries (defaults to False)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: an asynchronous iterator into the list of objects (empty, if the listing failed)
+    """
+    objs: Iterator = await _s3_run(func=s3_objects_list_parallel,
+                                   errors=errors,
+                                   basepath=basepath,
+                                   depth=depth,
+                                   boundaries=boundaries,
+                                   in_order=in_order,
+                                   max_workers=max_workers,
+                                   compact=compact,
+                                   bucket=bucket,
+                                   engine=engine,
+                                   client=client,
+                                   logger=logger)
+    # was the listing obtained ?
+    if objs is not None:
+        # yes, consume it in pages
+        pages: Iterator[list] = _s3_batches(items=objs,
+                                            size=_S3_LIST_PAGE)
+        page: list = await _s3_run(func=_next_page,
+                                   pages=pages)
+        while page:
+            for obj in page:
+                yield obj
+            page = await _s3_run(func=_next_page,
+                                 pages=pages)
+
+
+async def s3_object_store_many_async(errors: list[str],
+                                     basepath: str,
+                                     items: dict[str, Any] | Iterable[tuple[str, Any]],
+                                     tags: dict = None,
+                                     codec: str = None,
+                                     max_workers: int = None,
+                                     in_order: bool = True,
+                                     bucket: str = None,
+                                     engine: str = None,
+                                     client: Any = None,
+                                     logger: Logger = None) -> AsyncIterator[tuple[str, bool, list[str]]]:
+    """
+    Asynchronously store objects at the S3 store, concurrently.
+
+    The operations are started by *s3_object_store_many* in a worker thread, and their outcomes are consumed
+    one worker thread hop each, so that the event loop is never blocked by the network.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to store the objects at
+    :param items: the objects to be stored, keyed by their identifiers
+    :param tags: optional metadata describing the objects
+    :param codec: the codec to serialize the objects with (defaults to the one configured, or to 'pickle')
+    :param max_workers: maximum number of objects stored concurrently (defaults to the configured concurrency)
+    :param in_order: whether to yield the outcomes in the order of *items* (defaults to True)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: an asynchronous iterator into the outcomes (empty, if the S3 client could not be obtained)
+    """
+    objs: Iterator = await _s3_run(func=s3_object_store_many,
+                                   errors=errors,
+                                   basepath=basepath,
+                                   items=items,
+                                   tags=tags,
+                                   codec=codec,
+                                   max_workers=max_workers,
+                                   in_order=in_order,
+                                   bucket=bucket,
+                                   engine=engine,
+                                   client=client,
+                                   logger=logger)
+    # were the operations started ?
+    if objs is not None:
+        # yes, consume their outcomes
+        pages: Iterator[list] = _s3_batches(items=objs,
+                                            size=_S3_OUTCOME_PAGE)
+        page: list = await _s3_run(func=_next_page,
+                                   pages=pages)
+        while page:
+            for obj in page:
+                yield obj
+            page = await _s3_run(func=_next_page,
+                                 pages=pages)
+
+
+async def s3_object_retrieve_many_async(errors: list[str],
+                                        basepath: str,
+                                        identifiers: Iterable[str],
+                                        max_workers: int = None,
+                                        in_order: bool = True,
+                                        bucket: str = None,
+                                        engine: str = None,
+                                        client: Any = None,
+                                        logger: Logger = None) -> AsyncIterator[tuple[str, Any, list[str]]]:
+    """
+    Asynchronously retrieve objects from the S3 store, concurrently.
+
+    The operations are started by *s3_object_retrieve_many* in a worker thread, and their outcomes are consumed
+    one worker thread hop each, so that the event loop is never blocked by the network.
+
+    :param errors: incidental error messages
+    :param basepath: the path specifying the location to retrieve the objects from
+    :param identifiers: the object identifiers
+    :param max_workers: maximum number of objects retrieved concurrently (defaults to the configured concurrency)
+    :param in_order: whether to yield the objects in the order of *identifiers* (defaults to True)
+    :param bucket: the bucket to use (uses the default bucket, if not provided)
+    :param engine: the S3 engine to use (uses the default engine, if not provided)
+    :param client: optional S3 client (uses the shared one, if not provided)
+    :param logger: optional logger
+    :return: an asynchronous iterator into the objects retrieved (empty, if the S3 client could not be obtained)
+    """
+    objs: Iterator = await _s3_run(func=s3_object_retrieve_many,
+                                   errors=errors,
+                                   basepath=basepath,
+                                   identifiers=identifiers,
+                                   max_workers=max_workers,
+                                   in_order=in_order,
+                                   bucket=bucket,
+                                   engine=engine,
+                                   client=client,
+                                   logger=logger)
+    # were the operations started ?
+    if objs is not None:
+        # yes, consume their outcomes
+        pages: Iterator[list] = _s3_batches(items=objs,
+                                            size=_S3_OUTCOME_PAGE)
+        page: list = await _s3_run(func=_next_page,
+                                   pages=pages)
+        while page:
+            for obj in page:
+                yield obj
+            page = await _s3_run(func=_next_page,
+                                 pages=pages)
+
+
+async def _s3_run(func: Callable,
+                  **kwargs: Any) -> Any:
+    """
+    Run *func* with *kwargs* in a worker thread, without blocking the running event loop.
+
+    :param func: the function to run
+    :param kwargs: the arguments to run the function with
+    :return: the value returned by the function
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_s3_executor(), partial(func, **kwargs))
+
+
+def _s3_executor() -> ThreadPoolExecutor:
+    """
+    Obtain the pool of worker threads for the asynchronous operations, creating it on first use.
+
+    The pool is sized to match the largest connection pool configured for the S3 engines,
+    with a minimum of *_S3_ASYNC_WORKERS* threads. Should the engines be reconfigured with *s3_setup*
+    calling for a different size, the pool is replaced. The previous pool is not shut down, so that
+    the operations about to be submitted to it are still accepted, and its threads end once it has drained
+    and is no longer referenced.
+
+    :return: the pool of worker threads
+    """
+    global _S3_EXECUTOR, _S3_EXECUTOR_SIZE  # noqa: PLW0603
+
+    pool_sizes: list[int] = [data.get("pool-size") or 0 for data in _S3_ACCESS_DATA.values()]
+    max_workers: int = max([_S3_ASYNC_WORKERS, *pool_sizes])
+    with _S3_EXECUTOR_LOCK:
+        if _S3_EXECUTOR is None or _S3_EXECUTOR_SIZE != max_workers:
+            _S3_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers,
+                                              thread_name_prefix="pypomes_s3")
+            _S3_EXECUTOR_SIZE = max_workers
+    return _S3_EXECUTOR
+
+
+def _next_page(pages: Iterator[list]) -> list | None:
+    """
+    Obtain the next page from *pages*.
+
+    :param pages: the iterator into the pages
+    :return: the next page, or 'None' if there are no more pages
+    """
+    return next(pages, None)
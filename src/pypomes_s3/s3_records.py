@@ -0,0 +1,258 @@
+from array import array
+from collections.abc import Iterable
+from datetime import datetime
+from importlib.util import find_spec
+from typing import Any
+
+from .s3_common import _s3_entry_name, _s3_entry_is_folder
+from .s3_codecs import _S3_CODEC_META
+from .s3_compression import _S3_COMPRESSION_META
+
+# the supported columnar formats, and the packages they require
+_S3_COLUMNAR_FORMATS: dict[str, str | None] = {
+    "array": None,
+    "numpy": "numpy",
+    "arrow": "pyarrow"
+}
+
+
+class S3ObjectInfo:
+    """
+    Compact, engine-neutral information about an object, as obtained by listing objects.
+
+    For folders, listed when not listing recursively, *key* ends with a slash, *size* is 0,
+    and the remaining attributes are 'None'.
+    """
+    __slots__ = ("key", "size", "etag", "last_modified", "storage_class")
+
+    def __init__(self,
+                 key: str,
+                 size: int,
+                 etag: str | None,
+                 last_modified: int | None,
+                 storage_class: str | None) -> None:
+        """
+        Initialize the information about the object.
+
+        :param key: the object's full name
+        :param size: the object's size in bytes
+        :param etag: the object's ETag, without the enclosing quotes
+        :param last_modified: the object's moment of last modification, in seconds since the epoch
+        :param storage_class: the object's storage class
+        """
+        self.key: str = key
+        self.size: int = size
+        self.etag: str | None = etag
+        self.last_modified: int | None = last_modified
+        self.storage_class: str | None = storage_class
+
+    def __repr__(self) -> str:
+        return (f"S3ObjectInfo(key={self.key!r}, size={self.size}, etag={self.etag!r}, "
+                f"last_modified={self.last_modified}, storage_class={self.storage_class!r})")
+
+
+class S3ObjectStat(S3ObjectInfo):
+    """
+    Normalized information about an object, regardless of the S3 engine it came from.
+
+    The attributes shared with *S3ObjectInfo* are available from listings, whereas *content_type*
+    and *metadata* (the user metadata) are only available by inquiring on the object, and are 'None' otherwise.
+    """
+    __slots__ = ("content_type", "metadata")
+
+    def __init__(self,
+                 key: str,
+                 size: int,
+                 etag: str | None,
+                 last_modified: int | None,
+                 storage_class: str | None,
+                 content_type: str = None,
+                 metadata: dict[str, str] = None) -> None:
+        """
+        Initialize the information about the object.
+
+        :param key: the object's full name
+        :param size: the object's size in bytes
+        :param etag: the object's ETag, without the enclosing quotes
+        :param last_modified: the object's moment of last modification, in seconds since the epoch
+        :param storage_class: the object's storage class
+        :param content_type: the object's content type
+        :param metadata: the object's user metadata
+        """
+        super().__init__(key=key,
+                         size=size,
+                         etag=etag,
+                         last_modified=last_modified,
+                         storage_class=storage_class)
+        self.content_type: str | None = content_type
+        self.metadata: dict[str, str] | None = metadata
+
+    def __repr__(self) -> str:
+        return (f"S3ObjectStat(key={self.key!r}, size={self.size}, etag={self.etag!r}, "
+                f"last_modified={self.last_modified}, storage_class={self.storage_class!r}, "
+                f"content_type={self.content_type!r}, metadata={self.metadata!r})")
+
+
+def s3_objects_columns(errors: list[str],
+                       entries: Iterable,
+                       fmt: str = "array") -> Any:
+    """
+    Collect the objects in a listing into columns, for analysis at a fraction of the memory used by the entries.
+
+    The columns are *key*, *size*, *etag*, *last_modified* (in seconds since the epoch), and *storage_class*.
+    The listing entries may be those of either S3 engine, or *S3ObjectInfo* records, and folder entries are skipped.
+    The numeric columns are collected into arrays as the listing is iterated on, and the storage classes,
+    repeated throughout the listing, are shared. Depending on *fmt*, the columns are returned as:
+      - *array*: a dictionary of *array.array* (numeric columns) and lists (string columns)
+      - *numpy*: a dictionary of *numpy* arrays (requires the package *numpy*)
+      - *arrow*: a *pyarrow* table (requires the package *pyarrow*)
+
+    :param errors: incidental error messages
+    :param entries: the listing entries
+    :param fmt: the columnar format to return ('array', 'numpy', or 'arrow', defaults to 'array')
+    :return: the columns collected, or 'None' if the format is unknown or unavailable
+    """
+    # initialize the return variable
+    result: Any = None
+
+    if fmt not in _S3_COLUMNAR_FORMATS:
+        errors.append(f"Columnar format '{fmt}' unknown")
+    elif _S3_COLUMNAR_FORMATS[fmt] and not find_spec(_S3_COLUMNAR_FORMATS[fmt]):
+        errors.append(f"Columnar format '{fmt}' requires the package '{_S3_COLUMNAR_FORMATS[fmt]}'")
+    else:
+        keys: list[str] = []
+        sizes: array = array("q")
+        etags: list[str | None] = []
+        last_modified: array = array("q")
+        storage_classes: list[str | None] = []
+        shared: dict[str | None, str | None] = {}
+        for entry in entries:
+            info: S3ObjectInfo = entry if isinstance(entry, S3ObjectInfo) else _s3_object_info(entry=entry)
+            # folders carry no ETag, and are skipped
+            if info.etag is not None:
+                keys.append(info.key)
+                sizes.append(info.size)
+                etags.append(info.etag)
+                last_modified.append(info.last_modified or 0)
+                storage_classes.append(shared.setdefault(info.storage_class, info.storage_class))
+
+        if fmt == "array":
+            result = {
+                "key": keys,
+                "size": sizes,
+                "etag": etags,
+                "last_modified": last_modified,
+                "storage_class": storage_classes
+            }
+        elif fmt == "numpy":
+            import numpy
+            result = {
+                "key": numpy.array(keys, dtype=object),
+                "size": numpy.frombuffer(sizes, dtype=numpy.int64),
+                "etag": numpy.array(etags, dtype=object),
+                "last_modified": numpy.frombuffer(last_modified, dtype=numpy.int64),
+                "storage_class": numpy.array(storage_classes, dtype=object)
+            }
+        else:
+            import pyarrow
+            result = pyarrow.table({
+                "key": pyarrow.array(keys, type=pyarrow.string()),
+                "size": pyarrow.Array.from_buffers(pyarrow.int64(), len(sizes), [None, pyarrow.py_buffer(sizes)]),
+                "etag": pyarrow.array(etags, type=pyarrow.string()),
+                "last_modified": pyarrow.Array.from_buffers(pyarrow.int64(), len(last_modified),
+                                                            [None, pyarrow.py_buffer(last_modified)]),
+                "storage_class": pyarrow.array(storage_classes, type=pyarrow.string()).dictionary_encode()
+            })
+
+    return result
+
+
+def _s3_object_info(entry: Any) -> S3ObjectInfo:
+    """
+    Obtain the compact information about an object from an entry yielded by listing objects.
+
+    :param entry: the listing entry (a *MinIO* object, or an *AWS* dictionary)
+    :return: the information about the object, or about the folder, the entry refers to
+    """
+    # initialize the return variable
+    result: S3ObjectInfo
+
+    if _s3_entry_is_folder(entry=entry):
+        result = S3ObjectInfo(key=_s3_entry_name(entry=entry),
+                              size=0,
+                              etag=None,
+                              last_modified=None,
+                              storage_class=None)
+    elif isinstance(entry, dict):
+        modified: datetime | None = entry.get("LastModified")
+        result = S3ObjectInfo(key=entry["Key"],
+                              size=entry.get("Size") or 0,
+                              etag=(entry.get("ETag") or "").strip('"'),
+                              last_modified=int(modified.timestamp()) if modified else None,
+                              storage_class=entry.get("StorageClass"))
+    else:
+        modified: datetime | None = entry.last_modified
+        result = S3ObjectInfo(key=entry.object_name,
+                              size=entry.size or 0,
+                              etag=(entry.etag or "").strip('"'),
+                              last_modified=int(modified.timestamp()) if modified else None,
+                              storage_class=entry.storage_class)
+
+    return result
+
+
+def _s3_stat_info(key: str,
+                  stat: Any) -> S3ObjectInfo:
+    """
+    Obtain the compact information about an object from the information obtained by inquiring on it.
+
+    :param key: the object's full name
+    :param stat: the information about the object (a *MinIO* object, or an *AWS* dictionary)
+    :return: the information about the object
+    """
+    # initialize the return variable
+    result: S3ObjectInfo
+
+    if isinstance(stat, dict):
+        modified: datetime | None = stat.get("LastModified")
+        result = S3ObjectInfo(key=key,
+                              size=stat.get("ContentLength") or 0,
+                              etag=(stat.get("ETag") or "").strip('"'),
+                              last_modified=int(modified.timestamp()) if modified else None,
+                              # the storage class is omitted for standard storage
+                              storage_class=stat.get("StorageClass") or "STANDARD")
+    else:
+        modified: datetime | None = stat.last_modified
+        result = S3ObjectInfo(key=key,
+                              size=stat.size or 0,
+                              etag=(stat.etag or "").strip('"'),
+                              last_modified=int(modified.timestamp()) if modified else None,
+                              storage_class=(stat.metadata or {}).get("x-amz-storage-class") or "STANDARD")
+
+    return result
+
+
+def _s3_stat_details(stat: Any) -> tuple[str | None, dict[str, str]]:
+    """
+    Obtain the content type and the user metadata from the information obtained by inquiring on an object.
+
+    The metadata entries recording the codec and the compression the object was stored with are omitted.
+
+    :param stat: the information about the object (a *MinIO* object, or an *AWS* dictionary)
+    :return: the object's content type, and its user metadata
+    """
+    # initialize the return variables
+    content_type: str | None
+    metadata: dict[str, str]
+
+    if isinstance(stat, dict):
+        content_type = stat.get("ContentType")
+        metadata = dict(stat.get("Metadata") or {})
+    else:
+        content_type = stat.content_type
+        metadata = {key.lower()[len("x-amz-meta-"):]: value for key, value in (stat.metadata or {}).items()
+                    if key.lower().startswith("x-amz-meta-")}
+    for key in (_S3_CODEC_META, _S3_COMPRESSION_META):
+        metadata.pop(key, None)
+
+    return content_type, metadata